@@ -110,12 +110,13 @@ def download_files(client, project_name):
     log.info(
         f"=== Example 1: Downloading output files of {num} jobs using ProjectApi.download_file()"
     )
-    for job in jobs[0:num]:
-        log.info(f"Job {job.id}")
-        for task in project_api.get_tasks(job_id=job.id):
+    # Tasks and files of all jobs are loaded in bulk instead of one query per job and task
+    for job_node in project_api.get_job_graph(jobs[0:num]):
+        log.info(f"Job {job_node.job.id}")
+        for task_node in job_node.tasks:
+            task = task_node.task
             log.info(f"Task {task.id}")
-            files = project_api.get_files(id=task.output_file_ids)
-            for f in files:
+            for f in task_node.output_files:
                 fpath = os.path.join(out_path, f"task_{task.id}")
                 log.info(f"Download output file {f.evaluation_path} to {fpath}")
                 project_api.download_file(file=f, target_path=fpath)
@@ -131,6 +132,15 @@ def download_files(client, project_name):
             with open(fpath, "wb") as bf:
                 bf.write(f.content)
 
+    log.info("=== Example 3: Harvesting jpeg images and output files of all evaluated jobs")
+    results = project_api.harvest_outputs(
+        {"eval_status": "evaluated"},
+        ["*.jpg", "file.out"],
+        os.path.join(out_path, "harvest"),
+        progress_handler=lambda size: log.debug(f"Downloaded {size} bytes"),
+    )
+    log.info(f"Harvested {sum(r.success for r in results)} of {len(results)} files")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
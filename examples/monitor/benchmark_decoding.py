@@ -0,0 +1,148 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Annotated example: measure the decoding throughput of monitor messages.
+
+Every payload received from the monitor WebSocket endpoint is decoded into
+messages before being yielded by the ``MonitorApi`` streams.  By default each
+message is wrapped into a ``MonitorMessage``.  ``MonitorApi(raw=True)`` yields
+plain dictionaries instead, and ``MonitorApi(fields=[...])`` yields tuples of
+selected fields.  Both decode with ``orjson`` when it is installed
+(``pip install ansys-hps-client[speedups]``).
+
+This benchmark runs offline: it decodes synthetic process-tree frames, or the
+frames of a recording made with ``StreamRecorder``, in each mode and reports
+the throughput in messages per second.
+
+Usage:
+
+    python examples/monitor/benchmark_decoding.py --frames 20000 --batch 10
+
+    python examples/monitor/benchmark_decoding.py --recording recordings/scaling
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from ansys.hps.client.monitor import MonitorApi, StreamReplayer
+from ansys.hps.client.monitor.api import monitor_api
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the decoding of monitor messages.")
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=20000,
+        help="Number of synthetic frames to decode (default: 20000).",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=10,
+        help="Number of messages per synthetic frame (default: 10).",
+    )
+    parser.add_argument(
+        "--recording",
+        default=None,
+        metavar="DIR",
+        help="Decode the frames of a StreamRecorder recording instead of synthetic ones.",
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        default=["tags.task_id", "tags.timestamp", "message"],
+        help="Fields selected in the 'fields' mode (default: tags.task_id tags.timestamp message).",
+    )
+    return parser
+
+
+def _synthetic_frames(count: int, batch: int) -> list[str]:
+    """Build frames of process-tree metric messages, as pushed by the monitor."""
+    frames = []
+    for i in range(count):
+        messages = []
+        for j in range(batch):
+            tree = {
+                "pid": 1000 + j,
+                "cpu_percentage": "12.5",
+                "memory_percentage": "3.1",
+                "children": [{"pid": 2000 + j, "cpu_percentage": "80.0", "children": []}],
+            }
+            messages.append(
+                {
+                    "tags": {
+                        "client_type": "ansys.rep.evaluator",
+                        "type": "metric",
+                        "statistic": "process_tree",
+                        "task_id": f"task-{j}",
+                        "evaluator_name": "evaluator-1",
+                        "timestamp": 1.7e9 + i,
+                    },
+                    "message": json.dumps(tree),
+                }
+            )
+        frames.append(json.dumps({"messages": messages}))
+    return frames
+
+
+def _throughput(api: MonitorApi, frames: list[str]) -> tuple[int, float]:
+    """Decode every frame with *api* and return the message count and rate."""
+    start = time.perf_counter()
+    count = 0
+    for frame in frames:
+        count += len(api.decode_frame(frame))
+    elapsed = time.perf_counter() - start
+    return count, count / elapsed if elapsed > 0 else float("inf")
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+
+    # 1) Load the frames to decode, read up front so that only decoding is timed.
+    if args.recording:
+        frames = [frame for _, frame in StreamReplayer(args.recording, speed=None).frames()]
+    else:
+        frames = _synthetic_frames(args.frames, args.batch)
+
+    # 2) Only decoding is exercised, so no client or connection is needed.
+    modes = {
+        "MonitorMessage": MonitorApi(None),
+        "raw dicts": MonitorApi(None, raw=True),
+        "fields": MonitorApi(None, fields=args.fields),
+    }
+
+    decoder = "orjson" if monitor_api.orjson is not None else "json"
+    print(f"Decoding {len(frames)} frames, raw modes using {decoder}")
+    print(f"{'mode':<16}  {'messages':>10}  {'messages/s':>12}  speedup")
+    print("-" * 52)
+    baseline = None
+    for name, api in modes.items():
+        count, rate = _throughput(api, frames)
+        baseline = baseline or rate
+        print(f"{name:<16}  {count:>10}  {rate:>12,.0f}  {rate / baseline:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,8 +37,9 @@ Usage (local dev with self-signed cert):
         --task-id <TASK_ID> \\
         --insecure
 
-Pass ``--interval 20`` to print a rolling 20-second summary instead of every
-raw message.  Press Ctrl+C to stop.
+Pass ``--interval 20`` to print a summary of the most recent samples every 20
+seconds instead of every raw message.  Summaries are computed with
+``MetricAggregator``, which requires ``numpy``.  Press Ctrl+C to stop.
 """
 
 from __future__ import annotations
@@ -46,12 +47,12 @@ from __future__ import annotations
 import argparse
 import json
 import ssl
-import statistics
 import time
 from datetime import datetime, timezone
 from typing import Any
 
 from ansys.hps.client import Client, ClientError
+from ansys.hps.client.monitor import MetricAggregator
 from ansys.hps.client.monitor.api.monitor_api import MonitorApi
 
 
@@ -84,6 +85,12 @@ def _build_parser() -> argparse.ArgumentParser:
             "instead of printing each raw message. Default: 0 (print every message)."
         ),
     )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=60,
+        help="Number of most recent samples summarized (default: 60).",
+    )
     parser.add_argument(
         "--max-messages",
         type=int,
@@ -143,20 +150,23 @@ def _print_raw(msg: dict[str, Any]) -> None:
     print(f"{ts}   cpu {cpu_s}   mem {mem_s}")
 
 
-def _print_summary(
-    window_end: str,
-    cpu_vals: list[float],
-    mem_vals: list[float],
-) -> None:
-    """Print a one-line rolling window summary."""
+def _print_summary(window_end: str, aggregator: MetricAggregator, evaluator: str) -> None:
+    """Print a one-line summary of the samples in the rolling window."""
 
-    def _fmt(vals: list[float]) -> str:
-        if not vals:
+    def _fmt(metric: str) -> str:
+        if metric not in aggregator.metrics(evaluator):
             return "  n/a    n/a    n/a    n/a"
-        return f"{vals[-1]:6.1f}  {min(vals):6.1f}  {max(vals):6.1f}  {statistics.mean(vals):6.1f}"
+        s = aggregator.stats(evaluator, metric, percentiles=[])
+        return f"{s['last']:6.1f}  {s['min']:6.1f}  {s['max']:6.1f}  {s['mean']:6.1f}"
 
-    n = max(len(cpu_vals), len(mem_vals))
-    print(f"{window_end}   {n:>5}   cpu {_fmt(cpu_vals)}   mem {_fmt(mem_vals)}")
+    n = max(
+        (
+            aggregator.stats(evaluator, m, percentiles=[])["count"]
+            for m in aggregator.metrics(evaluator)
+        ),
+        default=0,
+    )
+    print(f"{window_end}   {n:>5}   cpu {_fmt('cpu')}   mem {_fmt('memory')}")
 
 
 def main() -> None:
@@ -184,8 +194,9 @@ def main() -> None:
     )
 
     use_summary = args.interval > 0
-    cpu_vals: list[float] = []
-    mem_vals: list[float] = []
+    # Rolling statistics of the last ``--window`` samples, per evaluator and metric.
+    aggregator = MetricAggregator(window=args.window) if use_summary else None
+    evaluator: str | None = None
 
     try:
         project_id = args.project_id
@@ -220,21 +231,15 @@ def main() -> None:
             backlog=args.backlog,
             max_messages=args.max_messages,
         ):
-            cpu, mem = _extract_metrics(msg)
-
             if use_summary:
-                # Accumulate into rolling window.
-                if cpu is not None:
-                    cpu_vals.append(cpu)
-                if mem is not None:
-                    mem_vals.append(mem)
+                # Accumulate into the rolling window of the evaluator.
+                aggregator.add(msg)
+                evaluator = (msg.get("tags") or {}).get("evaluator_name", evaluator)
 
                 now = time.monotonic()
-                if now - window_start >= args.interval:
+                if evaluator and now - window_start >= args.interval:
                     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-                    _print_summary(ts, cpu_vals, mem_vals)
-                    cpu_vals = []
-                    mem_vals = []
+                    _print_summary(ts, aggregator, evaluator)
                     window_start = now
             else:
                 _print_raw(msg)
@@ -243,9 +248,9 @@ def main() -> None:
         raise SystemExit(f"Monitor request failed: {exc}") from exc
     except KeyboardInterrupt:
         print("\nInterrupted by user.")
-        if use_summary and (cpu_vals or mem_vals):
+        if use_summary and evaluator:
             ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-            _print_summary(ts, cpu_vals, mem_vals)
+            _print_summary(ts, aggregator, evaluator)
 
 
 if __name__ == "__main__":
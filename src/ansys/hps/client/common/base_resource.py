@@ -85,6 +85,37 @@ class Object:
 
     __hash__ = object.__hash__
 
+    def __setattr__(self, name, value):
+        """Set an attribute, recording it as modified when tracking is active."""
+        modified = self.__dict__.get("_modified_fields")
+        if modified is not None and not name.startswith("_"):
+            modified.add(name)
+        super().__setattr__(name, value)
+
+    def _reset_modified_fields(self, names: set[str] = None):
+        """Start tracking attribute assignments from the current state of the object.
+
+        If ``names`` is given, only these attributes stop being reported as modified.
+        """
+        modified = self.__dict__.get("_modified_fields")
+        if names is None or modified is None:
+            object.__setattr__(self, "_modified_fields", set())
+        else:
+            modified.difference_update(names)
+
+    @property
+    def modified_fields(self) -> set[str] | None:
+        """Names of the attributes assigned since the object was loaded from the server.
+
+        ``None`` is returned for objects that were created on the client side, for which
+        modifications are not tracked. Note that in-place changes of mutable attributes,
+        such as ``job.values["x"] = 1``, are not detected. Reassign the attribute instead.
+        """
+        modified = self.__dict__.get("_modified_fields")
+        if modified is None:
+            return None
+        return modified & set(self.declared_fields())
+
     def __str__(self):
         """Provide the string representation of the object."""
         # Ideally we'd simply do
@@ -38,7 +38,11 @@ class BaseSchema(Schema):
     @post_load
     def make_object(self, data, **kwargs):
         """Make object for base schema."""
-        return self.Meta.object_class(**data)
+        obj = self.Meta.object_class(**data)
+        # Objects loaded from the server track modified attributes from here on
+        if hasattr(obj, "_reset_modified_fields"):
+            obj._reset_modified_fields()
+        return obj
 
 
 class ObjectSchema(BaseSchema):
@@ -22,7 +22,19 @@
 
 """PyHPS JMS subpackage."""
 
-from .api import JmsApi, ProjectApi
+from .api import (
+    DownloadCache,
+    FileContents,
+    FileTransferResult,
+    JmsApi,
+    JobNode,
+    ProjectApi,
+    ProjectMirror,
+    RestoreResult,
+    SyncResult,
+    TaskNode,
+    UpdateBuffer,
+)
 from .resource import (
     Algorithm,
     BoolParameterDefinition,
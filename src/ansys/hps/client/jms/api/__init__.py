@@ -22,5 +22,12 @@
 
 """PyHPS JMS API submodule."""
 
+from .archive_transfer import RestoreResult
+from .base import UpdateBuffer
+from .directory_sync import SyncResult
+from .download_cache import DownloadCache
+from .file_transfer import FileContents, FileTransferResult
 from .jms_api import JmsApi
+from .job_graph import JobNode, TaskNode
 from .project_api import ProjectApi
+from .project_mirror import ProjectMirror
@@ -0,0 +1,154 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module transferring project archives between the client and the storage."""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ansys.hps.data_transfer.client.models import OperationState, SrcDst, StoragePath
+
+from ansys.hps.client.exceptions import HPSError
+from ansys.hps.client.jms.resource import Project
+
+from .checksum import HASH_ALGORITHM, compute_checksum, is_comparable
+from .file_transfer import _DownloadHandler
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RestoreResult:
+    """Outcome of the restoration of a project from an archive.
+
+    Attributes
+    ----------
+    path : str
+        Path of the archive file.
+    project : Project, optional
+        Restored project.
+    success : bool
+        Whether the project was restored.
+    error : str, optional
+        Reason of the failure.
+
+    """
+
+    path: str
+    project: Project | None
+    success: bool
+    error: str | None = None
+
+
+def _remote_metadata(dt_api, remote_path: str) -> dict | None:
+    """Get the size and checksum of a stored object, ``None`` if it does not exist."""
+    op = dt_api.get_metadata([StoragePath(path=remote_path)])
+    op = dt_api.wait_for([op.id])[0]
+    if op.state != OperationState.Succeeded:
+        return None
+    return (op.result or {}).get(remote_path)
+
+
+def _is_transferred(local_path: str, metadata: dict | None, verify: bool) -> bool:
+    """Check whether a local file and a stored object have the same content."""
+    if metadata is None or not os.path.isfile(local_path):
+        return False
+    if os.path.getsize(local_path) != metadata.get("size"):
+        return False
+    if not verify:
+        return True
+    checksum = metadata.get("checksum")
+    if not is_comparable(checksum):
+        log.warning(f"Cannot verify {local_path} without a {HASH_ALGORITHM} checksum")
+        return True
+    return compute_checksum(local_path) == checksum
+
+
+def transfer_archive(
+    client,
+    local_path: str,
+    remote_path: str,
+    upload: bool,
+    progress_handler: Callable[[int], None] = None,
+    verify: bool = True,
+    max_retries: int = 3,
+    skip_existing: bool = True,
+):
+    """Upload or download a project archive, retrying and verifying the transfer.
+
+    The data transfer service copies archives as a whole and cannot resume a
+    partial copy, so a failed transfer is retried from the start, to the same
+    destination, with an exponential backoff, up to ``max_retries`` times. With
+    ``verify=True``, the checksum of the transferred archive is compared with the
+    one of its source, and a mismatch is retried like a failure. With
+    ``skip_existing=True``, an archive whose destination already has the same size
+    and checksum, such as after an interrupted call, is not transferred again.
+    """
+    client.initialize_data_transfer_client()
+    dt_api = client.data_transfer_api
+
+    local = StoragePath(path=local_path, remote="local")
+    remote = StoragePath(path=remote_path)
+    src, dst = (local, remote) if upload else (remote, local)
+
+    metadata = _remote_metadata(dt_api, remote_path) if skip_existing or not upload else None
+    if upload:
+        size = os.path.getsize(local_path)
+    else:
+        if metadata is None:
+            raise HPSError(f"Archive {remote_path} does not exist")
+        size = metadata.get("size") or 0
+
+    if progress_handler is not None:
+        progress_handler(0)
+    if skip_existing and _is_transferred(local_path, metadata, verify):
+        log.info(f"Archive {os.path.basename(local_path)} is already transferred, skipping")
+        if progress_handler is not None:
+            progress_handler(size)
+        return
+
+    for attempt in range(max_retries + 1):
+        op = dt_api.copy([SrcDst(src=src, dst=dst)])
+        op = dt_api.wait_for([op.id], handler=_DownloadHandler(op.id, size, progress_handler))[0]
+        if op.state != OperationState.Succeeded:
+            error = op.error or f"operation {op.id} failed"
+        elif not verify:
+            break
+        else:
+            if upload:
+                metadata = _remote_metadata(dt_api, remote_path)
+            if _is_transferred(local_path, metadata, verify):
+                break
+            error = "checksum mismatch"
+
+        if attempt == max_retries:
+            raise HPSError(f"Transfer of archive {local_path} failed: {error}")
+        delay = min(2.0**attempt, 30.0)
+        log.warning(f"Transfer of archive {local_path} failed: {error}, retrying in {delay}s")
+        time.sleep(delay)
+
+    if progress_handler is not None:
+        progress_handler(size)
+    log.info(f"Transferred archive {os.path.basename(local_path)} ({size} bytes)")
@@ -24,7 +24,12 @@
 
 import json
 import logging
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
+from marshmallow.utils import missing
 from requests import Session
 
 from ansys.hps.client.common import Object
@@ -33,18 +38,115 @@ from ansys.hps.client.exceptions import ClientError
 log = logging.getLogger(__name__)
 
 
+#: Maximum length in characters of the encoded ID filter of a single query.
+#: Longer ID filters are split into several queries to stay below URL length limits.
+MAX_ID_FILTER_LENGTH = 4000
+
+#: Maximum number of concurrent queries used for a split ID filter.
+MAX_PARALLEL_QUERIES = 8
+
+
+def _is_id_filter(key: str, value) -> bool:
+    """Check whether a query parameter is a list of IDs."""
+    return isinstance(value, list | tuple) and (key == "id" or key.endswith(("_id", "_ids")))
+
+
+def _split_id_filter(key: str, ids: list[str]) -> list[list[str]]:
+    """Split a list of IDs into chunks whose encoded query string is short enough."""
+    chunks = []
+    chunk = []
+    length = 0
+    for id in ids:
+        id_length = len(key) + len(urllib.parse.quote(str(id))) + 2
+        if chunk and length + id_length > MAX_ID_FILTER_LENGTH:
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+        chunk.append(id)
+        length += id_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _get_objects_split(session: Session, url: str, rest_name: str, query_params: dict):
+    """Get raw objects, splitting an oversized ID filter into parallel sub-queries.
+
+    Returns the count if ``count`` is requested, the list of objects otherwise.
+    Objects returned by multiple sub-queries are only included once.
+    """
+    id_filters = [
+        (k, list(dict.fromkeys(v))) for k, v in query_params.items() if _is_id_filter(k, v)
+    ]
+    key, ids = max(id_filters, key=lambda f: len(f[1]), default=(None, []))
+    chunks = _split_id_filter(key, ids) if key else []
+
+    if len(chunks) <= 1:
+        r = session.get(url, params=query_params)
+        if query_params.get("count"):
+            return r.json()[f"num_{rest_name}"]
+        return r.json()[rest_name]
+
+    if "limit" in query_params or "offset" in query_params:
+        raise ClientError(
+            f"Querying {len(ids)} {rest_name} by '{key}' requires splitting the query, "
+            "which cannot be combined with 'limit' or 'offset'."
+        )
+
+    log.debug(f"Splitting query of {rest_name} by {len(ids)} '{key}' values into {len(chunks)}")
+
+    count = query_params.get("count")
+    # An object has a single value of an ``_id`` key, so it matches a single chunk and
+    # counts can be summed. It can have several values of an ``_ids`` key and match
+    # several chunks, so its ID is fetched instead, to count distinct objects.
+    distinct_count = count and key.endswith("_ids")
+    params = query_params
+    if distinct_count:
+        params = {k: v for k, v in query_params.items() if k != "count"}
+        params["fields"] = ["id"]
+
+    def _get(chunk):
+        r = session.get(url, params={**params, key: chunk})
+        if count and not distinct_count:
+            return r.json()[f"num_{rest_name}"]
+        return r.json()[rest_name]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_QUERIES, len(chunks))) as executor:
+        results = list(executor.map(_get, chunks))
+
+    if distinct_count:
+        return len({d["id"] for result in results for d in result})
+    if count:
+        return sum(results)
+
+    data = []
+    seen = set()
+    for result in results:
+        for d in result:
+            id = d.get("id")
+            if id is not None:
+                if id in seen:
+                    continue
+                seen.add(id)
+            data.append(d)
+    return data
+
+
 def get_objects(
     session: Session, url: str, obj_type: type[Object], as_objects=True, **query_params
 ):
-    """Get objects with a session, URL, and object type."""
+    """Get objects with a session, URL, and object type.
+
+    Queries filtering by long lists of IDs, such as ``id=[...]`` or ``job_id=[...]``,
+    are split into several concurrent queries, whose results are merged.
+    """
     rest_name = obj_type.Meta.rest_name
     url = f"{url}/{rest_name}"
-    r = session.get(url, params=query_params)
+    data = _get_objects_split(session, url, rest_name, query_params)
 
     if query_params.get("count"):
-        return r.json()[f"num_{rest_name}"]
+        return data
 
-    data = r.json()[rest_name]
     if not as_objects:
         return data
 
@@ -114,15 +216,45 @@ def create_objects(
     return schema.load(data)
 
 
+def _dump_modified_fields(objects: list[Object], obj_type: type[Object]) -> list[dict]:
+    """Serialize the ID and the modified fields of each object.
+
+    Objects that do not track modifications, because they were not loaded from
+    the server, are fully serialized.
+    """
+    field_names = {}
+    for name, field in obj_type.Meta.schema._declared_fields.items():
+        field_names[field.attribute or name] = name
+
+    full_schema = obj_type.Meta.schema()
+    schemas = {}
+    serialized_data = []
+    for obj in objects:
+        modified = obj.modified_fields
+        if modified is None:
+            serialized_data.append(full_schema.dump(obj))
+            continue
+        only = frozenset(field_names[attr] for attr in modified | {"id"})
+        if only not in schemas:
+            schemas[only] = obj_type.Meta.schema(only=only)
+        serialized_data.append(schemas[only].dump(obj))
+    return serialized_data
+
+
 def update_objects(
     session: Session,
     url: str,
     objects: list[Object],
     obj_type: type[Object],
     as_objects=True,
+    only_modified=False,
     **query_params,
 ):
-    """Update objects."""
+    """Update objects.
+
+    If ``only_modified=True``, only the ID and the attributes assigned since each
+    object was loaded from the server are sent.
+    """
     if not objects:
         return []
 
@@ -132,10 +264,18 @@ def update_objects(
 
     url = f"{url}/{rest_name}"
     schema = obj_type.Meta.schema(many=True)
-    serialized_data = schema.dump(objects)
+    if only_modified:
+        serialized_data = _dump_modified_fields(objects, obj_type)
+    else:
+        serialized_data = schema.dump(objects)
     json_data = json.dumps({rest_name: serialized_data})
     r = session.put(f"{url}", data=json_data, params=query_params)
 
+    # The server state now matches the client objects
+    for obj in objects:
+        if obj.modified_fields is not None:
+            obj._reset_modified_fields()
+
     data = r.json()[rest_name]
     if not as_objects:
         return data
@@ -143,6 +283,125 @@ def update_objects(
     return schema.load(data)
 
 
+class UpdateBuffer:
+    """Collects object updates and sends them coalesced per object.
+
+    Repeated updates of the same object (same type and ID) are merged so that
+    each object is sent at most once per flush, with only its modified fields.
+    Pending updates are flushed when the flush window has elapsed or the number
+    of pending objects reaches ``max_pending``. The check is done whenever
+    objects are added. Pending updates are also flushed when leaving the
+    context manager without an exception.
+
+    The modified fields of the added objects are only reset once their update
+    was sent. Updates that fail to be sent stay pending, so that a later flush
+    retries them.
+
+    Parameters
+    ----------
+    session : Session
+        Session used to send the requests.
+    url : str
+        URL of the API the objects belong to.
+    flush_interval : float, optional
+        Maximum time in seconds that updates are held back. The default is ``1.0``.
+    max_pending : int, optional
+        Maximum number of pending objects before a flush. The default is ``1000``.
+
+    Examples
+    --------
+    >>> with project_api.update_buffer(flush_interval=5.0) as buffer:
+    ...     for job in jobs:
+    ...         job.priority = 2
+    ...         buffer.add([job])
+
+    """
+
+    def __init__(
+        self, session: Session, url: str, flush_interval: float = 1.0, max_pending: int = 1000
+    ):
+        """Initialize the update buffer."""
+        self.session = session
+        self.url = url
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[type[Object], dict[str, dict]] = {}
+        # Added instances of each object and their queued values, by object ID, to reset
+        # their modified fields once sent
+        self._sources: dict[type[Object], dict[str, dict[int, tuple[Object, dict]]]] = {}
+        self._num_pending = 0
+        self._window_start = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush pending updates on exit."""
+        if exc_type is None:
+            self.flush()
+        elif self._num_pending:
+            log.warning(
+                f"Leaving update buffer on error with {self._num_pending} objects "
+                "whose updates were not sent"
+            )
+
+    @property
+    def num_pending(self) -> int:
+        """Number of objects with pending updates."""
+        return self._num_pending
+
+    def add(self, objects: list[Object]):
+        """Queue updates of objects, flushing if the window or size limit is reached."""
+        with self._lock:
+            for obj in objects:
+                if getattr(obj, "id", missing) in (missing, None):
+                    raise ClientError(f"Cannot queue update of {obj.obj_type} without an ID.")
+                modified = obj.modified_fields
+                if modified is None:
+                    modified = [k for k in obj.declared_fields() if getattr(obj, k) is not missing]
+                elif not modified:
+                    continue
+                pending = self._pending.setdefault(obj.__class__, {})
+                if obj.id not in pending:
+                    pending[obj.id] = {}
+                    self._num_pending += 1
+                values = {k: getattr(obj, k) for k in modified if k != "id"}
+                pending[obj.id].update(values)
+                if obj.modified_fields is not None:
+                    instances = self._sources.setdefault(obj.__class__, {}).setdefault(obj.id, {})
+                    instances.setdefault(id(obj), (obj, {}))[1].update(values)
+            if self._window_start is None:
+                self._window_start = time.monotonic()
+            if (
+                self._num_pending >= self.max_pending
+                or time.monotonic() - self._window_start >= self.flush_interval
+            ):
+                self._flush()
+
+    def flush(self):
+        """Send all pending updates."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._window_start = None
+        for obj_type in list(self._pending):
+            updates = self._pending[obj_type]
+            objects = [obj_type(id=id, **values) for id, values in updates.items()]
+            log.debug(f"Flushing updates of {len(objects)} {obj_type.Meta.rest_name}")
+            # Pending updates are only removed once sent, a failure leaves them to retry
+            update_objects(self.session, self.url, objects, obj_type, as_objects=False)
+            del self._pending[obj_type]
+            self._num_pending -= len(updates)
+            for instances in self._sources.pop(obj_type, {}).values():
+                for obj, values in instances.values():
+                    # Fields assigned again since they were queued are still modified
+                    modified = {k for k, v in values.items() if getattr(obj, k) is v}
+                    obj._reset_modified_fields(modified)
+
+
 def delete_objects(session: Session, url: str, objects: list[Object], obj_type: type[Object]):
     """Delete objects."""
     if not objects:
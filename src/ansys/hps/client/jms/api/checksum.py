@@ -0,0 +1,118 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module computing checksums of local files to verify file transfers."""
+
+import hashlib
+import logging
+import mmap
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+#: Hash algorithm used to compare local contents with the ``hash`` of file resources.
+HASH_ALGORITHM = "sha256"
+
+_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def compute_checksum(path: str, algorithm: str = HASH_ALGORITHM) -> str:
+    """Compute the checksum of a local file.
+
+    The file is memory-mapped and hashed in large chunks, without copying its content.
+    Since hash functions release the GIL on large inputs, several files can be hashed
+    concurrently with threads.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    algorithm : str, optional
+        Name of a hash algorithm of :mod:`hashlib`. The default is :data:`HASH_ALGORITHM`.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the content of the file.
+
+    """
+    h = hashlib.new(algorithm)
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        # Empty files cannot be mapped
+        if size > 0:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                for start in range(0, size, _CHUNK_SIZE):
+                    with view[start : start + _CHUNK_SIZE] as chunk:
+                        h.update(chunk)
+    return h.hexdigest()
+
+
+def compute_checksums(
+    paths: list[str],
+    algorithm: str = HASH_ALGORITHM,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> list[str]:
+    """Compute the checksums of local files in parallel.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Paths to the files.
+    algorithm : str, optional
+        Name of a hash algorithm of :mod:`hashlib`. The default is :data:`HASH_ALGORITHM`.
+    max_workers : int, optional
+        Maximum number of files hashed concurrently. The default is the number of CPUs.
+    use_processes : bool, optional
+        Whether to hash files in a process pool instead of a thread pool. Threads are
+        sufficient for most algorithms, which release the GIL. The default is ``False``.
+
+    Returns
+    -------
+    list[str]
+        Hexadecimal digests, in the order of ``paths``.
+
+    """
+    if not paths:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if max_workers == 1:
+        return [compute_checksum(p, algorithm) for p in paths]
+
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers=max_workers)
+        if use_processes
+        else ThreadPoolExecutor(max_workers=max_workers)
+    )
+    with pool:
+        return list(pool.map(compute_checksum, paths, [algorithm] * len(paths)))
+
+
+def is_comparable(digest: str | None, algorithm: str = HASH_ALGORITHM) -> bool:
+    """Check whether a ``hash`` of a file resource can be compared with local checksums.
+
+    Hashes computed by the server with another algorithm than ``algorithm`` have a
+    different length and cannot be compared.
+    """
+    return isinstance(digest, str) and len(digest) == 2 * hashlib.new(algorithm).digest_size
@@ -0,0 +1,231 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module synchronizing a local directory with the file resources of a project."""
+
+import fnmatch
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ansys.hps.client.exceptions import ClientError
+from ansys.hps.client.jms.resource import File
+from ansys.hps.client.jms.schema.file import FileAccessMode
+
+from .checksum import HASH_ALGORITHM, is_comparable
+from .file_transfer import _hash_source, download_files
+
+log = logging.getLogger(__name__)
+
+_DIRECTIONS = ("up", "down")
+
+
+@dataclass
+class SyncResult:
+    """Outcome of the synchronization of a directory.
+
+    Attributes
+    ----------
+    transferred : list[str]
+        Relative paths of the new or changed files that were transferred.
+    unchanged : list[str]
+        Relative paths of the files that were already up to date.
+    deleted : list[str]
+        Relative paths of the files that were pruned.
+    failed : list[str]
+        Relative paths of the files whose transfer or deletion failed.
+
+    """
+
+    transferred: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+def _local_files(local_dir: str, pattern: str) -> dict[str, str]:
+    """Get the local files matching a pattern, keyed by relative POSIX path."""
+    paths = {}
+    for root, _, names in os.walk(local_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            rel_path = os.path.relpath(path, local_dir).replace(os.sep, "/")
+            if fnmatch.fnmatch(rel_path, pattern):
+                paths[rel_path] = path
+    return paths
+
+
+def _remote_files(project_api, pattern: str, **query_params) -> dict[str, File]:
+    """Get the file resources matching a pattern, keyed by evaluation path.
+
+    Of several files sharing an evaluation path, the most recently modified one is used.
+    """
+    files = {}
+    for f in project_api.get_files(**query_params):
+        rel_path = getattr(f, "evaluation_path", None)
+        if (
+            not isinstance(rel_path, str)
+            or getattr(f, "access_mode", None) == FileAccessMode.direct_access.value
+            or not fnmatch.fnmatch(rel_path, pattern)
+        ):
+            continue
+        current = files.get(rel_path)
+        if current is None or _modification_key(f) >= _modification_key(current):
+            files[rel_path] = f
+    return files
+
+
+def _modification_key(file: File) -> float:
+    modification_time = getattr(file, "modification_time", None)
+    return modification_time.timestamp() if hasattr(modification_time, "timestamp") else 0.0
+
+
+def _unchanged(
+    pairs: list[tuple[File, str]], checksum: bool, algorithm: str, max_workers: int
+) -> list[bool]:
+    """Check in parallel whether local files match the size and hash of file resources."""
+
+    def check(pair):
+        file, path = pair
+        size = getattr(file, "size", None)
+        if not isinstance(size, int) or os.path.getsize(path) != size:
+            return False
+        if not checksum:
+            return True
+        # Hashes computed with another algorithm cannot tell whether the file changed
+        digest = getattr(file, "hash", None)
+        return is_comparable(digest, algorithm) and _hash_source(path, algorithm) == digest
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(check, pairs))
+
+
+def sync_directory(
+    project_api,
+    local_dir: str,
+    direction: str = "up",
+    pattern: str = "*",
+    prune: bool = False,
+    checksum: bool = True,
+    batch_size: int = 100,
+    max_in_flight: int = 4,
+    **query_params,
+) -> SyncResult:
+    """Synchronize a local directory with the file resources of a project."""
+    if direction not in _DIRECTIONS:
+        raise ClientError(f"Unknown direction '{direction}', expected one of {_DIRECTIONS}.")
+    if direction == "up" and not os.path.isdir(local_dir):
+        raise ClientError(f"Local directory '{local_dir}' does not exist.")
+
+    local = _local_files(local_dir, pattern) if os.path.isdir(local_dir) else {}
+    remote = _remote_files(project_api, pattern, **query_params)
+
+    # Compare the files present on both sides
+    common = sorted(set(local) & set(remote))
+    pairs = [(remote[p], local[p]) for p in common]
+    matches = _unchanged(pairs, checksum, HASH_ALGORITHM, max_workers=max_in_flight * 2)
+
+    result = SyncResult(unchanged=[p for p, same in zip(common, matches, strict=True) if same])
+    changed = [p for p, same in zip(common, matches, strict=True) if not same]
+
+    if direction == "up":
+        _sync_up(project_api, local, remote, changed, prune, batch_size, max_in_flight, result)
+    else:
+        _sync_down(
+            project_api, local_dir, local, remote, changed, prune, batch_size, max_in_flight, result
+        )
+
+    log.info(
+        f"Synchronized {local_dir} {direction}: {len(result.transferred)} transferred, "
+        f"{len(result.unchanged)} unchanged, {len(result.deleted)} deleted, "
+        f"{len(result.failed)} failed"
+    )
+    return result
+
+
+def _sync_up(project_api, local, remote, changed, prune, batch_size, max_in_flight, result):
+    """Upload new and changed local files, and delete file resources missing locally."""
+    new = sorted(set(local) - set(remote))
+    for p in changed:
+        remote[p].src = local[p]
+
+    def create(paths):
+        project_api.create_files(
+            [File(name=os.path.basename(p), evaluation_path=p, src=local[p]) for p in paths]
+        )
+
+    def update(paths):
+        project_api.update_files([remote[p] for p in paths])
+
+    # Batches are sent independently, a failed batch does not abort the others
+    batches = [(create, new[i : i + batch_size]) for i in range(0, len(new), batch_size)]
+    batches += [(update, changed[i : i + batch_size]) for i in range(0, len(changed), batch_size)]
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        futures = [(paths, executor.submit(send, paths)) for send, paths in batches]
+        for paths, future in futures:
+            try:
+                future.result()
+                result.transferred.extend(paths)
+            except Exception as e:
+                log.error(f"Failed to upload {len(paths)} files: {e}")
+                result.failed.extend(paths)
+    result.transferred.sort()
+    result.failed.sort()
+
+    if prune:
+        deleted = sorted(set(remote) - set(local))
+        if deleted:
+            try:
+                project_api.delete_files([remote[p] for p in deleted])
+                result.deleted.extend(deleted)
+            except Exception as e:
+                log.error(f"Failed to delete {len(deleted)} files: {e}")
+                result.failed.extend(deleted)
+
+
+def _sync_down(
+    project_api, local_dir, local, remote, changed, prune, batch_size, max_in_flight, result
+):
+    """Download new and changed file resources, and delete local files missing remotely."""
+    paths = sorted(set(remote) - set(local)) + changed
+    if paths:
+        results = download_files(
+            project_api,
+            [remote[p] for p in paths],
+            local_dir,
+            layout="flat",
+            max_in_flight=max_in_flight,
+            max_files_per_operation=batch_size,
+        )
+        for p, r in zip(paths, results, strict=True):
+            (result.transferred if r.success else result.failed).append(p)
+
+    if prune:
+        for p in sorted(set(local) - set(remote)):
+            try:
+                os.remove(local[p])
+            except OSError as e:
+                log.error(f"Failed to delete {local[p]}: {e}")
+                result.failed.append(p)
+            else:
+                result.deleted.append(p)
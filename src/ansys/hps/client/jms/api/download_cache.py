@@ -0,0 +1,235 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module providing a persistent local cache of downloaded file contents."""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+from ansys.hps.client.exceptions import ClientError
+from ansys.hps.client.jms.resource import File
+
+from .checksum import compute_checksum, is_comparable
+
+log = logging.getLogger(__name__)
+
+
+class DownloadCache:
+    """Persistent, size-bounded cache of downloaded file contents.
+
+    Contents are keyed by the ``hash`` of their file resource, so that the same
+    content is only downloaded once, across projects and sessions. Files without
+    a hash are not cached. When the total size exceeds ``max_size``, the least
+    recently used contents are evicted.
+
+    Cached contents are served by creating a hard link at the target path when
+    ``link=True`` and the cache is on the same file system, or by copying them
+    otherwise. Since a hard-linked file shares its content with the cache, modifying
+    it in place also modifies the cached content. With ``verify=True``, cached
+    contents are checked against the checksum recorded when they were stored, and
+    discarded if they changed. Contents are only stored if their checksum matches
+    the ``hash`` of their file resource, when it is a SHA-256 digest.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the cache. It is created if it does not exist.
+    max_size : int, optional
+        Maximum total size of the cached contents in bytes. The default is 10 GiB.
+    link : bool, optional
+        Whether to serve and store contents with hard links when possible.
+        The default is ``True``.
+    verify : bool, optional
+        Whether to verify the checksum of cached contents before serving them.
+        The default is ``True``.
+
+    Examples
+    --------
+    >>> cache = DownloadCache(os.path.expanduser("~/.cache/hps-downloads"))
+    >>> project_api = ProjectApi(client, project.id, download_cache=cache)
+    >>> project_api.download_file(file, "results")  # downloaded once, then served locally
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 10 * 1024**3,
+        link: bool = True,
+        verify: bool = True,
+    ):
+        """Initialize the download cache."""
+        self.path = path
+        self.max_size = max_size
+        self.link = link
+        self.verify = verify
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        # A single connection shared by all threads, serialized by the lock
+        self._db = sqlite3.connect(
+            os.path.join(path, "index.db"), timeout=30.0, check_same_thread=False
+        )
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, size INTEGER, digest TEXT, last_access REAL)"
+        )
+        self._execute("CREATE INDEX IF NOT EXISTS entries_access ON entries (last_access)")
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        """Execute a statement on the index and commit it."""
+        with self._lock:
+            if self._db is None:
+                raise ClientError("The download cache is closed.")
+            with self._db:
+                return self._db.execute(sql, parameters).fetchall()
+
+    def close(self):
+        """Close the index of the cache."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the cache when leaving the context manager."""
+        self.close()
+
+    @staticmethod
+    def _key(file: File) -> str | None:
+        """Get the cache key of a file, ``None`` if it cannot be cached."""
+        key = getattr(file, "hash", None)
+        return key if isinstance(key, str) and key else None
+
+    def _entry_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.path, "objects", name[:2], name)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached contents in bytes."""
+        return self._execute("SELECT COALESCE(SUM(size), 0) FROM entries")[0][0]
+
+    def __contains__(self, file: File) -> bool:
+        """Check whether the content of a file is cached."""
+        key = self._key(file)
+        if key is None:
+            return False
+        return bool(self._execute("SELECT 1 FROM entries WHERE key = ?", (key,)))
+
+    def fetch(self, file: File, target_path: str) -> bool:
+        """Place the cached content of a file at a target path.
+
+        Returns
+        -------
+        bool
+            ``True`` if the content was cached, ``False`` otherwise.
+
+        """
+        key = self._key(file)
+        if key is None:
+            return False
+        rows = self._execute("SELECT digest FROM entries WHERE key = ?", (key,))
+        if not rows:
+            return False
+
+        entry_path = self._entry_path(key)
+        if not os.path.isfile(entry_path) or (
+            self.verify and compute_checksum(entry_path) != rows[0][0]
+        ):
+            log.warning(f"Discarding invalid cached content of file {file.id}")
+            self._remove(key)
+            return False
+
+        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        if os.path.lexists(target_path):
+            os.remove(target_path)
+        self._place(entry_path, target_path)
+        self._execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        log.debug(f"Served file {file.id} from the download cache")
+        return True
+
+    def store(self, file: File, source_path: str):
+        """Add the downloaded content of a file to the cache."""
+        key = self._key(file)
+        if key is None or not os.path.isfile(source_path):
+            return
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        temp_path = f"{entry_path}.{threading.get_ident()}.tmp"
+        # Copy rather than link, the source may be modified by the caller afterwards
+        shutil.copyfile(source_path, temp_path)
+        digest = compute_checksum(temp_path)
+        if is_comparable(key) and digest != key.lower():
+            os.remove(temp_path)
+            log.warning(f"Not caching file {file.id}, its content does not match its hash")
+            return
+        os.replace(temp_path, entry_path)
+        self._execute(
+            "INSERT OR REPLACE INTO entries (key, size, digest, last_access) VALUES (?, ?, ?, ?)",
+            (key, os.path.getsize(entry_path), digest, time.time()),
+        )
+        self._evict()
+
+    def clear(self):
+        """Remove all cached contents."""
+        for (key,) in self._execute("SELECT key FROM entries"):
+            self._remove(key)
+
+    def _place(self, entry_path: str, target_path: str):
+        if self.link:
+            try:
+                os.link(entry_path, target_path)
+                return
+            except OSError:
+                # Different file system or links not supported
+                pass
+        shutil.copyfile(entry_path, target_path)
+
+    def _remove(self, key: str):
+        self._execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Remove least recently used contents until the cache fits its maximum size."""
+        with self._lock:
+            total = self.size
+            if total <= self.max_size:
+                return
+            rows = self._execute("SELECT key, size FROM entries ORDER BY last_access")
+            for key, size in rows:
+                if total <= self.max_size:
+                    break
+                self._remove(key)
+                total -= size
+                log.debug(f"Evicted content {key} from the download cache")
@@ -0,0 +1,604 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module transferring file contents between the client and the project storage in bulk."""
+
+import hashlib
+import io
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO
+
+from ansys.hps.data_transfer.client.api.handler import WaitHandler
+from ansys.hps.data_transfer.client.models import Operation, OperationState, SrcDst, StoragePath
+
+from ansys.hps.client.exceptions import ClientError, HPSError
+from ansys.hps.client.jms.resource import File
+from ansys.hps.client.jms.schema.file import FileAccessMode
+
+from .base import _split_id_filter, get_objects
+from .checksum import HASH_ALGORITHM, compute_checksum, compute_checksums, is_comparable
+
+log = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileTransferResult:
+    """Outcome of the transfer of a single file.
+
+    Attributes
+    ----------
+    file : File
+        Transferred file resource.
+    path : str
+        Local path of the file.
+    success : bool
+        Whether the transfer succeeded.
+    error : str, optional
+        Reason of the failure.
+
+    """
+
+    file: File
+    path: str | None
+    success: bool
+    error: str | None = None
+
+
+def _local_source_path(file: File, temp_dir: str) -> str:
+    """Get a local path holding the content of the ``src`` of a file to upload.
+
+    Paths are returned as is, as are file objects opened on a local file. In-memory
+    buffers are written to ``temp_dir`` without copying them: byte buffers through a
+    memoryview and other streams in chunks.
+    """
+    src = file.src
+    if not isinstance(src, io.IOBase):
+        return src
+
+    name = getattr(src, "name", None)
+    if isinstance(src, io.FileIO | io.BufferedReader | io.TextIOWrapper) and isinstance(name, str):
+        if os.path.isfile(name):
+            return name
+
+    path = os.path.join(temp_dir, os.path.basename(file.storage_id))
+    if isinstance(src, io.BytesIO):
+        with src.getbuffer() as view, open(path, "wb") as out:
+            out.write(view)
+    else:
+        position = src.tell()
+        src.seek(0)
+        with open(path, "w" if isinstance(src, io.TextIOBase) else "wb") as out:
+            shutil.copyfileobj(src, out)
+        src.seek(position)
+    return path
+
+
+def _has_upload(file: File) -> bool:
+    """Check whether a file has a source to upload."""
+    return (
+        getattr(file, "src", None) is not None
+        and getattr(file, "access_mode", FileAccessMode.transfer.value)
+        != FileAccessMode.direct_access.value
+    )
+
+
+def _hash_source(src: str | io.IOBase, algorithm: str = HASH_ALGORITHM) -> str:
+    """Compute the hash of the content of a file source."""
+    if not isinstance(src, io.IOBase):
+        return compute_checksum(src, algorithm)
+
+    h = hashlib.new(algorithm)
+    if isinstance(src, io.BytesIO):
+        with src.getbuffer() as view:
+            h.update(view)
+    else:
+        position = src.tell()
+        src.seek(0)
+        while chunk := src.read(_HASH_CHUNK_SIZE):
+            h.update(chunk.encode() if isinstance(chunk, str) else chunk)
+        src.seek(position)
+    return h.hexdigest()
+
+
+def _hash_sources(
+    files: list[File], algorithm: str = HASH_ALGORITHM, max_workers: int = 8
+) -> list[str]:
+    """Compute the hashes of the sources of files in parallel."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda f: _hash_source(f.src, algorithm), files))
+
+
+def _skip_unchanged_uploads(files: list[File], algorithm: str = HASH_ALGORITHM) -> int:
+    """Drop the sources of files whose stored content matches their local file.
+
+    Local files of the same size as the stored content are hashed in parallel and
+    compared with the ``hash`` of the file resource. Returns the number of skipped files.
+    """
+    candidates = [
+        f
+        for f in files
+        if _has_upload(f)
+        and isinstance(f.src, str)
+        and is_comparable(getattr(f, "hash", None), algorithm)
+        and isinstance(getattr(f, "size", None), int)
+        and os.path.isfile(f.src)
+        and os.path.getsize(f.src) == f.size
+    ]
+    digests = compute_checksums([f.src for f in candidates], algorithm)
+    skipped = 0
+    for f, digest in zip(candidates, digests, strict=True):
+        if digest == f.hash:
+            f.src = None
+            skipped += 1
+    if skipped:
+        log.info(f"Skipping upload of {skipped} files whose content is unchanged")
+    return skipped
+
+
+def _verify_downloads(results: list[FileTransferResult], algorithm: str = HASH_ALGORITHM):
+    """Mark downloaded files whose local checksum does not match their ``hash`` as failed."""
+    verifiable = [r for r in results if r.success and is_comparable(r.file.hash, algorithm)]
+    if len(verifiable) < len([r for r in results if r.success]):
+        log.warning(
+            f"Cannot verify files without a {algorithm} hash, "
+            f"set HASH_ALGORITHM to the algorithm of the server"
+        )
+    digests = compute_checksums([r.path for r in verifiable], algorithm)
+    for r, digest in zip(verifiable, digests, strict=True):
+        if digest != r.file.hash:
+            log.error(f"Checksum mismatch of downloaded file {r.file.id}")
+            r.success = False
+            r.error = "Checksum mismatch"
+
+
+def _find_existing_contents(
+    project_api, digests: list[str], hash_index: MutableMapping[str, dict] | None = None
+) -> dict[str, dict]:
+    """Find stored contents matching the given hashes.
+
+    Contents are looked up in the hash index first, then in the ``hash`` of the file
+    resources of the project. Each match is described by the storage ``path`` of the
+    content, its ``hash`` and its ``size``.
+    """
+    sources = {}
+    for digest in digests:
+        entry = hash_index.get(digest) if hash_index is not None else None
+        if entry is not None:
+            sources[digest] = entry
+
+    missing = [d for d in dict.fromkeys(digests) if d not in sources]
+    for chunk in _split_id_filter("hash", missing):
+        existing = get_objects(
+            project_api.client.session,
+            project_api.url,
+            File,
+            hash=chunk,
+            fields=["id", "storage_id", "hash", "size"],
+        )
+        for f in existing:
+            if f.hash not in sources and isinstance(f.storage_id, str) and f.storage_id:
+                sources[f.hash] = {
+                    "path": _remote_path(project_api, f).path,
+                    "hash": f.hash,
+                    "size": f.size,
+                }
+    return sources
+
+
+def _copy_contents(project_api, copies: list[tuple[File, dict]]):
+    """Copy stored contents to the storage of file resources on the server side."""
+    operations = [
+        SrcDst(src=StoragePath(path=source["path"]), dst=_remote_path(project_api, f))
+        for f, source in copies
+    ]
+    log.info(f"Copying content of {len(copies)} files on the server instead of uploading")
+    project_api.client.initialize_data_transfer_client()
+    dt_api = project_api.client.data_transfer_api
+    op = dt_api.wait_for([dt_api.copy(operations).id])[0]
+    if op.state != OperationState.Succeeded:
+        raise HPSError(f"Server side copy of file contents failed: {op.error}")
+    for f, source in copies:
+        f.hash = source["hash"]
+        f.size = source["size"]
+
+
+def _upload_deduplicated(
+    project_api,
+    files: list[File],
+    upload: Callable[[list[File]], None],
+    algorithm: str = HASH_ALGORITHM,
+    hash_index: MutableMapping[str, dict] | None = None,
+):
+    """Upload the sources of created file resources, copying already stored contents.
+
+    Contents already stored in the project, or found in the hash index, as well as
+    repeated contents within ``files`` are copied on the server side instead of being
+    uploaded. ``upload`` is called with the files whose content must be uploaded.
+    """
+    files = [f for f in files if _has_upload(f)]
+    digests = _hash_sources(files, algorithm)
+    sources = _find_existing_contents(project_api, digests, hash_index)
+
+    copies = []
+    repeated = []
+    first_upload = {}
+    for f, digest in zip(files, digests, strict=True):
+        if digest in sources:
+            copies.append((f, digest))
+            f.src = None
+        elif digest in first_upload:
+            repeated.append((f, digest))
+            f.src = None
+        else:
+            first_upload[digest] = f
+
+    log.info(
+        f"Uploading {len(first_upload)} of {len(files)} files, "
+        f"the other contents are already stored"
+    )
+    if first_upload:
+        upload(list(first_upload.values()))
+        for digest, f in first_upload.items():
+            sources[digest] = {
+                "path": _remote_path(project_api, f).path,
+                "hash": f.hash,
+                "size": f.size,
+            }
+            if hash_index is not None:
+                hash_index[digest] = sources[digest]
+
+    if copies or repeated:
+        _copy_contents(project_api, [(f, sources[d]) for f, d in copies + repeated])
+
+
+class _DownloadHandler(WaitHandler):
+    """Handles download operations.
+
+    Subclass the WaitHandler class to retain logging behavior
+    but add custom progress reporting.
+    """
+
+    def __init__(self, op_id: str, file_size: int, progress_handler: Callable[[int], None] = None):
+        super().__init__()
+        self.op_id = op_id
+        self.progress_handler = progress_handler
+        self.file_size = file_size
+
+    def __call__(self, ops: list[Operation]):
+        for op in ops:
+            if op.id == self.op_id and self.progress_handler is not None:
+                self.progress_handler(int(op.progress * self.file_size))
+        super().__call__(ops)
+
+
+class _BatchDownloadHandler(WaitHandler):
+    """Handles multiple download operations, reporting their aggregated progress.
+
+    ``op_sizes`` maps the ID of each operation to the number of bytes it transfers.
+    ``offset`` is the number of bytes transferred by previously completed operations.
+    """
+
+    def __init__(
+        self,
+        op_sizes: dict[str, int],
+        offset: int = 0,
+        progress_handler: Callable[[int], None] = None,
+    ):
+        super().__init__()
+        self.op_sizes = op_sizes
+        self.offset = offset
+        self.progress_handler = progress_handler
+
+    def __call__(self, ops: list[Operation]):
+        if self.progress_handler is not None:
+            done = sum(
+                int((op.progress or 0.0) * self.op_sizes.get(op.id, 0))
+                for op in ops
+                if op.id in self.op_sizes
+            )
+            self.progress_handler(self.offset + done)
+        super().__call__(ops)
+
+
+_LAYOUTS = ("flat", "by_id")
+
+
+def _local_path(file: File, target_dir: str, layout: str | Callable[[File], str]) -> str:
+    """Get the local path of a file according to the layout."""
+    if callable(layout):
+        return os.path.join(target_dir, layout(file))
+    if layout == "by_id":
+        return os.path.join(target_dir, file.id, file.evaluation_path)
+    return os.path.join(target_dir, file.evaluation_path)
+
+
+def _check_local_paths(files: list[File], target_dir: str, layout: str | Callable[[File], str]):
+    """Raise an error if different files would be saved to the same local path."""
+    owners = {}
+    for f in files:
+        path = os.path.normpath(_local_path(f, target_dir, layout))
+        owner = owners.setdefault(path, f)
+        if owner is not f and owner.id != f.id:
+            raise ClientError(
+                f"Files {owner.id} and {f.id} would both be saved to '{path}', "
+                f"use the 'by_id' layout or a callable layout to keep them apart."
+            )
+
+
+def _remote_path(project_api, file: File) -> StoragePath:
+    """Get the path of the content of a file in the project storage."""
+    return StoragePath(path=f"{project_api.project_id}/{os.path.basename(file.storage_id)}")
+
+
+def _file_size(file: File) -> int:
+    size = getattr(file, "size", None)
+    return size if isinstance(size, int) else 0
+
+
+def _split_into_operations(files: list[File], num_operations: int) -> list[list[File]]:
+    """Distribute files into groups of similar total size, largest files first."""
+    groups = [[] for _ in range(num_operations)]
+    sizes = [0] * num_operations
+    for f in sorted(files, key=_file_size, reverse=True):
+        i = sizes.index(min(sizes))
+        groups[i].append(f)
+        sizes[i] += _file_size(f)
+    return [g for g in groups if g]
+
+
+def _start_download(
+    project_api, dt_api, files: list[File], target_dir: str, layout: str | Callable[[File], str]
+):
+    """Start a data transfer operation downloading the contents of files."""
+    operations = []
+    for f in files:
+        path = _local_path(f, target_dir, layout)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        operations.append(
+            SrcDst(src=_remote_path(project_api, f), dst=StoragePath(path=path, remote="local"))
+        )
+    return dt_api.copy(operations)
+
+
+def _record_outcome(
+    results: dict, op: Operation, files: list[File], target_dir: str, layout
+) -> None:
+    """Record the outcome of a download operation for each of its files."""
+    for f in files:
+        path = _local_path(f, target_dir, layout)
+        if op.state == OperationState.Succeeded:
+            results[id(f)] = FileTransferResult(f, path, True)
+        else:
+            # Files of a failed operation may be missing, partial or stale copies
+            error = op.error or f"Download operation {op.id} failed"
+            results[id(f)] = FileTransferResult(f, path, False, error)
+
+
+def download_files(
+    project_api,
+    files: list[File],
+    target_dir: str,
+    layout: str | Callable[[File], str] = "flat",
+    max_in_flight: int = 4,
+    max_files_per_operation: int = 1000,
+    progress_handler: Callable[[int], None] = None,
+    verify: bool = False,
+) -> list[FileTransferResult]:
+    """Download many files with a few concurrent data transfer operations."""
+    if not callable(layout) and layout not in _LAYOUTS:
+        raise ClientError(f"Unknown layout '{layout}', expected one of {_LAYOUTS} or a callable.")
+
+    _check_local_paths(
+        [f for f in files if isinstance(getattr(f, "storage_id", None), str) and f.storage_id],
+        target_dir,
+        layout,
+    )
+
+    cache = getattr(project_api, "download_cache", None)
+    results = {}
+    transfers = []
+    for f in files:
+        if getattr(f, "access_mode", None) == FileAccessMode.direct_access.value:
+            results[id(f)] = FileTransferResult(f, None, False, "File is in direct access mode.")
+        elif not isinstance(getattr(f, "storage_id", None), str) or not f.storage_id:
+            results[id(f)] = FileTransferResult(f, None, False, "File has no stored content.")
+        elif cache is not None and cache.fetch(f, _local_path(f, target_dir, layout)):
+            results[id(f)] = FileTransferResult(f, _local_path(f, target_dir, layout), True)
+        else:
+            transfers.append(f)
+
+    if transfers:
+        project_api.client.initialize_data_transfer_client()
+        dt_api = project_api.client.data_transfer_api
+
+        num_operations = max(max_in_flight, -(-len(transfers) // max_files_per_operation))
+        groups = _split_into_operations(transfers, num_operations)
+        log.info(f"Downloading {len(transfers)} files with {len(groups)} operations")
+
+        if progress_handler is not None:
+            progress_handler(0)
+        offset = 0
+        retries = []
+        for start in range(0, len(groups), max_in_flight):
+            wave = groups[start : start + max_in_flight]
+            op_sizes = {}
+            op_groups = {}
+            for group in wave:
+                op = _start_download(project_api, dt_api, group, target_dir, layout)
+                op_sizes[op.id] = sum(_file_size(f) for f in group)
+                op_groups[op.id] = group
+
+            handler = _BatchDownloadHandler(op_sizes, offset, progress_handler)
+            ops = dt_api.wait_for(list(op_sizes), handler=handler)
+            offset += sum(op_sizes.values())
+            if progress_handler is not None:
+                progress_handler(offset)
+
+            for op in ops:
+                group = op_groups.get(op.id, [])
+                if op.state != OperationState.Succeeded and len(group) > 1:
+                    # Retry the files of the failed operation one by one, so that
+                    # a single failure does not fail the whole group
+                    retries.extend(group)
+                else:
+                    _record_outcome(results, op, group, target_dir, layout)
+
+        if retries:
+            log.info(f"Retrying {len(retries)} files of failed operations one by one")
+        for start in range(0, len(retries), max_in_flight):
+            op_groups = {}
+            for f in retries[start : start + max_in_flight]:
+                op = _start_download(project_api, dt_api, [f], target_dir, layout)
+                op_groups[op.id] = [f]
+            for op in dt_api.wait_for(list(op_groups)):
+                _record_outcome(results, op, op_groups.get(op.id, []), target_dir, layout)
+
+        downloaded = [results[id(f)] for f in transfers if results[id(f)].success]
+        if verify:
+            _verify_downloads(downloaded)
+        if cache is not None:
+            for r in downloaded:
+                if r.success:
+                    cache.store(r.file, r.path)
+
+    failed = [r for r in results.values() if not r.success]
+    if failed:
+        log.warning(f"Download of {len(failed)} of {len(files)} files failed")
+    return [results[id(f)] for f in files]
+
+
+class FileContents:
+    """Downloaded contents of file resources, stored on disk instead of in memory.
+
+    Contents are downloaded to a temporary directory when the object is created.
+    They can then be opened as file handles or mapped in memory, which avoids
+    copying large files into memory. Open handles and memory maps are closed and
+    the temporary directory is removed by :meth:`close`, which is called when
+    leaving the context manager.
+
+    Use :meth:`ProjectApi.open_files` to create instances.
+
+    Examples
+    --------
+    >>> files = project_api.get_files(type="text/plain")
+    >>> with project_api.open_files(files) as contents:
+    ...     for f in files:
+    ...         with contents.open(f) as fh:
+    ...             header = fh.readline()
+    ...         data = contents.mmap(f)
+    ...         magic = data[:4]
+
+    """
+
+    def __init__(self, project_api, files: list[File], max_in_flight: int = 4):
+        """Download the contents of files to a temporary directory."""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._handles: list[IO] = []
+        self._maps: list[mmap.mmap] = []
+        self._results = {}
+        try:
+            results = download_files(
+                project_api,
+                files,
+                self._temp_dir.name,
+                layout="by_id",
+                max_in_flight=max_in_flight,
+            )
+        except Exception:
+            self._temp_dir.cleanup()
+            raise
+        self._results = {r.file.id: r for r in results}
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the contents on exit."""
+        self.close()
+
+    @property
+    def results(self) -> list[FileTransferResult]:
+        """Outcome of the download of each file."""
+        return list(self._results.values())
+
+    def path(self, file: File) -> str:
+        """Get the local path of the content of a file."""
+        result = self._results.get(file.id)
+        if result is None:
+            raise ClientError(f"File {file.id} is not part of the downloaded contents.")
+        if not result.success:
+            raise HPSError(f"Content of file {file.id} is not available: {result.error}")
+        return result.path
+
+    def open(self, file: File, mode: str = "rb") -> IO:
+        """Open the content of a file for reading.
+
+        The handle can be used as a context manager, and is otherwise closed by :meth:`close`.
+        """
+        if any(c in mode for c in "wax+"):
+            raise ClientError("File contents can only be opened for reading.")
+        handle = open(self.path(file), mode)
+        self._handles.append(handle)
+        return handle
+
+    def mmap(self, file: File) -> mmap.mmap | memoryview:
+        """Map the content of a file in memory, read-only.
+
+        Slicing the returned map copies data. Use ``memoryview`` on it for zero-copy
+        access, and release views before calling :meth:`close`. An empty memoryview
+        is returned for empty files, which cannot be mapped.
+        """
+        path = self.path(file)
+        if os.path.getsize(path) == 0:
+            return memoryview(b"")
+        with open(path, "rb") as fh:
+            m = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(m)
+        return m
+
+    def read(self, file: File) -> bytes:
+        """Read the whole content of a file into memory."""
+        with self.open(file) as fh:
+            return fh.read()
+
+    def close(self):
+        """Close open handles and memory maps, and remove the downloaded contents."""
+        for handle in self._handles:
+            handle.close()
+        for m in self._maps:
+            try:
+                m.close()
+            except BufferError:
+                log.warning("A memory map is still referenced by a memoryview and stays open.")
+        self._handles.clear()
+        self._maps.clear()
+        self._temp_dir.cleanup()
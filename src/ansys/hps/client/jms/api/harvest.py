@@ -0,0 +1,117 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module collecting output files of many jobs in bulk."""
+
+import fnmatch
+import logging
+import os
+from collections.abc import Callable
+
+from ansys.hps.client.exceptions import ClientError
+from ansys.hps.client.jms.resource import File, Job, Task
+
+from .base import get_objects
+from .file_transfer import FileTransferResult, download_files
+
+log = logging.getLogger(__name__)
+
+_FILE_FIELDS = [
+    "id",
+    "name",
+    "type",
+    "storage_id",
+    "size",
+    "hash",
+    "evaluation_path",
+    "access_mode",
+]
+
+
+def _job_ids(project_api, job_filter: dict | list[Job | str] | None) -> list[str] | None:
+    """Get the IDs of the jobs to harvest, ``None`` for all jobs."""
+    if job_filter is None:
+        return None
+    if isinstance(job_filter, dict):
+        jobs = get_objects(
+            project_api.client.session, project_api.url, Job, fields=["id"], **job_filter
+        )
+        return [j.id for j in jobs]
+    return [j if isinstance(j, str) else j.id for j in job_filter]
+
+
+def harvest_outputs(
+    project_api,
+    job_filter: dict | list[Job | str] | None,
+    evaluation_path_glob: str | list[str],
+    target_dir: str,
+    max_in_flight: int = 4,
+    file_type: str | list[str] | None = None,
+    progress_handler: Callable[[int], None] = None,
+) -> list[FileTransferResult]:
+    """Download the output files of many jobs matching evaluation path patterns."""
+    if isinstance(evaluation_path_glob, str):
+        evaluation_path_glob = [evaluation_path_glob]
+    patterns = list(evaluation_path_glob)
+    if not patterns:
+        raise ClientError("At least one evaluation path pattern is required.")
+
+    session = project_api.client.session
+    url = project_api.url
+
+    job_ids = _job_ids(project_api, job_filter)
+    if job_ids is not None and not job_ids:
+        return []
+
+    # (1) Output files of the tasks of all jobs, in one query
+    task_params = {"fields": ["id", "job_id", "output_file_ids"]}
+    if job_ids is not None:
+        task_params["job_id"] = job_ids
+    tasks = get_objects(session, url, Task, **task_params)
+    job_of_file = {id: t.job_id for t in tasks for id in t.output_file_ids or [] if id}
+    if not job_of_file:
+        return []
+
+    # (2) File resources by ID, narrowed on the server side where possible
+    file_params = {"id": list(job_of_file), "fields": _FILE_FIELDS}
+    if file_type is not None:
+        file_params["type"] = file_type
+    if not any(c in p for p in patterns for c in "*?["):
+        # Exact evaluation paths
+        file_params["evaluation_path"] = patterns
+    files = [
+        f
+        for f in get_objects(session, url, File, **file_params)
+        if isinstance(f.evaluation_path, str)
+        and any(fnmatch.fnmatch(f.evaluation_path, p) for p in patterns)
+    ]
+    log.info(f"Harvesting {len(files)} output files of {len(set(job_of_file.values()))} jobs")
+
+    # (3) Batched downloads into <target_dir>/<job id>/<evaluation path>
+    return download_files(
+        project_api,
+        files,
+        target_dir,
+        layout=lambda f: os.path.join(job_of_file[f.id], f.evaluation_path),
+        max_in_flight=max_in_flight,
+        progress_handler=progress_handler,
+    )
@@ -22,20 +22,34 @@
 
 """Module wrapping around the JMS root endpoints."""
 
+import functools
 import json
 import logging
 import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import backoff
-from ansys.hps.data_transfer.client.models import OperationState, SrcDst, StoragePath
+from ansys.hps.data_transfer.client.models import OperationState, StoragePath
 
 from ansys.hps.client.check_version import JMS_VERSIONS, HpsRelease, version_required
 from ansys.hps.client.client import Client
 from ansys.hps.client.common import Object
 from ansys.hps.client.exceptions import HPSError
-from ansys.hps.client.jms.resource import Operation, Permission, Project, TaskDefinitionTemplate
+from ansys.hps.client.jms.resource import (
+    Job,
+    Operation,
+    Permission,
+    Project,
+    TaskDefinitionTemplate,
+)
+from ansys.hps.client.jms.schema.job import valid_eval_status
 from ansys.hps.client.jms.schema.project import ProjectSchema
 
+from .archive_transfer import RestoreResult, transfer_archive
 from .base import copy_objects as base_copy_objects
 from .base import create_objects, delete_objects, get_object, get_objects, update_objects
 
@@ -68,6 +82,8 @@ class JmsApi:
         """Initialize JMS API."""
         self.client = client
         self._api_info = None
+        self._job_count_cache: dict[tuple[str, str], tuple[float, int]] = {}
+        self._job_count_cache_lock = threading.Lock()
 
     @property
     def url(self) -> str:
@@ -126,16 +142,111 @@ class JmsApi:
         return delete_project(self.client, self.url, project)
 
     @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
-    def restore_project(self, path: str) -> Project:
+    def restore_project(
+        self,
+        path: str,
+        progress_handler: Callable[[int], None] = None,
+        verify: bool = True,
+        max_retries: int = 3,
+    ) -> Project:
         """Restore a project from an archive.
 
         Parameters
         ----------
         path : str
             Path of the archive file.
+        progress_handler : Callable[[int], None], optional
+            Function to handle progress updates. The function should accept a single
+            argument, which is the number of bytes of the archive uploaded.
+            The default is ``None``.
+        verify : bool, optional
+            Whether to verify the checksum of the uploaded archive. The default is ``True``.
+        max_retries : int, optional
+            Maximum number of times a failed upload is retried from the start, as
+            partial uploads cannot be resumed.
+            The default is ``3``.
+
+        """
+        return _restore_project(self, path, progress_handler, verify, max_retries)
+
+    @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
+    def restore_projects(
+        self,
+        paths: list[str],
+        max_workers: int = 4,
+        progress_handler: Callable[[str, int], None] = None,
+        verify: bool = True,
+        max_retries: int = 3,
+    ) -> list[RestoreResult]:
+        """Restore several projects from archives concurrently.
+
+        A failed archive does not stop the others. Check the returned results to
+        find the restored projects and the archives that failed.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths of the archive files.
+        max_workers : int, optional
+            Maximum number of archives uploaded and restored concurrently.
+            The default is ``4``.
+        progress_handler : Callable[[str, int], None], optional
+            Function to handle progress updates. The function should accept two
+            arguments, the path of an archive and the number of its bytes uploaded.
+            The default is ``None``.
+        verify : bool, optional
+            Whether to verify the checksums of the uploaded archives. The default is ``True``.
+        max_retries : int, optional
+            Maximum number of times a failed upload is retried from the start, as
+            partial uploads cannot be resumed.
+            The default is ``3``.
+
+        Returns
+        -------
+        list[RestoreResult]
+            Outcome of the restoration of each archive, in the order of ``paths``.
 
         """
-        return _restore_project(self, path)
+        return _restore_projects(self, paths, max_workers, progress_handler, verify, max_retries)
+
+    def get_projects_status_summary(
+        self,
+        projects: list[Project | str],
+        statuses: list[str] = None,
+        max_workers: int = 16,
+        cache_ttl: float = 10.0,
+    ) -> dict[str, dict[str, int]]:
+        """Get the number of jobs per evaluation status for multiple projects.
+
+        The count queries are sent concurrently. Counts are cached for ``cache_ttl``
+        seconds, so that dashboards can refresh frequently without overloading the JMS.
+
+        Parameters
+        ----------
+        projects : list[Project | str]
+            Projects or project IDs to summarize.
+        statuses : list[str], optional
+            Evaluation statuses to count. The default is all job evaluation statuses.
+        max_workers : int, optional
+            Maximum number of concurrent count queries. The default is ``16``.
+        cache_ttl : float, optional
+            Time in seconds that counts are reused. The default is ``10.0``.
+            Use ``0`` to bypass the cache.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Number of jobs per status, keyed by project ID.
+
+        Examples
+        --------
+        >>> projects = jms_api.get_projects(active=True, fields=["id"])
+        >>> summary = jms_api.get_projects_status_summary(projects, ["running", "failed"])
+        >>> summary[projects[0].id]["running"]
+        12
+
+        """
+        return _get_projects_status_summary(self, projects, statuses, max_workers, cache_ttl)
 
     ################################################################
     # Task Definition Templates
@@ -345,6 +456,56 @@ def delete_project(client, api_url, project):
     _ = client.session.delete(url)
 
 
+def _get_projects_status_summary(
+    jms_api: JmsApi,
+    projects: list[Project | str],
+    statuses: list[str] = None,
+    max_workers: int = 16,
+    cache_ttl: float = 10.0,
+) -> dict[str, dict[str, int]]:
+    """Count jobs per status for multiple projects with concurrent queries."""
+    project_ids = [p if isinstance(p, str) else p.id for p in projects]
+    statuses = statuses or valid_eval_status
+
+    summary = {project_id: {} for project_id in project_ids}
+    queries = []
+    now = time.monotonic()
+    with jms_api._job_count_cache_lock:
+        for project_id in project_ids:
+            for status in statuses:
+                cached = jms_api._job_count_cache.get((project_id, status))
+                if cached is not None and now - cached[0] < cache_ttl:
+                    summary[project_id][status] = cached[1]
+                else:
+                    queries.append((project_id, status))
+
+    def _count(query):
+        project_id, status = query
+        return get_objects(
+            jms_api.client.session,
+            f"{jms_api.url}/projects/{project_id}",
+            Job,
+            count=True,
+            eval_status=status,
+        )
+
+    if queries:
+        log.debug(f"Querying {len(queries)} job counts")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = list(executor.map(_count, queries))
+        now = time.monotonic()
+        with jms_api._job_count_cache_lock:
+            for (project_id, status), count in zip(queries, counts, strict=True):
+                summary[project_id][status] = count
+                jms_api._job_count_cache[(project_id, status)] = (now, count)
+
+    # Keep the requested status order in each row
+    return {
+        project_id: {status: row[status] for status in statuses}
+        for project_id, row in summary.items()
+    }
+
+
 def _monitor_operation(
     jms_api: JmsApi, operation_id: str, max_value: float = 5.0, max_time: float = None
 ) -> Operation:
@@ -389,7 +550,47 @@ def _copy_objects(
     return op.result["destination_ids"]
 
 
-def _restore_project(jms_api, archive_path):
+def _restore_projects(
+    jms_api: JmsApi,
+    archive_paths: list[str],
+    max_workers: int = 4,
+    progress_handler: Callable[[str, int], None] = None,
+    verify: bool = True,
+    max_retries: int = 3,
+) -> list[RestoreResult]:
+    """Restore archived projects concurrently."""
+
+    def restore(path):
+        handler = None
+        if progress_handler is not None:
+            handler = functools.partial(progress_handler, path)
+        return _restore_project(jms_api, path, handler, verify, max_retries)
+
+    # Initialize the shared data transfer client once, before the workers use it
+    jms_api.client.initialize_data_transfer_client()
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(path, executor.submit(restore, path)) for path in archive_paths]
+        for path, future in futures:
+            try:
+                results.append(RestoreResult(path, future.result(), True))
+            except Exception as e:
+                log.error(f"Failed to restore project from archive {path}: {e}")
+                results.append(RestoreResult(path, None, False, str(e)))
+
+    failed = [r for r in results if not r.success]
+    if failed:
+        log.warning(f"Restoration of {len(failed)} of {len(archive_paths)} archives failed")
+    return results
+
+
+def _restore_project(
+    jms_api,
+    archive_path,
+    progress_handler: Callable[[int], None] = None,
+    verify: bool = True,
+    max_retries: int = 3,
+):
     """Restore an archived project."""
     if not os.path.exists(archive_path):
         raise HPSError(f"Project archive: path does not exist {archive_path}")
@@ -404,8 +605,35 @@ def _restore_project(jms_api, archive_path):
         msg += f" Request response: {r.json()}"
         raise HPSError(f"{msg}")
     bucket = r.json()["project_dir"][0]
-    _upload_archive(jms_api, archive_path, bucket)
+    try:
+        # The bucket is new, there is nothing to skip. Retries reuse it.
+        transfer_archive(
+            jms_api.client,
+            archive_path,
+            f"{bucket}/{os.path.basename(archive_path)}",
+            upload=True,
+            progress_handler=progress_handler,
+            verify=verify,
+            max_retries=max_retries,
+            skip_existing=False,
+        )
+        project_id = _restore_uploaded_archive(jms_api, archive_path, bucket)
+    finally:
+        # Delete archive file on server
+        log.info(f"Delete temporary bucket {bucket}")
+        op = jms_api.client.data_transfer_api.rmdir([StoragePath(path=bucket)])
+        op = jms_api.client.data_transfer_api.wait_for([op.id])
+        if op[0].state != OperationState.Succeeded:
+            if sys.exc_info()[0] is None:
+                raise HPSError(f"Delete temporary bucket {bucket} failed")
+            # Do not hide the error of the restoration
+            log.warning(f"Delete temporary bucket {bucket} failed")
 
+    return get_project(jms_api.client, jms_api.url, project_id)
+
+
+def _restore_uploaded_archive(jms_api, archive_path: str, bucket: str) -> str:
+    """Restore a project from an archive uploaded to a bucket and get its ID."""
     # POST restore request
     log.info(f"Restoring archive {archive_path}")
     url = f"{jms_api.url}/projects/archive"
@@ -425,30 +653,7 @@ def _restore_project(jms_api, archive_path):
 
     project_id = op.result["project_id"]
     log.info(f"Done restoring project, project_id = '{project_id}'")
-
-    # Delete archive file on server
-    log.info(f"Delete temporary bucket {bucket}")
-    op = jms_api.client.data_transfer_api.rmdir([StoragePath(path=bucket)])
-    op = jms_api.client.data_transfer_api.wait_for([op.id])
-    if op[0].state != OperationState.Succeeded:
-        raise HPSError(f"Delete temporary bucket {bucket} failed")
-
-    return get_project(jms_api.client, jms_api.url, project_id)
-
-
-def _upload_archive(jms_api: JmsApi, archive_path, bucket):
-    """Uploads archive using data transfer worker."""  # noqa: D401
-    jms_api.client.initialize_data_transfer_client()
-
-    src = StoragePath(path=archive_path, remote="local")
-    dst = StoragePath(path=f"{bucket}/{os.path.basename(archive_path)}")
-
-    op = jms_api.client.data_transfer_api.copy([SrcDst(src=src, dst=dst)])
-    op = jms_api.client.data_transfer_api.wait_for(op.id)
-
-    log.info(f"Operation {op[0].state}")
-    if op[0].state != OperationState.Succeeded:
-        raise HPSError(f"Upload of archive {archive_path} failed")
+    return project_id
 
 
 def _get_storages(client: Client, api_url: str) -> list[dict]:
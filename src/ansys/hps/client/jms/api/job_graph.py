@@ -0,0 +1,115 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module loading jobs together with their tasks and files in bulk."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ansys.hps.client.exceptions import ClientError
+from ansys.hps.client.jms.resource import File, Job, Task
+
+from .base import get_objects
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskNode:
+    """Task linked to its input and output file resources."""
+
+    task: Task
+    input_files: list[File] = field(default_factory=list)
+    output_files: list[File] = field(default_factory=list)
+
+
+@dataclass
+class JobNode:
+    """Job linked to its tasks."""
+
+    job: Job
+    tasks: list[TaskNode] = field(default_factory=list)
+
+
+def get_job_graph(
+    project_api, jobs: list[Job | str], include: list[str] = ("tasks", "files")
+) -> list[JobNode]:
+    """Load jobs with their tasks and files using one bulk query per collection."""
+    include = set(include)
+    unknown = include - {"tasks", "files"}
+    if unknown:
+        raise ClientError(f"Unknown job graph collections: {sorted(unknown)}")
+    if "files" in include:
+        include.add("tasks")
+
+    job_ids = [j if isinstance(j, str) else j.id for j in jobs]
+    if not job_ids:
+        return []
+
+    session = project_api.client.session
+    url = project_api.url
+    job_objects = [j for j in jobs if not isinstance(j, str)]
+
+    # Jobs given as IDs and tasks of all jobs are independent queries
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        jobs_future = None
+        if len(job_objects) < len(job_ids):
+            jobs_future = executor.submit(get_objects, session, url, Job, id=job_ids)
+        tasks_future = None
+        if "tasks" in include:
+            tasks_future = executor.submit(get_objects, session, url, Task, job_id=job_ids)
+        if jobs_future is not None:
+            job_objects = jobs_future.result()
+        tasks = tasks_future.result() if tasks_future is not None else []
+
+    files_by_id = {}
+    if "files" in include:
+        file_ids = list(
+            dict.fromkeys(
+                id
+                for t in tasks
+                for id in (t.input_file_ids or []) + (t.output_file_ids or [])
+                if id
+            )
+        )
+        if file_ids:
+            files_by_id = {f.id: f for f in get_objects(session, url, File, id=file_ids)}
+
+    nodes = {j.id: JobNode(job=j) for j in job_objects}
+    for t in tasks:
+        node = nodes.get(t.job_id)
+        if node is None:
+            continue
+        node.tasks.append(
+            TaskNode(
+                task=t,
+                input_files=[files_by_id[id] for id in t.input_file_ids or [] if id in files_by_id],
+                output_files=[
+                    files_by_id[id] for id in t.output_file_ids or [] if id in files_by_id
+                ],
+            )
+        )
+    log.debug(f"Loaded graph of {len(nodes)} jobs, {len(tasks)} tasks, {len(files_by_id)} files")
+
+    # Keep the order of the requested jobs
+    return [nodes[id] for id in job_ids if id in nodes]
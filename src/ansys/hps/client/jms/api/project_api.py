@@ -22,16 +22,15 @@
 
 """Module exposing the project endpoints of the JMS."""
 
-import io
 import json
 import logging
 import os
 import tempfile
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 
-from ansys.hps.data_transfer.client.api.handler import WaitHandler
-from ansys.hps.data_transfer.client.models import Operation, OperationState, SrcDst, StoragePath
+from ansys.hps.data_transfer.client.models import OperationState, SrcDst, StoragePath
 
 from ansys.hps.client.check_version import (
     JMS_VERSIONS,
@@ -63,8 +62,23 @@ from ansys.hps.client.jms.schema.file import FileAccessMode
 from ansys.hps.client.rms.api import RmsApi
 from ansys.hps.client.rms.models import AnalyzeRequirements, AnalyzeResponse
 
-from .base import create_objects, delete_objects, get_objects, update_objects
+from .archive_transfer import transfer_archive
+from .base import UpdateBuffer, create_objects, delete_objects, get_objects, update_objects
+from .checksum import HASH_ALGORITHM, compute_checksum, is_comparable
+from .directory_sync import SyncResult, sync_directory
+from .download_cache import DownloadCache
+from .file_transfer import (
+    FileContents,
+    FileTransferResult,
+    _DownloadHandler,
+    _local_source_path,
+    _skip_unchanged_uploads,
+    _upload_deduplicated,
+    download_files,
+)
+from .harvest import harvest_outputs
 from .jms_api import JmsApi, _copy_objects
+from .job_graph import JobNode, get_job_graph
 
 log = logging.getLogger(__name__)
 
@@ -78,6 +92,8 @@ class ProjectApi:
         HPS client object.
     project_id : str
         ID of the project.
+    download_cache : DownloadCache, optional
+        Local cache consulted before downloading file contents. The default is ``None``.
 
     Examples
     --------
@@ -109,10 +125,13 @@ class ProjectApi:
 
     """
 
-    def __init__(self, client: Client, project_id: str):
+    def __init__(
+        self, client: Client, project_id: str, download_cache: DownloadCache | None = None
+    ):
         """Initialize project API."""
         self.client = client
         self.project_id = project_id
+        self.download_cache = download_cache
         self._jms_api = JmsApi(self.client)
 
     @property
@@ -141,7 +160,14 @@ class ProjectApi:
             return r
 
     @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
-    def archive_project(self, path: str, include_job_files: bool = True):
+    def archive_project(
+        self,
+        path: str,
+        include_job_files: bool = True,
+        progress_handler: Callable[[int], None] = None,
+        verify: bool = True,
+        max_retries: int = 3,
+    ):
         """Archive a project and save it to disk.
 
         Parameters
@@ -150,6 +176,16 @@ class ProjectApi:
             Path for saving the archive locally.
         include_job_files : bool, optional
             Whether to include job files in the archive. The default is ``True``.
+        progress_handler : Callable[[int], None], optional
+            Function to handle progress updates. The function should accept a single
+            argument, which is the number of bytes of the archive downloaded.
+            The default is ``None``.
+        verify : bool, optional
+            Whether to verify the checksum of the downloaded archive. The default is ``True``.
+        max_retries : int, optional
+            Maximum number of times a failed download is retried from the start, as
+            partial downloads cannot be resumed. An archive completely downloaded to
+            ``path`` by a previous call is not downloaded again. The default is ``3``.
 
         Returns
         -------
@@ -157,7 +193,14 @@ class ProjectApi:
             Path to the archive.
 
         """
-        return archive_project(self, path, include_job_files)
+        return archive_project(
+            self,
+            path,
+            include_job_files,
+            progress_handler=progress_handler,
+            verify=verify,
+            max_retries=max_retries,
+        )
 
     ################################################################
     # Files
@@ -165,7 +208,8 @@ class ProjectApi:
         """Get a list of file resources, optionally filtered by query parameters.
 
         If ``content=True``, each file's content is also downloaded and stored in memory
-        as the :attr:`ansys.hps.client.jms.File.content` attribute.
+        as the :attr:`ansys.hps.client.jms.File.content` attribute. For large files,
+        use :meth:`open_files` instead, which keeps contents on disk.
         """
         if content:
             min_v = JMS_VERSIONS[HpsRelease.v1_2_0]
@@ -179,13 +223,115 @@ class ProjectApi:
 
         return get_files(self, as_objects=as_objects, content=content, **query_params)
 
-    def create_files(self, files: list[File], as_objects=True) -> list[File]:
-        """Create a list of files."""
-        return create_files(self, files, as_objects=as_objects)
+    @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
+    def open_files(
+        self, files: list[File] = None, max_in_flight: int = 4, **query_params
+    ) -> FileContents:
+        """Download file contents to disk and give access to them without loading them in memory.
+
+        Parameters
+        ----------
+        files : list[File], optional
+            Files whose contents to download. If ``None``, files are queried
+            using ``query_params``.
+        max_in_flight : int, optional
+            Maximum number of concurrent data transfer operations. The default is ``4``.
+        query_params : dict, optional
+            Query parameters used to get the files if ``files`` is not provided.
+
+        Returns
+        -------
+        FileContents
+            Context manager giving access to file handles or memory maps of the contents.
+            The downloaded contents are removed when it is closed.
+
+        Examples
+        --------
+        >>> with project_api.open_files(type="application/octet-stream") as contents:
+        ...     for result in contents.results:
+        ...         data = contents.mmap(result.file)
+
+        """
+        if files is None:
+            files = self.get_files(**query_params)
+        return FileContents(self, files, max_in_flight=max_in_flight)
+
+    def create_files(
+        self,
+        files: list[File],
+        as_objects=True,
+        dedup: bool = False,
+        hash_index: MutableMapping[str, dict] = None,
+        chunk_size: int | None = None,
+        max_uploads: int = 2,
+        max_updates: int = 1,
+    ) -> list[File]:
+        """Create a list of files.
+
+        Parameters
+        ----------
+        files : list[File]
+            Files to create. Contents of files with a ``src`` are uploaded.
+        as_objects : bool, optional
+            Whether to return files as objects. The default is ``True``.
+        dedup : bool, optional
+            Whether to avoid uploading contents that are already stored. Sources are
+            hashed locally, in parallel, and compared with the ``hash`` of the project's
+            file resources and with ``hash_index``. Matching contents, as well as repeated
+            contents within ``files``, are copied on the server side instead of being
+            uploaded. The default is ``False``.
+        hash_index : MutableMapping[str, dict], optional
+            Index of stored contents keyed by local hash, such as a dictionary or a
+            ``shelve`` object, reused across calls and projects when ``dedup=True``.
+            It must support concurrent access if several chunks are uploaded concurrently.
+            Uploaded contents are added to it.
+        chunk_size : int, optional
+            Number of files per chunk. If given, files are processed in chunks and the
+            stages of consecutive chunks overlap: the contents of a chunk are uploaded
+            while the metadata of the previous chunk is fetched and its resources are
+            updated in JMS. The default is ``None``, in which case all files are processed
+            at once.
+        max_uploads : int, optional
+            Maximum number of chunks uploaded concurrently. The default is ``2``.
+        max_updates : int, optional
+            Maximum number of chunks whose metadata is fetched and whose resources are
+            updated concurrently. The default is ``1``.
+
+        Examples
+        --------
+        >>> files = [File(name=f"in_{i}", evaluation_path=f"in_{i}.dat", src=f"in_{i}.dat")
+        ...          for i in range(5000)]
+        >>> files = project_api.create_files(files, chunk_size=500, max_uploads=3)
+
+        """
+        return create_files(
+            self,
+            files,
+            as_objects=as_objects,
+            dedup=dedup,
+            hash_index=hash_index,
+            chunk_size=chunk_size,
+            max_uploads=max_uploads,
+            max_updates=max_updates,
+        )
+
+    def update_files(self, files: list[File], as_objects=True, skip_unchanged: bool = False):
+        """Update files.
 
-    def update_files(self, files: list[File], as_objects=True):
-        """Update files."""
-        return update_files(self, files, as_objects=as_objects)
+        Parameters
+        ----------
+        files : list[File]
+            Files to update. Contents of files with a ``src`` are uploaded.
+        as_objects : bool, optional
+            Whether to return files as objects. The default is ``True``.
+        skip_unchanged : bool, optional
+            Whether to skip the upload of local files whose size and checksum match the
+            ``size`` and ``hash`` of the file resource. Checksums are computed in parallel
+            with :data:`HASH_ALGORITHM`, which must match the algorithm of the server.
+            The default is ``False``.
+
+        """
+        return update_files(self, files, as_objects=as_objects, skip_unchanged=skip_unchanged)
 
     def delete_files(self, files: list[File]):
         """Delete files."""
@@ -198,6 +344,7 @@ class ProjectApi:
         target_path: str,
         progress_handler: Callable[[int], None] = None,
         file_name: str = None,
+        verify: bool = False,
         **kwargs,
     ) -> str:
         """Download file content and save it to disk.
@@ -214,6 +361,9 @@ class ProjectApi:
             size of the downloaded file in bytes.
         file_name : str, optional
             Name of the file to save. If None, the original file name is used.
+        verify : bool, optional
+            Whether to verify the checksum of the downloaded file against its ``hash``.
+            The default is ``False``.
         kwargs : dict, optional
             Additional arguments to pass to the download function.
             The 'stream' argument is deprecated and should not be used.
@@ -221,14 +371,208 @@ class ProjectApi:
         Returns
         -------
         str
-            Path to the downloaded file.
+            Path to the downloaded file, ``None`` if the download or the verification failed.
 
         """
         if "stream" in kwargs:
             msg = "The 'stream' input argument in ProjectApi.download_file() is deprecated. "
             warnings.warn(msg, DeprecationWarning, stacklevel=2)
             log.warning(msg)
-        return _download_file(self, file, target_path, progress_handler, file_name)
+        return _download_file(self, file, target_path, progress_handler, file_name, verify)
+
+    @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
+    def download_files(
+        self,
+        files: list[File],
+        target_dir: str,
+        layout: str | Callable[[File], str] = "flat",
+        max_in_flight: int = 4,
+        max_files_per_operation: int = 1000,
+        progress_handler: Callable[[int], None] = None,
+        verify: bool = False,
+    ) -> list[FileTransferResult]:
+        """Download the content of many files and save it to disk.
+
+        Files are grouped into a few large data transfer operations of similar total
+        size, which run concurrently. The files of a failed operation are retried one by
+        one, and a failed file does not abort the download of the other files.
+
+        Parameters
+        ----------
+        files : list[File]
+            File objects to download.
+        target_dir : str
+            Path to the directory where to save the files.
+        layout : str or Callable[[File], str], optional
+            Layout of the downloaded files in ``target_dir``. ``"flat"`` saves files
+            under their evaluation path. ``"by_id"`` saves files under
+            ``<file id>/<evaluation path>``. A callable returns the relative path of a
+            file. A ``ClientError`` is raised if different files would be saved to the
+            same path, such as files of several jobs sharing an evaluation path in the
+            flat layout. The default is ``"flat"``.
+        max_in_flight : int, optional
+            Maximum number of concurrent data transfer operations. The default is ``4``.
+        max_files_per_operation : int, optional
+            Maximum number of files per data transfer operation. The default is ``1000``.
+        progress_handler : Callable[[int], None], optional
+            Function to handle progress updates. The function should accept a single
+            argument, which is the number of bytes downloaded across all files.
+            The default is ``None``.
+        verify : bool, optional
+            Whether to verify the checksums of the downloaded files against their
+            ``hash``, in parallel. Files that do not match are reported as failed.
+            The default is ``False``.
+
+        Returns
+        -------
+        list[FileTransferResult]
+            Outcome of the download of each file, in the order of ``files``.
+
+        Examples
+        --------
+        >>> files = project_api.get_files(type="image/jpeg")
+        >>> results = project_api.download_files(files, "images", layout="by_id")
+        >>> failed = [r.file for r in results if not r.success]
+
+        """
+        return download_files(
+            self,
+            files,
+            target_dir,
+            layout=layout,
+            max_in_flight=max_in_flight,
+            max_files_per_operation=max_files_per_operation,
+            progress_handler=progress_handler,
+            verify=verify,
+        )
+
+    @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
+    def harvest_outputs(
+        self,
+        job_filter: dict | list[Job | str] | None,
+        evaluation_path_glob: str | list[str],
+        target_dir: str,
+        max_in_flight: int = 4,
+        file_type: str | list[str] | None = None,
+        progress_handler: Callable[[int], None] = None,
+    ) -> list[FileTransferResult]:
+        """Download the output files of many jobs matching evaluation path patterns.
+
+        Output files are found with one bulk query of the tasks of the jobs and one
+        of their file resources, and downloaded with a few concurrent data transfer
+        operations into ``<target_dir>/<job id>/<evaluation path>``.
+
+        Parameters
+        ----------
+        job_filter : dict or list[Job | str] or None
+            Query parameters selecting the jobs, such as ``{"eval_status": "evaluated"}``,
+            or a list of jobs or job IDs. If ``None``, outputs of all jobs are harvested.
+        evaluation_path_glob : str or list[str]
+            Shell-style patterns of the evaluation paths to harvest, such as ``"*.jpg"``.
+        target_dir : str
+            Path to the directory where to save the files.
+        max_in_flight : int, optional
+            Maximum number of concurrent data transfer operations. The default is ``4``.
+        file_type : str or list[str], optional
+            Types of the files to harvest, such as ``"image/jpeg"``. The default is ``None``.
+        progress_handler : Callable[[int], None], optional
+            Function to handle progress updates. The function should accept a single
+            argument, which is the number of bytes downloaded across all files.
+            The default is ``None``.
+
+        Returns
+        -------
+        list[FileTransferResult]
+            Outcome of the download of each harvested file.
+
+        Examples
+        --------
+        >>> results = project_api.harvest_outputs(
+        ...     {"eval_status": "evaluated"}, ["*.jpg", "file.out"], "results"
+        ... )
+        >>> failed = [r.file for r in results if not r.success]
+
+        """
+        return harvest_outputs(
+            self,
+            job_filter,
+            evaluation_path_glob,
+            target_dir,
+            max_in_flight=max_in_flight,
+            file_type=file_type,
+            progress_handler=progress_handler,
+        )
+
+    @version_required(min_version=JMS_VERSIONS[HpsRelease.v1_2_0])
+    def sync_directory(
+        self,
+        local_dir: str,
+        direction: str = "up",
+        pattern: str = "*",
+        prune: bool = False,
+        checksum: bool = True,
+        batch_size: int = 100,
+        max_in_flight: int = 4,
+        **query_params,
+    ) -> SyncResult:
+        """Synchronize a local directory with the file resources of the project.
+
+        Local files are matched with file resources by their path relative to
+        ``local_dir`` and their evaluation path. Files on both sides are compared by
+        size and, if ``checksum=True``, by hash. Only new and changed files are
+        transferred, in batches that run concurrently. A failed batch does not stop
+        the others, its files are reported as failed.
+
+        Parameters
+        ----------
+        local_dir : str
+            Path to the local directory.
+        direction : str, optional
+            ``"up"`` to upload local files to the project, ``"down"`` to download file
+            resources to the local directory. The default is ``"up"``.
+        pattern : str, optional
+            Shell-style pattern that relative paths must match to be synchronized,
+            such as ``"meshes/*.cdb"``. The default is ``"*"``.
+        prune : bool, optional
+            Whether to delete the files of the destination that are missing in the
+            source. Only files matching ``pattern`` and ``query_params`` are deleted.
+            The default is ``False``.
+        checksum : bool, optional
+            Whether to compare the hash of files of the same size. Local hashes are
+            computed with :data:`HASH_ALGORITHM`, which must match the algorithm of the
+            server. If ``False``, files of the same size are considered unchanged.
+            The default is ``True``.
+        batch_size : int, optional
+            Number of files per transfer batch. The default is ``100``.
+        max_in_flight : int, optional
+            Maximum number of concurrent transfer batches. The default is ``4``.
+        query_params : dict, optional
+            Query parameters restricting the file resources to synchronize, such as
+            ``type="text/plain"``. Since output files of all jobs are file resources
+            too, restricting them is advisable, in particular with ``prune=True``.
+
+        Returns
+        -------
+        SyncResult
+            Relative paths of the transferred, unchanged, deleted and failed files.
+
+        Examples
+        --------
+        >>> result = project_api.sync_directory("library", pattern="materials/*")
+        >>> print(f"Uploaded {len(result.transferred)} files")
+
+        """
+        return sync_directory(
+            self,
+            local_dir,
+            direction=direction,
+            pattern=pattern,
+            prune=prune,
+            checksum=checksum,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            **query_params,
+        )
 
     ################################################################
     # Parameter definitions
@@ -449,7 +793,7 @@ class ProjectApi:
         """
         return _copy_objects(self.client, self.url, jobs, wait=wait)
 
-    def update_jobs(self, jobs: list[Job], as_objects=True) -> list[Job]:
+    def update_jobs(self, jobs: list[Job], as_objects=True, only_modified=False) -> list[Job]:
         """Update jobs.
 
         Parameters
@@ -459,6 +803,10 @@ class ProjectApi:
         as_objects : bool, optional
             Whether to return jobs as objects. The default is ``True``.
             If ``False``, jobs are returned as dictionaries.
+        only_modified : bool, optional
+            Whether to only send the ID and the attributes assigned since each job
+            was loaded from the server. Jobs created on the client side are sent
+            in full. The default is ``False``.
 
         Returns
         -------
@@ -467,7 +815,7 @@ class ProjectApi:
             dictionaries if ``as_objects=False``.
 
         """
-        return self._update_objects(jobs, Job, as_objects=as_objects)
+        return self._update_objects(jobs, Job, as_objects=as_objects, only_modified=only_modified)
 
     def delete_jobs(self, jobs: list[Job]):
         """Delete jobs.
@@ -502,15 +850,73 @@ class ProjectApi:
         log.warning(msg)
         return self.sync_jobs(jobs)
 
+    def get_job_graph(
+        self, jobs: list[Job | str], include: list[str] = ("tasks", "files")
+    ) -> list[JobNode]:
+        """Get jobs linked to their tasks and the input and output files of the tasks.
+
+        Related resources are fetched in bulk with one ``job_id=[...]`` and one
+        ``id=[...]`` query, instead of one query per job and task. Long ID lists
+        are split into concurrent queries.
+
+        Parameters
+        ----------
+        jobs : list[Job | str]
+            Jobs or job IDs. Jobs given as IDs are queried.
+        include : list[str], optional
+            Related collections to load, ``"tasks"`` and/or ``"files"``.
+            Loading files implies loading tasks. The default is both.
+
+        Returns
+        -------
+        list[JobNode]
+            One node per job, in the order of ``jobs``.
+
+        Examples
+        --------
+        >>> jobs = project_api.get_jobs(eval_status="evaluated")
+        >>> for node in project_api.get_job_graph(jobs):
+        ...     for task_node in node.tasks:
+        ...         print(node.job.name, [f.evaluation_path for f in task_node.output_files])
+
+        """
+        return get_job_graph(self, jobs, include)
+
     ################################################################
     # Tasks
     def get_tasks(self, as_objects=True, **query_params) -> list[Task]:
         """Get a list of tasks."""
         return self._get_objects(Task, as_objects=as_objects, **query_params)
 
-    def update_tasks(self, tasks: list[Task], as_objects=True) -> list[Task]:
-        """Update a list of tasks."""
-        return self._update_objects(tasks, Task, as_objects=as_objects)
+    def update_tasks(self, tasks: list[Task], as_objects=True, only_modified=False) -> list[Task]:
+        """Update a list of tasks.
+
+        If ``only_modified=True``, only the ID and the attributes assigned since each
+        task was loaded from the server are sent.
+        """
+        return self._update_objects(tasks, Task, as_objects=as_objects, only_modified=only_modified)
+
+    def update_buffer(self, flush_interval: float = 1.0, max_pending: int = 1000) -> UpdateBuffer:
+        """Get a buffer that coalesces updates of project resources such as jobs and tasks.
+
+        Parameters
+        ----------
+        flush_interval : float, optional
+            Maximum time in seconds that updates are held back. The default is ``1.0``.
+        max_pending : int, optional
+            Maximum number of pending objects before a flush. The default is ``1000``.
+
+        Examples
+        --------
+        >>> with project_api.update_buffer() as buffer:
+        ...     for job in project_api.get_jobs(eval_status="pending"):
+        ...         job.priority = 5
+        ...         buffer.add([job])
+
+        """
+        return UpdateBuffer(
+            self.client.session, self.url, flush_interval=flush_interval, max_pending=max_pending
+        )
 
     ################################################################
     # Commands
@@ -749,11 +1155,22 @@ class ProjectApi:
         )
 
     def _update_objects(
-        self, objects: list[Object], obj_type: type[Object], as_objects=True, **query_params
+        self,
+        objects: list[Object],
+        obj_type: type[Object],
+        as_objects=True,
+        only_modified=False,
+        **query_params,
     ):
         """Update objects."""
         return update_objects(
-            self.client.session, self.url, objects, obj_type, as_objects, **query_params
+            self.client.session,
+            self.url,
+            objects,
+            obj_type,
+            as_objects,
+            only_modified,
+            **query_params,
         )
 
     def _delete_objects(self, objects: list[Object], obj_type: type[Object]):
@@ -763,14 +1180,20 @@ class ProjectApi:
 
 def _download_files(project_api: ProjectApi, files: list[File]):
     """Download files directly using data transfer worker."""
-    temp_dir = tempfile.TemporaryDirectory()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _download_files_to(project_api, files, temp_dir)
+
 
+def _download_files_to(project_api: ProjectApi, files: list[File], temp_dir: str):
+    """Download files to a directory and read their content into memory."""
     project_api.client.initialize_data_transfer_client()
-    out_path = os.path.join(temp_dir.name, "downloads")
+    out_path = os.path.join(temp_dir, "downloads")
+    cache = getattr(project_api, "download_cache", None)
 
     base_dir = project_api.project_id
     srcs = []
     dsts = []
+    downloaded = []
     for f in files:
         if (
             getattr(f, "hash", None) is not None
@@ -779,8 +1202,11 @@ def _download_files(project_api: ProjectApi, files: list[File]):
         ):
             fpath = os.path.join(out_path, f"{f.id}")
             download_path = os.path.join(fpath, f.evaluation_path)
+            if cache is not None and cache.fetch(f, download_path):
+                continue
             srcs.append(StoragePath(path=f"{base_dir}/{os.path.basename(f.storage_id)}"))
             dsts.append(StoragePath(path=download_path, remote="local"))
+            downloaded.append((f, download_path))
 
     if len(srcs) > 0:
         log.info("Downloading files")
@@ -788,16 +1214,19 @@ def _download_files(project_api: ProjectApi, files: list[File]):
             [SrcDst(src=src, dst=dst) for src, dst in zip(srcs, dsts, strict=False)]
         )
         op = project_api.client.data_transfer_api.wait_for([op.id])
-        if op[0].state == OperationState.Succeeded:
-            for f in files:
-                if getattr(f, "hash", None) is not None:
-                    fpath = os.path.join(out_path, f"{f.id}")
-                    download_path = os.path.join(fpath, f.evaluation_path)
-                    with open(download_path, "rb") as inp:
-                        f.content = inp.read()
-        else:
+        if op[0].state != OperationState.Succeeded:
             log.error("Download of files failed")
             raise HPSError("Download of files failed")
+        if cache is not None:
+            for f, download_path in downloaded:
+                cache.store(f, download_path)
+
+    for f in files:
+        if getattr(f, "hash", None) is not None:
+            download_path = os.path.join(out_path, f"{f.id}", f.evaluation_path)
+            if os.path.isfile(download_path):
+                with open(download_path, "rb") as inp:
+                    f.content = inp.read()
 
 
 def get_files(project_api: ProjectApi, as_objects=True, content=False, **query_params):
@@ -812,6 +1241,13 @@ def get_files(project_api: ProjectApi, as_objects=True, content=False, **query_p
 
 def _upload_files(project_api: ProjectApi, files):
     """Upload files directly using the data transfer worker."""
+    storage_paths = _upload_contents(project_api, files)
+    if storage_paths:
+        _fetch_file_metadata(project_api, files, storage_paths)
+
+
+def _upload_contents(project_api: ProjectApi, files) -> list[StoragePath]:
+    """Upload the sources of files and return the storage paths of their contents."""
     min_v = JMS_VERSIONS[HpsRelease.v1_2_0]
     check_version_and_raise(
         project_api.version,
@@ -823,40 +1259,33 @@ def _upload_files(project_api: ProjectApi, files):
     srcs = []
     dsts = []
     base_dir = project_api.project_id
-    file_path = ""
 
-    temp_dir = tempfile.TemporaryDirectory()
-
-    for f in files:
-        if (
-            getattr(f, "src", None) is None
-            or getattr(f, "access_mode", FileAccessMode.transfer.value)
-            == FileAccessMode.direct_access.value
-        ):
-            continue
-        file_path = f.src
-        if isinstance(f.src, io.IOBase):
-            mode = "wb" if isinstance(f.src, io.BytesIO) else "w"
-            with open(os.path.join(temp_dir.name, f.storage_id), mode) as out:
-                out.write(f.src.getvalue())
-            file_path = os.path.join(temp_dir.name, f.storage_id)
-        srcs.append(StoragePath(path=file_path, remote="local"))
-        dsts.append(StoragePath(path=f"{base_dir}/{os.path.basename(f.storage_id)}"))
-
-    if len(srcs) > 0:
-        log.info("Uploading files")
-        op = project_api.client.data_transfer_api.copy(
-            [SrcDst(src=src, dst=dst) for src, dst in zip(srcs, dsts, strict=False)]
-        )
-        op = project_api.client.data_transfer_api.wait_for(op.id)
-        if op[0].state == OperationState.Succeeded:
-            _fetch_file_metadata(project_api, files, dsts)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for f in files:
+            if (
+                getattr(f, "src", None) is None
+                or getattr(f, "access_mode", FileAccessMode.transfer.value)
+                == FileAccessMode.direct_access.value
+            ):
+                continue
+            file_path = _local_source_path(f, temp_dir)
+            srcs.append(StoragePath(path=file_path, remote="local"))
+            dsts.append(StoragePath(path=f"{base_dir}/{os.path.basename(f.storage_id)}"))
+
+        if len(srcs) > 0:
+            # All files, including in-memory buffers, are uploaded with a single operation
+            log.info("Uploading files")
+            op = project_api.client.data_transfer_api.copy(
+                [SrcDst(src=src, dst=dst) for src, dst in zip(srcs, dsts, strict=False)]
+            )
+            op = project_api.client.data_transfer_api.wait_for(op.id)
+            if op[0].state != OperationState.Succeeded:
+                log.error("Upload of files failed")
+                raise HPSError("Upload of files failed")
         else:
-            log.error("Upload of files failed")
-            raise HPSError("Upload of files failed")
+            log.info("No files to upload")
 
-    else:
-        log.info("No files to upload")
+    return dsts
 
 
 def _fetch_file_metadata(
@@ -878,14 +1307,44 @@ def _fetch_file_metadata(
         raise HPSError("Failed to fetch metadata of uploaded files")
 
 
-def create_files(project_api: ProjectApi, files, as_objects=True) -> list[File]:
+def create_files(
+    project_api: ProjectApi,
+    files,
+    as_objects=True,
+    dedup=False,
+    hash_index: MutableMapping[str, dict] = None,
+    chunk_size: int | None = None,
+    max_uploads: int = 2,
+    max_updates: int = 1,
+) -> list[File]:
     """Create a list of files."""
+    if chunk_size is not None and len(files) > chunk_size:
+        return _create_files_pipelined(
+            project_api, files, as_objects, dedup, hash_index, chunk_size, max_uploads, max_updates
+        )
+
     # (1) Create file resources in JMS
+    created_files, num_uploads = _create_file_resources(project_api, files, as_objects)
+
+    if num_uploads > 0:
+        # (2) Upload file contents
+        storage_paths = _upload_created_files(project_api, created_files, dedup, hash_index)
+
+        # (3) Update corresponding file resources in JMS with hashes of uploaded files
+        created_files = _update_uploaded_files(
+            project_api, created_files, storage_paths, as_objects
+        )
+
+    return created_files
+
+
+def _create_file_resources(project_api: ProjectApi, files, as_objects) -> tuple[list, int]:
+    """Create file resources in JMS and return them with the number of contents to upload."""
     created_files = create_objects(
         project_api.client.session, project_api.url, files, File, as_objects=as_objects
     )
 
-    # (2) Check if there are src properties, files to upload
+    # Check if there are src properties, files to upload
     num_uploads = 0
     for f, cf in zip(files, created_files, strict=False):
         if (
@@ -895,47 +1354,97 @@ def create_files(project_api: ProjectApi, files, as_objects=True) -> list[File]:
         ):
             cf.src = f.src
             num_uploads += 1
+    return created_files, num_uploads
 
-    if num_uploads > 0:
-        # (3) Upload file contents
-        _upload_files(project_api, created_files)
 
-        # (4) Update corresponding file resources in JMS with hashes of uploaded files
-        created_files = update_objects(
-            project_api.client.session, project_api.url, created_files, File, as_objects=as_objects
-        )
+def _upload_created_files(project_api: ProjectApi, files, dedup, hash_index) -> list[StoragePath]:
+    """Upload the contents of created files.
 
-    return created_files
+    Returns the storage paths of the contents whose metadata must still be fetched.
+    """
+    if dedup:
+        # Metadata is needed right away to index the uploaded contents
+        _upload_deduplicated(
+            project_api,
+            files,
+            lambda files: _upload_files(project_api, files),
+            hash_index=hash_index,
+        )
+        return []
+    return _upload_contents(project_api, files)
 
 
-def update_files(project_api: ProjectApi, files: list[File], as_objects=True) -> list[File]:
-    """Update a list of files."""
-    # Upload files first if there are any src parameters
-    _upload_files(project_api, files)
-    # Update file resources in JMS
+def _update_uploaded_files(
+    project_api: ProjectApi, files, storage_paths: list[StoragePath], as_objects
+) -> list[File]:
+    """Fetch the metadata of uploaded contents and update the file resources in JMS."""
+    if storage_paths:
+        _fetch_file_metadata(project_api, files, storage_paths)
     return update_objects(
         project_api.client.session, project_api.url, files, File, as_objects=as_objects
     )
 
 
-class _DownloadHandler(WaitHandler):
-    """Handles download operations.
-
-    Subclass the WaitHandler class to retain logging behavior
-    but add custom progress reporting.
+def _create_files_pipelined(
+    project_api: ProjectApi,
+    files,
+    as_objects,
+    dedup,
+    hash_index,
+    chunk_size: int,
+    max_uploads: int,
+    max_updates: int,
+) -> list[File]:
+    """Create files in chunks, overlapping the stages of consecutive chunks.
+
+    Resources of a chunk are created while the contents of previous chunks are
+    uploaded, and the metadata fetch and update of a chunk run while the contents
+    of the next chunks are uploaded.
     """
+    if chunk_size < 1 or max_uploads < 1 or max_updates < 1:
+        raise ClientError("chunk_size, max_uploads and max_updates must be positive.")
+
+    def finish(created_files, upload):
+        if upload is None:
+            return created_files
+        return _update_uploaded_files(project_api, created_files, upload.result(), as_objects)
+
+    # Bound the number of chunks in flight, so that resource creation does not run ahead
+    max_chunks = max_uploads + max_updates
+    chunks = []
+    with (
+        ThreadPoolExecutor(max_workers=max_uploads) as upload_pool,
+        ThreadPoolExecutor(max_workers=max_updates) as update_pool,
+    ):
+        for start in range(0, len(files), chunk_size):
+            if len(chunks) >= max_chunks:
+                chunks[-max_chunks].result()
+            created_files, num_uploads = _create_file_resources(
+                project_api, files[start : start + chunk_size], as_objects
+            )
+            upload = None
+            if num_uploads > 0:
+                upload = upload_pool.submit(
+                    _upload_created_files, project_api, created_files, dedup, hash_index
+                )
+            chunks.append(update_pool.submit(finish, created_files, upload))
+            log.debug(f"Submitted chunk {len(chunks)} of {-(-len(files) // chunk_size)} files")
 
-    def __init__(self, op_id: str, file_size: int, progress_handler: Callable[[int], None] = None):
-        super().__init__()
-        self.op_id = op_id
-        self.progress_handler = progress_handler
-        self.file_size = file_size
+        return [f for chunk in chunks for f in chunk.result()]
 
-    def __call__(self, ops: list[Operation]):
-        for op in ops:
-            if op.id == self.op_id and self.progress_handler is not None:
-                self.progress_handler(int(op.progress * self.file_size))
-        super().__call__(ops)
+
+def update_files(
+    project_api: ProjectApi, files: list[File], as_objects=True, skip_unchanged=False
+) -> list[File]:
+    """Update a list of files."""
+    if skip_unchanged:
+        _skip_unchanged_uploads(files)
+    # Upload files first if there are any src parameters
+    _upload_files(project_api, files)
+    # Update file resources in JMS
+    return update_objects(
+        project_api.client.session, project_api.url, files, File, as_objects=as_objects
+    )
 
 
 def _download_file(
@@ -944,6 +1453,7 @@ def _download_file(
     target_path: str,
     progress_handler: Callable[[int], None] = None,
     file_name: str | None = None,
+    verify: bool = False,
 ) -> str:
     """Download a file."""
     if getattr(file, "hash", None) is None:
@@ -953,6 +1463,12 @@ def _download_file(
     download_path = os.path.join(target_path, file_name)
     base_dir = project_api.project_id
 
+    cache = getattr(project_api, "download_cache", None)
+    if cache is not None and cache.fetch(file, download_path):
+        if progress_handler is not None:
+            progress_handler(file.size)
+        return download_path
+
     log.info(f"Downloading file {file.id}")
     src = StoragePath(path=f"{base_dir}/{os.path.basename(file.storage_id)}")
     dst = StoragePath(path=download_path, remote="local")
@@ -972,6 +1488,16 @@ def _download_file(
     if progress_handler is not None:
         progress_handler(file.size)
 
+    if verify:
+        if not is_comparable(getattr(file, "hash", None)):
+            log.warning(f"Cannot verify file {file.id} without a {HASH_ALGORITHM} hash")
+        elif compute_checksum(download_path) != file.hash:
+            log.error(f"Checksum mismatch of downloaded file {file.id}")
+            return None
+
+    if cache is not None:
+        cache.store(file, download_path)
+
     return download_path
 
 
@@ -987,7 +1513,14 @@ def copy_projects(
     )
 
 
-def archive_project(project_api: ProjectApi, target_path, include_job_files=True) -> str:
+def archive_project(
+    project_api: ProjectApi,
+    target_path,
+    include_job_files=True,
+    progress_handler: Callable[[int], None] = None,
+    verify: bool = True,
+    max_retries: int = 3,
+) -> str:
     """Archive projects."""
     # PUT archive request
     url = f"{project_api.url}/archive"
@@ -1018,24 +1551,20 @@ def archive_project(project_api: ProjectApi, target_path, include_job_files=True
     file_path = os.path.join(target_path, download_link.rsplit("/")[-1])
     log.info(f"Download archive to {file_path}")
 
-    _download_archive(project_api, download_link, file_path)
+    transfer_archive(
+        project_api.client,
+        file_path,
+        download_link,
+        upload=False,
+        progress_handler=progress_handler,
+        verify=verify,
+        max_retries=max_retries,
+    )
 
     log.info("Done saving project archive to disk.")
     return file_path
 
 
-def _download_archive(project_api: ProjectApi, download_link, target_path):
-    project_api.client.initialize_data_transfer_client()
-
-    src = StoragePath(path=f"{download_link}")
-    dst = StoragePath(path=target_path, remote="local")
-    op = project_api.client.data_transfer_api.copy([SrcDst(src=src, dst=dst)])
-    op = project_api.client.data_transfer_api.wait_for([op.id])
-
-    if op[0].state != OperationState.Succeeded:
-        raise HPSError(f"Download of archive {download_link} failed")
-
-
 def copy_jobs(project_api: ProjectApi, jobs: list[Job], as_objects=True, **query_params):
     """Create jobs by copying existing jobs."""
     ids = _copy_objects(client=project_api.client, api_url=project_api.url, objects=jobs, wait=True)
@@ -0,0 +1,382 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module providing a local SQLite mirror of the resources of a project."""
+
+import json
+import logging
+import sqlite3
+
+from ansys.hps.client.common import Object
+from ansys.hps.client.jms.resource import (
+    File,
+    Job,
+    JobDefinition,
+    ParameterDefinition,
+    Task,
+    TaskDefinition,
+)
+
+from .base import get_objects
+
+log = logging.getLogger(__name__)
+
+
+class ProjectMirror:
+    """Keeps a local SQLite copy of the jobs, tasks, files, and definitions of a project.
+
+    The first call to :meth:`sync` downloads all resources. Subsequent calls only
+    request resources modified since the last sync, based on their ``modification_time``.
+    Queries are then answered from the local database, without contacting the JMS.
+
+    Parameters
+    ----------
+    project_api : ProjectApi
+        Project API of the project to mirror.
+    path : str
+        Path of the SQLite database file. Use ``":memory:"`` for a transient mirror.
+    page_size : int, optional
+        Number of resources requested per query during a sync. The default is ``1000``.
+
+    Examples
+    --------
+    >>> mirror = ProjectMirror(project_api, "project.db")
+    >>> mirror.sync()
+    >>> failed = mirror.get_jobs(eval_status="failed")
+    >>> jobs = mirror.get_jobs(values={"tube1": 2, "weight": (0.0, 10.0)})
+
+    """
+
+    #: Mirrored resource types and the attributes stored in indexed columns.
+    _COLLECTIONS: dict[type[Object], tuple[str, ...]] = {
+        Job: ("eval_status", "job_definition_id"),
+        Task: ("eval_status", "job_id", "task_definition_id", "host_id"),
+        File: ("type", "evaluation_path"),
+        JobDefinition: (),
+        TaskDefinition: (),
+        ParameterDefinition: (),
+    }
+
+    def __init__(self, project_api, path: str, page_size: int = 1000):
+        """Initialize the project mirror."""
+        self.project_api = project_api
+        self.path = path
+        self.page_size = page_size
+        self._db = sqlite3.connect(path)
+        self._create_tables()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the database on exit."""
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._db.close()
+
+    def _create_tables(self):
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state "
+                "(collection TEXT PRIMARY KEY, watermark TEXT)"
+            )
+            for obj_type, columns in self._COLLECTIONS.items():
+                table = obj_type.Meta.rest_name
+                extra = "".join(f", {c} TEXT" for c in columns)
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    f"(id TEXT PRIMARY KEY, modification_time TEXT{extra}, data TEXT)"
+                )
+                for c in columns:
+                    self._db.execute(f"CREATE INDEX IF NOT EXISTS {table}_{c} ON {table} ({c})")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS job_values (job_id TEXT, name TEXT, value, "
+                "PRIMARY KEY (job_id, name))"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS job_values_name_value ON job_values (name, value)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS job_hosts (job_id TEXT, host_id TEXT, "
+                "PRIMARY KEY (job_id, host_id))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS job_hosts_host ON job_hosts (host_id)")
+
+    ################################################################
+    # Synchronization
+    def sync(self, prune: bool = True) -> dict[str, int]:
+        """Bring the mirror up to date with the project.
+
+        Parameters
+        ----------
+        prune : bool, optional
+            Whether to remove resources that were deleted in the project. This requires
+            querying the IDs of all resources. The default is ``True``.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of resources inserted or updated per collection.
+
+        """
+        counts = {}
+        for obj_type, columns in self._COLLECTIONS.items():
+            counts[obj_type.Meta.rest_name] = self._sync_collection(obj_type, columns)
+            if prune:
+                self._prune_collection(obj_type)
+        return counts
+
+    def _query_pages(self, obj_type: type[Object], since: str = None, **query_params):
+        """Query the resources of a collection page by page, by increasing modification time.
+
+        Pages are requested from the modification time of the last resource received,
+        not by offset. A resource modified during the query moves to the end of the
+        sort order, which would shift offsets and skip a resource at a page boundary.
+        """
+        last_time = since
+        seen = set()  # IDs of the resources received with the last modification time
+        limit = self.page_size
+        while True:
+            params = dict(query_params, sort="modification_time", limit=limit)
+            if last_time is not None:
+                params["modification_time.ge"] = last_time
+            data = get_objects(
+                self.project_api.client.session,
+                self.project_api.url,
+                obj_type,
+                as_objects=False,
+                **params,
+            )
+            new = [
+                d
+                for d in data
+                if last_time is None
+                or d.get("modification_time") != last_time
+                or d["id"] not in seen
+            ]
+            full = len(data) == limit
+            if new:
+                yield new
+                times = [d["modification_time"] for d in new if d.get("modification_time")]
+                if times and max(times) != last_time:
+                    last_time = max(times)
+                    seen = set()
+                seen.update(d["id"] for d in new if d.get("modification_time") == last_time)
+                limit = self.page_size
+            if not full:
+                break
+            if not new:
+                # More resources share the last modification time than fit in a page
+                limit *= 2
+
+    def _sync_collection(self, obj_type: type[Object], columns: tuple[str, ...]) -> int:
+        table = obj_type.Meta.rest_name
+        row = self._db.execute(
+            "SELECT watermark FROM sync_state WHERE collection = ?", (table,)
+        ).fetchone()
+        watermark = row[0] if row else None
+
+        placeholders = ", ".join("?" * (len(columns) + 3))
+        statement = (
+            f"INSERT OR REPLACE INTO {table} "
+            f"(id, modification_time{''.join(f', {c}' for c in columns)}, data) "
+            f"VALUES ({placeholders})"
+        )
+        count = 0
+        # Resources modified at the watermark time are fetched again, which is
+        # harmless since rows are upserted.
+        for data in self._query_pages(obj_type, since=watermark, fields="all"):
+            with self._db:
+                self._db.executemany(
+                    statement,
+                    [
+                        (
+                            d["id"],
+                            d.get("modification_time"),
+                            *(d.get(c) for c in columns),
+                            json.dumps(d),
+                        )
+                        for d in data
+                    ],
+                )
+                if obj_type is Job:
+                    self._store_job_details(data)
+                times = [d["modification_time"] for d in data if d.get("modification_time")]
+                if times and (watermark is None or max(times) > watermark):
+                    watermark = max(times)
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO sync_state (collection, watermark) VALUES (?, ?)",
+                        (table, watermark),
+                    )
+            count += len(data)
+        log.debug(f"Synchronized {count} {table} of project {self.project_api.project_id}")
+        return count
+
+    def _store_job_details(self, jobs: list[dict]):
+        """Store parameter values and host IDs of jobs in their indexed tables."""
+        ids = [(j["id"],) for j in jobs]
+        self._db.executemany("DELETE FROM job_values WHERE job_id = ?", ids)
+        self._db.executemany("DELETE FROM job_hosts WHERE job_id = ?", ids)
+        self._db.executemany(
+            "INSERT INTO job_values (job_id, name, value) VALUES (?, ?, ?)",
+            [
+                (j["id"], name, _column_value(value))
+                for j in jobs
+                for name, value in (j.get("values") or {}).items()
+            ],
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO job_hosts (job_id, host_id) VALUES (?, ?)",
+            [(j["id"], host_id) for j in jobs for host_id in j.get("host_ids") or []],
+        )
+
+    def _prune_collection(self, obj_type: type[Object]):
+        table = obj_type.Meta.rest_name
+        ids = []
+        for data in self._query_pages(obj_type, fields=["id", "modification_time"]):
+            ids.extend((d["id"],) for d in data)
+        with self._db:
+            self._db.execute("CREATE TEMP TABLE IF NOT EXISTS current_ids (id TEXT PRIMARY KEY)")
+            self._db.execute("DELETE FROM current_ids")
+            self._db.executemany("INSERT OR IGNORE INTO current_ids (id) VALUES (?)", ids)
+            condition = "NOT IN (SELECT id FROM current_ids)"
+            if obj_type is Job:
+                self._db.execute(f"DELETE FROM job_values WHERE job_id {condition}")
+                self._db.execute(f"DELETE FROM job_hosts WHERE job_id {condition}")
+            r = self._db.execute(f"DELETE FROM {table} WHERE id {condition}")
+        if r.rowcount:
+            log.debug(f"Pruned {r.rowcount} deleted {table} from the mirror")
+
+    ################################################################
+    # Queries
+    def get_jobs(
+        self,
+        eval_status: str | list[str] = None,
+        job_definition_id: str = None,
+        host_id: str = None,
+        values: dict = None,
+        as_objects=True,
+    ) -> list[Job]:
+        """Get mirrored jobs, optionally filtered.
+
+        Parameters
+        ----------
+        eval_status : str or list[str], optional
+            Evaluation status or list of statuses to match.
+        job_definition_id : str, optional
+            ID of the job definition of the jobs.
+        host_id : str, optional
+            ID of a host that evaluated the jobs.
+        values : dict, optional
+            Parameter values to match. A ``(low, high)`` tuple matches an inclusive range.
+        as_objects : bool, optional
+            Whether to return jobs as objects. The default is ``True``. If ``False``,
+            jobs are returned as dictionaries.
+
+        """
+        where, params = _conditions(eval_status=eval_status, job_definition_id=job_definition_id)
+        if host_id is not None:
+            where.append("id IN (SELECT job_id FROM job_hosts WHERE host_id = ?)")
+            params.append(host_id)
+        for name, value in (values or {}).items():
+            if isinstance(value, tuple):
+                where.append(
+                    "id IN (SELECT job_id FROM job_values "
+                    "WHERE name = ? AND value >= ? AND value <= ?)"
+                )
+                params.extend([name, _column_value(value[0]), _column_value(value[1])])
+            else:
+                where.append("id IN (SELECT job_id FROM job_values WHERE name = ? AND value = ?)")
+                params.extend([name, _column_value(value)])
+        return self._select(Job, where, params, as_objects)
+
+    def get_tasks(
+        self,
+        eval_status: str | list[str] = None,
+        job_id: str | list[str] = None,
+        task_definition_id: str = None,
+        host_id: str = None,
+        as_objects=True,
+    ) -> list[Task]:
+        """Get mirrored tasks, optionally filtered by status, job, task definition, or host."""
+        where, params = _conditions(
+            eval_status=eval_status,
+            job_id=job_id,
+            task_definition_id=task_definition_id,
+            host_id=host_id,
+        )
+        return self._select(Task, where, params, as_objects)
+
+    def get_files(
+        self, type: str = None, evaluation_path: str = None, as_objects=True
+    ) -> list[File]:
+        """Get mirrored file resources, optionally filtered by type or evaluation path."""
+        where, params = _conditions(type=type, evaluation_path=evaluation_path)
+        return self._select(File, where, params, as_objects)
+
+    def get_job_definitions(self, as_objects=True) -> list[JobDefinition]:
+        """Get mirrored job definitions."""
+        return self._select(JobDefinition, [], [], as_objects)
+
+    def get_task_definitions(self, as_objects=True) -> list[TaskDefinition]:
+        """Get mirrored task definitions."""
+        return self._select(TaskDefinition, [], [], as_objects)
+
+    def get_parameter_definitions(self, as_objects=True) -> list[ParameterDefinition]:
+        """Get mirrored parameter definitions."""
+        return self._select(ParameterDefinition, [], [], as_objects)
+
+    def _select(self, obj_type: type[Object], where: list[str], params: list, as_objects: bool):
+        statement = f"SELECT data FROM {obj_type.Meta.rest_name}"
+        if where:
+            statement += " WHERE " + " AND ".join(where)
+        statement += " ORDER BY rowid"
+        data = [json.loads(row[0]) for row in self._db.execute(statement, params)]
+        if not as_objects:
+            return data
+        return obj_type.Meta.schema(many=True).load(data)
+
+
+def _column_value(value):
+    """Convert a value to a type that SQLite compares natively."""
+    if value is None or isinstance(value, int | float | str):
+        return value
+    return json.dumps(value)
+
+
+def _conditions(**filters) -> tuple[list[str], list]:
+    """Build SQL conditions for equality filters, skipping ``None`` values."""
+    where = []
+    params = []
+    for column, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, list | tuple):
+            where.append(f"{column} IN ({', '.join('?' * len(value))})")
+            params.extend(value)
+        else:
+            where.append(f"{column} = ?")
+            params.append(value)
+    return where, params
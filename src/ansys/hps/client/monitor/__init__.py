@@ -22,12 +22,27 @@
 
 """PyHPS monitor helpers subpackage."""
 
-from .api import MonitorApi
+from .api import (
+    BufferedStream,
+    HubConsumer,
+    MessageBuffer,
+    MetricAggregator,
+    MonitorApi,
+    MonitorHub,
+    MonitorSession,
+    OverflowPolicy,
+    ProcessTreeDiffer,
+    StreamRecorder,
+    StreamReplayer,
+    Subscription,
+)
 from .models import (
     BuildInfoResponse,
     ListTagsCommand,
     ListTagsResponse,
+    LogMatch,
     MessageEnvelope,
     MonitorMessage,
+    ProcessTreeDiff,
     SubscribeCommand,
 )
@@ -22,4 +22,10 @@
 
 """PyHPS monitor API submodule."""
 
+from .message_buffer import BufferedStream, MessageBuffer, OverflowPolicy
+from .metric_aggregator import MetricAggregator
 from .monitor_api import MonitorApi
+from .monitor_hub import HubConsumer, MonitorHub
+from .monitor_session import MonitorSession, Subscription
+from .process_tree_diff import ProcessTreeDiffer
+from .stream_recorder import StreamRecorder, StreamReplayer
@@ -0,0 +1,363 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Bounded buffering with overflow policies for monitor message streams."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Hashable, Iterable, Mapping
+from typing import Any
+
+from ansys.hps.client.exceptions import ClientError
+
+from ..models import MonitorMessage
+
+log = logging.getLogger(__name__)
+
+
+class OverflowPolicy:
+    """Policies applied by a :class:`MessageBuffer` when it is full.
+
+    Attributes
+    ----------
+    BLOCK : str
+        Wait until the consumer makes room. The producer, and with it the
+        connection, is slowed down to the pace of the consumer.
+    DROP_OLDEST : str
+        Drop the oldest pending message to make room for the new one.
+    SAMPLE : str
+        Keep only one of every ``sample_every`` messages arriving while the
+        buffer is full, in place of the oldest pending message.
+    COALESCE : str
+        Keep only the latest message of each topic while the buffer is full. A
+        new message replaces the latest pending message of the same topic in
+        place. When no pending message has its topic, the oldest one is dropped.
+
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SAMPLE = "sample"
+    COALESCE = "coalesce"
+
+
+_POLICIES = (
+    OverflowPolicy.BLOCK,
+    OverflowPolicy.DROP_OLDEST,
+    OverflowPolicy.SAMPLE,
+    OverflowPolicy.COALESCE,
+)
+
+#: Tags carrying a unique value per message, ignored to identify the topic of a message.
+_UNIQUE_TAG_KEYS = frozenset({"timestamp", "time"})
+
+
+def _default_topic_key(message: Mapping[str, Any]) -> Hashable:
+    """Identify the topic of a message by its tags, except per-message ones."""
+    tags = message.get("tags")
+    if not isinstance(tags, Mapping):
+        return None
+    return tuple(sorted((k, str(v)) for k, v in tags.items() if k not in _UNIQUE_TAG_KEYS))
+
+
+class MessageBuffer:
+    """Bounded, thread-safe buffer of monitor messages with an overflow policy.
+
+    The buffer has the ``put``/``get`` interface of :class:`queue.Queue`, so it can
+    be passed as ``message_queue`` to :meth:`MonitorSession.subscribe`. ``None``
+    marks the end of the stream: it is always accepted and, once the pending
+    messages are consumed, returned by every ``get`` call.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of pending messages. The default is ``1000``.
+    overflow : str, optional
+        :class:`OverflowPolicy` applied when the buffer is full. The default is
+        ``OverflowPolicy.BLOCK``.
+    sample_every : int, optional
+        With ``OverflowPolicy.SAMPLE``, one of every ``sample_every`` messages
+        arriving while the buffer is full is kept. The default is ``10``.
+    topic_key : Callable[[Mapping], Hashable], optional
+        With ``OverflowPolicy.COALESCE``, function identifying the topic of a
+        message. The default identifies topics by the message tags, except
+        ``timestamp`` and ``time``.
+
+    Attributes
+    ----------
+    received : int
+        Number of messages put in the buffer.
+    delivered : int
+        Number of messages taken from the buffer.
+    dropped : int
+        Number of messages dropped by the overflow policy, including coalesced ones.
+    max_pending : int
+        Largest number of pending messages observed.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        overflow: str = OverflowPolicy.BLOCK,
+        sample_every: int = 10,
+        topic_key: Callable[[Mapping[str, Any]], Hashable] | None = None,
+    ) -> None:
+        """Initialize the buffer."""
+        if overflow not in _POLICIES:
+            raise ClientError(f"Unknown overflow policy '{overflow}', expected one of {_POLICIES}.")
+        if maxsize < 1:
+            raise ClientError("The buffer size must be positive.")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.topic_key = topic_key or _default_topic_key
+        # Pending messages with their arrival time and topic, keyed by sequence number
+        self._pending: OrderedDict[int, tuple[float, Any, Hashable]] = OrderedDict()
+        # Sequence number of the latest pending message of each topic, with COALESCE
+        self._latest: dict[Hashable, int] = {}
+        self._sequence = 0
+        self._overflowing = 0
+        self._ended = False
+        self._cond = threading.Condition()
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_pending = 0
+
+    def qsize(self) -> int:
+        """Get the number of pending messages."""
+        with self._cond:
+            return len(self._pending)
+
+    @property
+    def lag(self) -> float:
+        """Get the seconds since the arrival of the oldest pending message."""
+        with self._cond:
+            if not self._pending:
+                return 0.0
+            arrival, _, _ = next(iter(self._pending.values()))
+            return time.monotonic() - arrival
+
+    def _pop_oldest(self) -> Any:
+        sequence, (_, message, topic) = self._pending.popitem(last=False)
+        if topic is not None and self._latest.get(topic) == sequence:
+            del self._latest[topic]
+        return message
+
+    def _drop_oldest(self) -> None:
+        self._pop_oldest()
+        self.dropped += 1
+
+    def put(self, message: MonitorMessage | None, block: bool = True, timeout: float | None = None):
+        """Add a message to the buffer, applying the overflow policy if it is full."""
+        with self._cond:
+            if message is None:
+                self._ended = True
+                self._cond.notify_all()
+                return
+
+            self.received += 1
+            topic = None
+            if self.overflow == OverflowPolicy.COALESCE:
+                topic = self.topic_key(message)
+
+            if len(self._pending) >= self.maxsize:
+                if self.overflow == OverflowPolicy.BLOCK:
+                    if not block:
+                        raise queue.Full
+                    if not self._cond.wait_for(
+                        lambda: len(self._pending) < self.maxsize, timeout=timeout
+                    ):
+                        raise queue.Full
+                elif self.overflow == OverflowPolicy.SAMPLE:
+                    self._overflowing += 1
+                    if self._overflowing % self.sample_every:
+                        self.dropped += 1
+                        return
+                    self._drop_oldest()
+                elif topic is not None and topic in self._latest:
+                    # Coalesce with the pending message of the same topic, keeping its position
+                    sequence = self._latest[topic]
+                    arrival, _, _ = self._pending[sequence]
+                    self._pending[sequence] = (arrival, message, topic)
+                    self.dropped += 1
+                    return
+                else:
+                    self._drop_oldest()
+            else:
+                self._overflowing = 0
+
+            self._sequence += 1
+            if topic is not None:
+                self._latest[topic] = self._sequence
+            self._pending[self._sequence] = (time.monotonic(), message, topic)
+            self.max_pending = max(self.max_pending, len(self._pending))
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        """Discard all pending messages."""
+        with self._cond:
+            self._pending.clear()
+            self._latest.clear()
+            self._cond.notify_all()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> MonitorMessage | None:
+        """Take the oldest pending message, raising :class:`queue.Empty` if there is none."""
+        with self._cond:
+            if not block:
+                timeout = 0
+            if not self._cond.wait_for(lambda: self._pending or self._ended, timeout=timeout):
+                raise queue.Empty
+            if not self._pending:
+                return None
+            message = self._pop_oldest()
+            self.delivered += 1
+            self._cond.notify_all()
+            return message
+
+
+class BufferedStream:
+    """Monitor message stream read by a background thread into a bounded buffer.
+
+    The thread consumes the messages of a stream, such as the generator returned by
+    :meth:`MonitorApi.stream_service_logs`, as fast as they arrive and puts them in a
+    :class:`MessageBuffer`. A slow consumer then only affects the buffer, according
+    to its overflow policy, instead of letting messages pile up in the connection.
+
+    Parameters
+    ----------
+    stream : Iterable[MonitorMessage]
+        Stream of messages to read.
+    maxsize : int, optional
+        Maximum number of pending messages. The default is ``1000``.
+    overflow : str, optional
+        :class:`OverflowPolicy` applied when the buffer is full. The default is
+        ``OverflowPolicy.BLOCK``.
+    kwargs : dict, optional
+        Additional arguments of :class:`MessageBuffer`.
+
+    Examples
+    --------
+    >>> stream = BufferedStream(
+    ...     api.stream_service_logs(ClientType.EVALUATOR),
+    ...     maxsize=500,
+    ...     overflow=OverflowPolicy.COALESCE,
+    ... )
+    >>> with stream:
+    ...     for msg in stream:
+    ...         update_dashboard(msg)
+    ...         if stream.dropped:
+    ...             print(f"{stream.dropped} messages dropped, lagging {stream.lag:.1f}s")
+
+    """
+
+    def __init__(
+        self,
+        stream: Iterable[MonitorMessage],
+        maxsize: int = 1000,
+        overflow: str = OverflowPolicy.BLOCK,
+        **kwargs,
+    ) -> None:
+        """Start reading the stream in the background."""
+        self.buffer = MessageBuffer(maxsize=maxsize, overflow=overflow, **kwargs)
+        self._stream = stream
+        self._stopped = threading.Event()
+        self._error: Exception | None = None
+        self._reader = threading.Thread(
+            target=self._read, name="monitor-stream-reader", daemon=True
+        )
+        self._reader.start()
+
+    def _read(self) -> None:
+        try:
+            for message in self._stream:
+                if self._stopped.is_set():
+                    break
+                self.buffer.put(message)
+        except Exception as exc:
+            log.error(f"Monitor stream failed: {exc}")
+            self._error = exc
+        finally:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+            self.buffer.put(None)
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of messages dropped by the overflow policy."""
+        return self.buffer.dropped
+
+    @property
+    def pending(self) -> int:
+        """Get the number of messages received but not consumed yet."""
+        return self.buffer.qsize()
+
+    @property
+    def lag(self) -> float:
+        """Get the seconds since the arrival of the oldest message not consumed yet."""
+        return self.buffer.lag
+
+    def messages(self, timeout: float | None = None) -> Generator[MonitorMessage, None, None]:
+        """Yield buffered messages until the stream ends.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Maximum number of seconds to wait for each message. The iteration ends
+            when no message arrives in time. The default is ``None``.
+
+        """
+        while True:
+            try:
+                message = self.buffer.get(timeout=timeout)
+            except queue.Empty:
+                return
+            if message is None or self._stopped.is_set():
+                if self._error is not None:
+                    raise ClientError(f"Monitor stream failed: {self._error}") from self._error
+                return
+            yield message
+
+    def __iter__(self):
+        """Iterate over the buffered messages."""
+        return self.messages()
+
+    def __enter__(self) -> BufferedStream:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop reading when leaving the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop reading the stream after its next message and discard pending messages."""
+        self._stopped.set()
+        # Unblock the reader if it waits for room in the buffer
+        self.buffer.clear()
@@ -0,0 +1,310 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Rolling-window aggregation of monitor metric messages."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from ansys.hps.client.exceptions import ClientError
+
+from .monitor_api import _message_timestamp
+
+
+def _import_numpy():
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as exc:
+        raise ClientError(
+            "numpy is required for metric aggregation. "
+            "Install it with 'pip install ansys-hps-client[metrics]'."
+        ) from exc
+    return numpy
+
+
+def _metric_payload(message: Mapping[str, Any]) -> dict[str, Any]:
+    """Get the metric payload of a message, embedded as a JSON string or a dict."""
+    raw = message.get("message")
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            return {}
+    return raw if isinstance(raw, dict) else {}
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _processes(node: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
+    """Iterate over a process-tree node and all its descendants."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(c for c in node.get("children") or [] if isinstance(c, Mapping))
+
+
+def _host_resources_metrics(payload: Mapping[str, Any]) -> dict[str, float | None]:
+    return {
+        "cpu": _float((payload.get("cpu") or {}).get("usage")),
+        "memory": _float((payload.get("virtual_memory") or {}).get("percent")),
+    }
+
+
+def _process_tree_metrics(payload: Mapping[str, Any]) -> dict[str, float | None]:
+    if "pid" not in payload:
+        return {}
+    processes = list(_processes(payload))
+    return {
+        "cpu": sum(_float(p.get("cpu_percentage")) or 0.0 for p in processes),
+        "memory": sum(_float(p.get("memory_percentage")) or 0.0 for p in processes),
+        "processes": float(len(processes)),
+    }
+
+
+#: Metrics extracted from the payload of each statistic.
+_EXTRACTORS: dict[str, Callable[[Mapping[str, Any]], dict[str, float | None]]] = {
+    "host_resources": _host_resources_metrics,
+    "process_tree": _process_tree_metrics,
+}
+
+
+class _RingBuffer:
+    """Preallocated ring buffer of timestamped samples with a running sum."""
+
+    def __init__(self, np, capacity: int) -> None:
+        self.np = np
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.capacity = capacity
+        self.count = 0
+        self.next = 0
+        self.total = 0.0
+
+    def append(self, timestamp: float, value: float) -> None:
+        if self.count == self.capacity:
+            self.total -= self.values[self.next]
+        else:
+            self.count += 1
+        self.values[self.next] = value
+        self.times[self.next] = timestamp
+        self.total += value
+        self.next = (self.next + 1) % self.capacity
+        if self.next == 0:
+            # Reset the accumulated rounding errors of the running sum once per cycle
+            self.total = float(self.values[: self.count].sum())
+
+    def ordered(self, array):
+        """Get the samples of an array from the oldest to the most recent one."""
+        if self.count < self.capacity:
+            return array[: self.count]
+        return self.np.concatenate((array[self.next :], array[: self.next]))
+
+
+class MetricAggregator:
+    """Rolling-window statistics of host-resource and process-tree metrics.
+
+    Metric messages, as yielded by :meth:`MonitorApi.stream_task_host_resources` and
+    :meth:`MonitorApi.stream_task_process_tree`, are ingested into preallocated
+    NumPy ring buffers holding the last ``window`` samples of each metric of each
+    source. Host resources are keyed by evaluator name and provide ``cpu`` and
+    ``memory`` percentages. Process trees are keyed by task ID and provide the
+    ``cpu`` and ``memory`` percentages summed over all processes, and the number
+    of ``processes``.
+
+    Ingesting a sample and computing the rolling mean take constant time. The
+    minimum, maximum, and percentiles are computed with vectorized NumPy
+    operations over the window. This requires the optional ``numpy`` package.
+
+    Parameters
+    ----------
+    window : int, optional
+        Number of most recent samples kept per source and metric. The default is ``600``.
+
+    Examples
+    --------
+    >>> aggregator = MetricAggregator(window=300)
+    >>> for msg in api.stream_task_host_resources(task_id, project_id):
+    ...     aggregator.add(msg)
+    ...     stats = aggregator.stats(evaluator_name, "cpu")
+    ...     print(f"cpu mean {stats['mean']:.1f}% p95 {stats['p95']:.1f}%")
+
+    """
+
+    def __init__(self, window: int = 600) -> None:
+        """Initialize the aggregator."""
+        if window < 1:
+            raise ClientError("The window must contain at least one sample.")
+        self._np = _import_numpy()
+        self.window = window
+        self._buffers: dict[tuple[str, str], _RingBuffer] = {}
+
+    def add(self, message: Mapping[str, Any]) -> int:
+        """Ingest a metric message.
+
+        Returns
+        -------
+        int
+            Number of metric samples recorded. Messages of other statistics are ignored.
+
+        """
+        tags = message.get("tags")
+        tags = tags if isinstance(tags, Mapping) else {}
+        statistic = tags.get("statistic", message.get("statistic"))
+        extract = _EXTRACTORS.get(statistic)
+        if extract is None:
+            return 0
+        key = "evaluator_name" if statistic == "host_resources" else "task_id"
+        source = tags.get(key, message.get(key))
+        if source is None:
+            return 0
+
+        timestamp = _message_timestamp(message)
+        if timestamp is None:
+            timestamp = time.time()
+        recorded = 0
+        for metric, value in extract(_metric_payload(message)).items():
+            if value is None:
+                continue
+            buffer = self._buffers.get((source, metric))
+            if buffer is None:
+                buffer = self._buffers[(source, metric)] = _RingBuffer(self._np, self.window)
+            buffer.append(timestamp, value)
+            recorded += 1
+        return recorded
+
+    def extend(self, messages: Iterable[Mapping[str, Any]]) -> int:
+        """Ingest several metric messages and get the number of samples recorded."""
+        return sum(self.add(m) for m in messages)
+
+    @property
+    def sources(self) -> list[str]:
+        """Get the evaluator names and task IDs with recorded samples."""
+        return sorted({source for source, _ in self._buffers})
+
+    def metrics(self, source: str) -> list[str]:
+        """Get the names of the metrics recorded for a source."""
+        return sorted(metric for s, metric in self._buffers if s == source)
+
+    def _buffer(self, source: str, metric: str) -> _RingBuffer:
+        try:
+            return self._buffers[(source, metric)]
+        except KeyError:
+            raise ClientError(f"No samples of metric '{metric}' for '{source}'.") from None
+
+    def mean(self, source: str, metric: str) -> float:
+        """Get the rolling mean of a metric."""
+        buffer = self._buffer(source, metric)
+        return buffer.total / buffer.count
+
+    def stats(
+        self, source: str, metric: str, percentiles: Iterable[float] = (50, 95)
+    ) -> dict[str, float]:
+        """Get rolling statistics of a metric.
+
+        Parameters
+        ----------
+        source : str
+            Evaluator name or task ID.
+        metric : str
+            Name of the metric, such as ``"cpu"``.
+        percentiles : Iterable[float], optional
+            Percentiles to compute. The default is ``(50, 95)``.
+
+        Returns
+        -------
+        dict[str, float]
+            ``count``, ``last``, ``mean``, ``min`` and ``max`` of the samples in the
+            window, and one ``p<percentile>`` entry per percentile, such as ``p95``.
+
+        """
+        buffer = self._buffer(source, metric)
+        values = buffer.values[: buffer.count]
+        result = {
+            "count": buffer.count,
+            "last": float(buffer.values[buffer.next - 1]),
+            "mean": buffer.total / buffer.count,
+            "min": float(values.min()),
+            "max": float(values.max()),
+        }
+        percentiles = list(percentiles)
+        if percentiles:
+            for p, v in zip(percentiles, self._np.percentile(values, percentiles), strict=True):
+                result[f"p{p:g}"] = float(v)
+        return result
+
+    def summary(self, percentiles: Iterable[float] = (50, 95)) -> dict[str, dict[str, dict]]:
+        """Get the rolling statistics of all metrics of all sources, keyed by source and metric."""
+        percentiles = list(percentiles)
+        result: dict[str, dict[str, dict]] = {}
+        for source, metric in sorted(self._buffers):
+            result.setdefault(source, {})[metric] = self.stats(source, metric, percentiles)
+        return result
+
+    def snapshot(self, source: str, metric: str, points: int = 60):
+        """Get the samples of a metric in the window, downsampled by averaging.
+
+        Parameters
+        ----------
+        source : str
+            Evaluator name or task ID.
+        metric : str
+            Name of the metric, such as ``"cpu"``.
+        points : int, optional
+            Maximum number of points returned. Consecutive samples are averaged
+            into buckets of equal size. The default is ``60``.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Timestamps in seconds since the epoch and values, from the oldest to the
+            most recent one.
+
+        """
+        buffer = self._buffer(source, metric)
+        times = buffer.ordered(buffer.times)
+        values = buffer.ordered(buffer.values)
+        if points < 1:
+            raise ClientError("The number of points must be positive.")
+        if buffer.count <= points:
+            return times.copy(), values.copy()
+        # Split into buckets of sizes differing by at most one sample
+        edges = self._np.linspace(0, buffer.count, points + 1).astype(self._np.int64)
+        counts = self._np.diff(edges)
+        return (
+            self._np.add.reduceat(times, edges[:-1]) / counts,
+            self._np.add.reduceat(values, edges[:-1]) / counts,
+        )
+
+    def clear(self, source: str | None = None) -> None:
+        """Discard the samples of a source, or of all sources."""
+        for key in [k for k in self._buffers if source is None or k[0] == source]:
+            del self._buffers[key]
@@ -25,9 +25,18 @@
 from __future__ import annotations
 
 import json
+import logging
+import math
+import re
+import threading
+import time
 import urllib.parse
-from collections.abc import Generator, Mapping
-from typing import Any
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Mapping, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import backoff
 
 from ansys.hps.client.client import Client
 from ansys.hps.client.exceptions import ClientError
@@ -36,11 +45,28 @@ from ..models import (
     BuildInfoResponse,
     ListTagsCommand,
     ListTagsResponse,
+    LogMatch,
     MessageEnvelope,
     MonitorMessage,
+    ProcessTreeDiff,
     SubscribeCommand,
 )
 
+if TYPE_CHECKING:
+    from .monitor_hub import MonitorHub
+    from .monitor_session import MonitorSession
+    from .stream_recorder import StreamRecorder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+#: Fastest available JSON decoder, used by the raw decoding mode.
+_fast_loads = orjson.loads if orjson is not None else json.loads
+
 
 class ClientType:
     """Known ``client_type`` tag values used by the HPS monitor.
@@ -92,6 +118,41 @@ class MonitorApi:
         Full WebSocket URL override, for example
         ``wss://localhost:8443/hps/monitor/ws/topics``. If omitted, the URL
         is derived from ``client.url``. The default is ``None``.
+    reconnect : bool, optional
+        Whether subscription streams survive connection failures. When ``True``,
+        a receive timeout no longer ends a stream. A closed or failed connection is
+        reopened with a jittered exponential backoff, refreshing the access token
+        through the client on authorization errors. The stream then resubscribes
+        with a backlog sized to cover the messages missed since the last seen one.
+        Messages of the backlog that were already yielded before the reconnection,
+        up to the timestamp of the last one, are dropped. Identical messages outside
+        of this overlap are all yielded. The default is ``False``.
+    max_reconnect_attempts : int, optional
+        Maximum number of consecutive failed reconnection attempts before a
+        stream raises an error. The default is ``10``.
+    max_reconnect_delay : float, optional
+        Upper bound in seconds of the backoff between reconnection attempts.
+        The default is ``30.0``.
+    dedup_window : int, optional
+        Number of most recent messages remembered to drop the already yielded
+        messages of the backlog after a reconnection. The default is ``10000``.
+    recorder : StreamRecorder, optional
+        Recorder receiving the raw payloads of all the streams and sessions of this
+        API, to replay them later with :class:`StreamReplayer`. The default is
+        ``None``.
+    raw : bool, optional
+        Whether streams and sessions yield plain message dictionaries instead of
+        :class:`MonitorMessage` wrappers. Payloads are then decoded with ``orjson``
+        when it is installed. This lowers the per-message overhead of high-rate
+        topics. The default is ``False``.
+    fields : Sequence[str], optional
+        Fields selected from each message, implying ``raw=True``. Streams and
+        sessions then yield tuples of the field values, ``None`` for missing
+        ones. Nested fields are given by dotted paths, such as ``"tags.task_id"``.
+        The default is ``None``, in which case whole messages are yielded.
+    evaluator_cache_ttl : float, optional
+        Number of seconds the evaluator resolved for a task is cached by
+        :meth:`resolve_evaluators_for_tasks`. The default is ``60.0``.
 
     Notes
     -----
@@ -109,12 +170,33 @@ class MonitorApi:
         ws_connection_options: dict[str, Any] | None = None,
         timeout_seconds: float = 10.0,
         ws_url: str | None = None,
+        reconnect: bool = False,
+        max_reconnect_attempts: int = 10,
+        max_reconnect_delay: float = 30.0,
+        dedup_window: int = 10000,
+        recorder: StreamRecorder | None = None,
+        raw: bool = False,
+        fields: Sequence[str] | None = None,
+        evaluator_cache_ttl: float = 60.0,
     ) -> None:
         """Initialize the MonitorApi client."""
         self.client = client
         self.ws_connection_options = ws_connection_options
         self.timeout_seconds = timeout_seconds
         self._ws_url_override = ws_url
+        self.reconnect = reconnect
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.max_reconnect_delay = max_reconnect_delay
+        self.dedup_window = dedup_window
+        self.recorder = recorder
+        self.raw = raw or fields is not None
+        self.fields = list(fields) if fields is not None else None
+        self._getters = [_field_getter(f) for f in fields] if fields is not None else None
+        self.evaluator_cache_ttl = evaluator_cache_ttl
+        self._evaluator_cache: dict[tuple[str, str], tuple[float, str]] = {}
+        self._evaluator_cache_lock = threading.Lock()
+        self._hub: MonitorHub | None = None
+        self._hub_lock = threading.Lock()
 
     @property
     def base_url(self) -> str:
@@ -132,36 +214,128 @@ class MonitorApi:
 
     def _resolve_evaluator_name_for_task(self, task_id: str, project_id: str) -> str:
         """Resolve evaluator name for a task using JMS task host_id and RMS evaluator data."""
+        resolved, errors = self._resolve_evaluators([task_id], project_id)
+        if task_id not in resolved:
+            raise ClientError(errors[task_id])
+        return resolved[task_id]
+
+    def resolve_evaluators_for_tasks(self, task_ids: list[str], project_id: str) -> dict[str, str]:
+        """Resolve the names of the evaluators running tasks.
+
+        Tasks resolved less than ``evaluator_cache_ttl`` seconds ago are served from
+        a cache. The others are resolved together, with one JMS query of their hosts
+        and one RMS query of the evaluators of these hosts, split into several
+        queries only when the lists of IDs are too long for a single URL.
+
+        Parameters
+        ----------
+        task_ids : list[str]
+            Identifiers of the tasks.
+        project_id : str
+            Identifier of the JMS project owning the tasks.
+
+        Returns
+        -------
+        dict[str, str]
+            Evaluator name of each task. Tasks without a host or whose host has no
+            named evaluator are omitted.
+
+        """
+        resolved, errors = self._resolve_evaluators(task_ids, project_id)
+        for message in errors.values():
+            log.warning(message)
+        return resolved
+
+    def _resolve_evaluators(
+        self, task_ids: list[str], project_id: str
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Resolve evaluator names of tasks, with the reason of each failed resolution."""
         from ansys.hps.client.jms import ProjectApi  # noqa: PLC0415
+        from ansys.hps.client.jms.api.base import _split_id_filter  # noqa: PLC0415
         from ansys.hps.client.rms import RmsApi  # noqa: PLC0415
 
+        resolved: dict[str, str] = {}
+        missing: list[str] = []
+        now = time.monotonic()
+        with self._evaluator_cache_lock:
+            for task_id in dict.fromkeys(task_ids):
+                cached = self._evaluator_cache.get((project_id, task_id))
+                if cached is not None and now - cached[0] < self.evaluator_cache_ttl:
+                    resolved[task_id] = cached[1]
+                else:
+                    missing.append(task_id)
+        if not missing:
+            return resolved, {}
+
         client = self._integration_client()
+        project_api = ProjectApi(client, project_id)
+        hosts: dict[str, str] = {}
+        # Chunk the IDs so that each query fits in the URL and can carry its limit,
+        # which a query split by the API itself does not allow
+        for chunk in _split_id_filter("id", missing):
+            tasks = project_api.get_tasks(id=chunk, fields=["id", "host_id"], limit=len(chunk))
+            hosts.update((task.id, task.host_id) for task in tasks if task.host_id)
+
+        names: dict[str, str | None] = {}
+        rms = RmsApi(client)
+        for chunk in _split_id_filter("host_id", sorted(set(hosts.values()))):
+            evaluators = rms.get_evaluators(
+                host_id=chunk,
+                fields=["id", "name", "host_id"],
+                limit=_EVALUATORS_PER_HOST * len(chunk),
+            )
+            for evaluator in evaluators:
+                if not names.get(evaluator.host_id):
+                    names[evaluator.host_id] = evaluator.name
+
+        errors: dict[str, str] = {}
+        now = time.monotonic()
+        with self._evaluator_cache_lock:
+            for task_id in missing:
+                host_id = hosts.get(task_id)
+                if not host_id:
+                    errors[task_id] = f"Could not resolve host_id for task '{task_id}' from JMS."
+                elif host_id not in names:
+                    errors[task_id] = (
+                        f"Could not resolve evaluator for host_id '{host_id}' from RMS."
+                    )
+                elif not names[host_id]:
+                    errors[task_id] = (
+                        f"Evaluator for host_id '{host_id}' does not provide a name in RMS."
+                    )
+                else:
+                    resolved[task_id] = names[host_id]
+                    self._evaluator_cache[(project_id, task_id)] = (now, names[host_id])
+        return resolved, errors
 
-        host_id: str | None = None
+    @property
+    def hub(self) -> MonitorHub:
+        """Get the hub sharing the subscriptions of the streams of this API."""
+        with self._hub_lock:
+            if self._hub is None:
+                from .monitor_hub import MonitorHub  # noqa: PLC0415
 
-        tasks = ProjectApi(client, project_id).get_tasks(
-            id=task_id,
-            fields=["id", "host_id"],
-        )
-        if tasks:
-            host_id = tasks[0].host_id
+                self._hub = MonitorHub(self)
+            return self._hub
 
-        if not host_id:
-            raise ClientError(f"Could not resolve host_id for task '{task_id}' from JMS.")
+    def open_session(self) -> MonitorSession:
+        """Open a session sharing one WebSocket connection between many subscriptions.
 
-        rms = RmsApi(client)
-        evaluators = rms.get_evaluators(
-            host_id=host_id,
-            fields=["id", "name", "host_id"],
-        )
-        if not evaluators:
-            raise ClientError(f"Could not resolve evaluator for host_id '{host_id}' from RMS.")
+        Returns
+        -------
+        MonitorSession
+            Session to subscribe with. Close it, or use it as a context manager,
+            to close the connection.
+
+        Examples
+        --------
+        >>> with api.open_session() as session:
+        ...     subscriptions = [session.subscribe_task_logs(t) for t in task_ids]
 
-        evaluator_name = evaluators[0].name
-        if not evaluator_name:
-            raise ClientError(f"Evaluator for host_id '{host_id}' does not provide a name in RMS.")
+        """
+        from .monitor_session import MonitorSession  # noqa: PLC0415
 
-        return evaluator_name
+        return MonitorSession(self)
 
     def _validated_http_url(self, url: str) -> str:
         parsed = urllib.parse.urlsplit(url)
@@ -252,7 +426,7 @@ class MonitorApi:
             List of messages received in response to the command.
 
         """
-        return list(self._stream_ws(command, max_messages))
+        return list(self._stream_ws(command, max_messages, typed=True))
 
     @property
     def ws_url(self) -> str:
@@ -262,6 +436,37 @@ class MonitorApi:
         base = self.base_url.rstrip("/").replace("http", "ws", 1)
         return f"{base}/monitor/ws/topics"
 
+    @staticmethod
+    def _task_logs_topic(task_id: str, file_path: str | None = None) -> dict[str, str]:
+        """Build the filter topic of the log files of a task."""
+        topic: dict[str, str] = {
+            "task_id": task_id,
+            "client_type": ClientType.FILE_TAIL,
+        }
+        if file_path is not None:
+            topic["file_path"] = file_path
+        return topic
+
+    @staticmethod
+    def _process_tree_topic(task_id: str) -> dict[str, str]:
+        """Build the filter topic of the process-tree metrics of a task."""
+        return {
+            "task_id": task_id,
+            "client_type": ClientType.EVALUATOR,
+            "type": "metric",
+            "statistic": "process_tree",
+        }
+
+    @staticmethod
+    def _host_resources_topic(evaluator_name: str) -> dict[str, str]:
+        """Build the filter topic of the host-resource metrics of an evaluator."""
+        return {
+            "evaluator_name": evaluator_name,
+            "client_type": ClientType.EVALUATOR,
+            "type": "metric",
+            "statistic": "host_resources",
+        }
+
     def _subscribe_command(
         self,
         topics: list[dict[str, str]],
@@ -350,15 +555,88 @@ class MonitorApi:
             Parsed JSON message dicts from the server.
 
         """
-        topic: dict[str, str] = {
-            "task_id": task_id,
-            "client_type": ClientType.FILE_TAIL,
-        }
-        if file_path is not None:
-            topic["file_path"] = file_path
-        command = self._subscribe_command(topics=[topic], backlog=backlog)
+        command = self._subscribe_command(
+            topics=[self._task_logs_topic(task_id, file_path)], backlog=backlog
+        )
         yield from self._stream_ws(command, max_messages)
 
+    def search_task_logs(
+        self,
+        task_ids: list[str],
+        pattern: str | re.Pattern,
+        *,
+        since: float | datetime | None = None,
+        regex: bool = False,
+        ignore_case: bool = False,
+        max_matches: int | None = 1,
+        file_path: str | None = None,
+        backlog: int = 1000,
+        timeout: float | None = None,
+    ) -> dict[str, list[LogMatch]]:
+        """Search the log files of many tasks for a pattern.
+
+        The logs of all tasks are subscribed to concurrently over a single
+        connection. Lines are matched as messages arrive, keeping only the location
+        of the matches, and the subscription of a task is closed as soon as it has
+        ``max_matches`` matches. The monitor has no server-side filtering of log
+        content, so the lines are still transferred until then.
+
+        Parameters
+        ----------
+        task_ids : list[str]
+            Identifiers of the tasks whose logs are searched.
+        pattern : str or re.Pattern
+            Substring to search for, or regular expression if ``regex=True`` or if
+            it is a compiled pattern.
+        since : float or datetime, optional
+            Only search messages logged at or after this time, in seconds since the
+            epoch. Messages without a timestamp are always searched. The default
+            is ``None``.
+        regex : bool, optional
+            Whether *pattern* is a regular expression. The default is ``False``.
+        ignore_case : bool, optional
+            Whether to ignore the case of letters. The default is ``False``.
+        max_matches : int or None, optional
+            Number of matches after which the search of a task ends. The default is
+            ``1``, which stops at the first match. ``None`` keeps all matches.
+        file_path : str, optional
+            Restrict the search to a single log file name. The default is ``None``.
+        backlog : int, optional
+            Number of historical messages requested per task. The default is
+            ``1000``.
+        timeout : float, optional
+            Number of seconds without new messages after which the search ends.
+            The default is ``timeout_seconds``.
+
+        Returns
+        -------
+        dict[str, list[LogMatch]]
+            Locations of the matches of each task, in the order they arrived.
+
+        Examples
+        --------
+        >>> matches = api.search_task_logs(task_ids, r"error|fatal", regex=True, ignore_case=True)
+        >>> failed = [task_id for task_id, found in matches.items() if found]
+
+        """
+        search = _LogSearch(
+            task_ids,
+            _line_matcher(pattern, regex, ignore_case),
+            since.timestamp() if isinstance(since, datetime) else since,
+            max_matches,
+        )
+        if not search.pending:
+            return search.matches
+        with self.open_session() as session:
+            for task_id in task_ids:
+                search.subscriptions[task_id] = session.subscribe(
+                    [self._task_logs_topic(task_id, file_path)],
+                    backlog=backlog,
+                    message_queue=search,
+                )
+            search.wait(session, self.timeout_seconds if timeout is None else timeout)
+        return search.matches
+
     def resolve_project_id_for_task(
         self,
         task_id: str,
@@ -393,11 +671,8 @@ class MonitorApi:
             If no inspected message provides a project ID.
 
         """
-        for msg in self.stream_task_logs(
-            task_id=task_id,
-            backlog=backlog,
-            max_messages=max_messages,
-        ):
+        command = self._subscribe_command(topics=[self._task_logs_topic(task_id)], backlog=backlog)
+        for msg in self._stream_ws(command, max_messages, typed=True):
             if not isinstance(msg, Mapping):
                 continue
 
@@ -490,18 +765,65 @@ class MonitorApi:
 
         """
         command = self._subscribe_command(
-            topics=[
-                {
-                    "task_id": task_id,
-                    "client_type": ClientType.EVALUATOR,
-                    "type": "metric",
-                    "statistic": "process_tree",
-                }
-            ],
-            backlog=backlog,
+            topics=[self._process_tree_topic(task_id)], backlog=backlog
         )
         yield from self._stream_ws(command, max_messages)
 
+    def stream_task_process_tree_diffs(
+        self,
+        task_id: str,
+        *,
+        backlog: int = 100,
+        max_messages: int | None = None,
+        resync_every: int | None = None,
+        tolerance: float = 0.0,
+    ) -> Generator[ProcessTreeDiff, None, None]:
+        """Stream the changes of the process tree of a task.
+
+        Diffs each snapshot of :meth:`stream_task_process_tree` against the previous
+        one with a :class:`ProcessTreeDiffer`, and yields only the processes spawned
+        and exited and the changed attributes. Snapshots without changes are
+        skipped. The first snapshot is yielded in full.
+
+        Parameters
+        ----------
+        task_id : str
+            The task identifier to monitor.
+        backlog : int, optional
+            Number of historical snapshots to request on connect. The default is
+            ``100``.
+        max_messages : int or None, optional
+            Maximum total snapshots to read before closing the connection. The
+            default is ``None``, which streams indefinitely until interrupted or the
+            server closes the connection.
+        resync_every : int, optional
+            Number of snapshots after which a full snapshot is yielded again. The
+            default is ``None``, which never resyncs.
+        tolerance : float, optional
+            Largest change of a numeric attribute that is not reported. The default
+            is ``0.0``, which reports every change.
+
+        Yields
+        ------
+        ProcessTreeDiff
+            Changes of the process tree since the previous yielded state.
+
+        Examples
+        --------
+        >>> for diff in api.stream_task_process_tree_diffs("task-123", resync_every=100):
+        ...     print(f"spawned {list(diff.spawned)}, exited {diff.exited}")
+
+        """
+        from .process_tree_diff import ProcessTreeDiffer  # noqa: PLC0415
+
+        command = self._subscribe_command(
+            topics=[self._process_tree_topic(task_id)], backlog=backlog
+        )
+        # Field tuples can't be diffed, whole messages are needed
+        messages = self._stream_ws(command, max_messages, typed=self._getters is not None)
+        differ = ProcessTreeDiffer(resync_every=resync_every, tolerance=tolerance)
+        yield from differ.diffs(messages)
+
     def stream_task_host_resources(
         self,
         task_id: str,
@@ -509,12 +831,13 @@ class MonitorApi:
         *,
         backlog: int = 100,
         max_messages: int | None = None,
+        share: bool = False,
     ) -> Generator[MonitorMessage, None, None]:
         """Stream CPU and memory metric updates for the host running a specific task.
 
-        Resolves the task's assigned evaluator (via JMS and RMS) and
-        subscribes to ``host_resources`` metric messages for that evaluator.
-        Yields each update as it arrives.
+        Resolves the task's assigned evaluator (via JMS and RMS, cached for
+        ``evaluator_cache_ttl`` seconds) and subscribes to ``host_resources``
+        metric messages for that evaluator. Yields each update as it arrives.
 
         Parameters
         ----------
@@ -529,6 +852,13 @@ class MonitorApi:
             Maximum total messages to yield before closing the connection.
             The default is ``None``, which streams indefinitely until
             interrupted or the server closes the connection.
+        share : bool, optional
+            Whether to share the subscription with the other shared streams of
+            the same evaluator, through :attr:`hub`. Tasks running on the same
+            host then use a single connection, closed when the last of their
+            streams is closed. Only the stream opening the subscription receives
+            the backlog, the others receive the latest messages of the hub
+            instead. The default is ``False``.
 
         Yields
         ------
@@ -544,17 +874,12 @@ class MonitorApi:
 
         """
         evaluator_name = self._resolve_evaluator_name_for_task(task_id, project_id)
-        command = self._subscribe_command(
-            topics=[
-                {
-                    "evaluator_name": evaluator_name,
-                    "client_type": ClientType.EVALUATOR,
-                    "type": "metric",
-                    "statistic": "host_resources",
-                }
-            ],
-            backlog=backlog,
-        )
+        topics = [self._host_resources_topic(evaluator_name)]
+        if share:
+            with self.hub.join(topics, backlog=backlog) as consumer:
+                yield from consumer.messages(max_messages)
+            return
+        command = self._subscribe_command(topics=topics, backlog=backlog)
         yield from self._stream_ws(command, max_messages)
 
     def stream_scheduler_job_status(
@@ -608,12 +933,14 @@ class MonitorApi:
         )
         yield from self._stream_ws(command, max_messages)
 
-    def _stream_ws(
-        self,
-        command: dict[str, Any],
-        max_messages: int | None,
-    ) -> Generator[MonitorMessage, None, None]:
-        """Connect, send *command*, and yield up to *max_messages* messages."""
+    def _with_token(self, command: dict[str, Any]) -> dict[str, Any]:
+        """Add the access token to *command* unless it already carries one."""
+        if self.token and "token" not in command:
+            return {**command, "token": self.token}
+        return command
+
+    def _connect_ws(self):
+        """Open an authenticated connection to the monitor WebSocket endpoint."""
         try:
             from websocket import create_connection  # noqa: PLC0415
         except ImportError as exc:  # pragma: no cover
@@ -622,9 +949,6 @@ class MonitorApi:
                 "Install dependencies from requirements.txt."
             ) from exc
 
-        if self.token and "token" not in command:
-            command = {**command, "token": self.token}
-
         connection_options: dict[str, Any] = {"timeout": self.timeout_seconds}
         if self.ws_connection_options:
             connection_options.update(self.ws_connection_options)
@@ -639,31 +963,377 @@ class MonitorApi:
             else:
                 connection_options["header"] = {"Authorization": "Bearer " + self.token}
 
-        ws = create_connection(self.ws_url, **connection_options)
+        return create_connection(self.ws_url, **connection_options)
+
+    def decode_frame(self, frame: str | bytes) -> list[Any]:
+        """Decode a raw WebSocket payload into messages.
+
+        Messages are returned in the format yielded by the streams of this API,
+        according to ``raw`` and ``fields``.
+
+        Parameters
+        ----------
+        frame : str or bytes
+            Payload as received from the monitor WebSocket endpoint or replayed by
+            :meth:`StreamReplayer.frames`.
+
+        Returns
+        -------
+        list
+            :class:`MonitorMessage` wrappers, message dictionaries or field tuples.
+
+        """
+        messages = self._decode(frame)
+        if self._getters is None:
+            return messages
+        return [self._project(message) for message in messages]
+
+    def _decode(self, frame: str | bytes, typed: bool = False) -> list[Any]:
+        """Decode *frame* into message wrappers, or dictionaries in raw mode."""
+        if typed or not self.raw:
+            return MessageEnvelope.from_payload(json.loads(frame)).messages
+        return _raw_messages(_fast_loads(frame))
+
+    def _project(self, message: Mapping[str, Any]) -> Any:
+        """Select the configured fields of *message*, if any."""
+        if self._getters is None:
+            return message
+        return tuple(getter(message) for getter in self._getters)
+
+    def _recv(self, ws) -> str | bytes:
+        """Receive a payload from *ws*, recording it if a recorder is set."""
+        raw = ws.recv()
+        if raw and self.recorder is not None:
+            self.recorder.record(raw)
+        return raw
+
+    def _stream_ws(
+        self,
+        command: dict[str, Any],
+        max_messages: int | None,
+        typed: bool = False,
+    ) -> Generator[MonitorMessage, None, None]:
+        """Connect, send *command*, and yield up to *max_messages* messages.
+
+        With *typed*, :class:`MonitorMessage` wrappers are yielded whatever the
+        decoding mode of the API.
+        """
+        if self.reconnect and command.get("action") == "subscribe":
+            yield from self._stream_ws_resilient(command, max_messages, typed)
+            return
+
+        project = self._project if self._getters is not None and not typed else None
+
+        ws = self._connect_ws()
         try:
-            ws.send(json.dumps(command))
+            ws.send(json.dumps(self._with_token(command)))
             yielded = 0
             while max_messages is None or yielded < max_messages:
                 try:
-                    raw = ws.recv()
+                    raw = self._recv(ws)
                 except Exception as exc:
-                    if exc.__class__.__name__ in {
-                        "TimeoutError",
-                        "WebSocketTimeoutError",
-                        "WebSocketTimeoutException",
-                    }:
+                    if _is_timeout(exc):
                         break
                     raise
                 if not raw:
                     break
 
-                payload = json.loads(raw)
-                messages = MessageEnvelope.from_payload(payload).messages
-
-                for message in messages:
-                    yield message
+                for message in self._decode(raw, typed):
+                    yield project(message) if project else message
                     yielded += 1
                     if max_messages is not None and yielded >= max_messages:
                         break
         finally:
             ws.close()
+
+    def _refresh_token(self) -> None:
+        """Request a new access token from the client, if it supports it."""
+        refresh = getattr(self.client, "refresh_access_token", None)
+        if refresh is None:
+            return
+        try:
+            refresh()
+        except Exception as exc:
+            log.warning(f"Failed to refresh the access token: {exc}")
+
+    def _stream_ws_resilient(
+        self,
+        command: dict[str, Any],
+        max_messages: int | None,
+        typed: bool = False,
+    ) -> Generator[MonitorMessage, None, None]:
+        """Yield messages of a subscription, reconnecting and resubscribing on failures."""
+        project = self._project if self._getters is not None and not typed else None
+        recent: deque[int] = deque(maxlen=self.dedup_window)
+        # Keys of the messages yielded before the last reconnection, while in its overlap
+        replay: Counter[int] | None = None
+        last_timestamp = None
+        rate = _RateTracker()
+        yielded = 0
+        failures = 0
+        while True:
+            ws = None
+            try:
+                ws = self._connect_ws()
+                ws.send(json.dumps(self._with_token(command)))
+                while max_messages is None or yielded < max_messages:
+                    try:
+                        raw = self._recv(ws)
+                    except Exception as exc:
+                        if _is_timeout(exc):
+                            # Idle subscription, keep waiting
+                            continue
+                        raise
+                    if not raw:
+                        raise ConnectionError("Monitor connection closed by the server")
+                    failures = 0
+
+                    for message in self._decode(raw, typed):
+                        key = _message_key(message)
+                        timestamp = _message_timestamp(message)
+                        if replay is not None:
+                            if (
+                                timestamp is not None
+                                and last_timestamp is not None
+                                and timestamp > last_timestamp
+                            ):
+                                # Past the overlap with the messages already yielded
+                                replay = None
+                            elif replay[key] > 0:
+                                replay[key] -= 1
+                                continue
+                        recent.append(key)
+                        if timestamp is not None:
+                            last_timestamp = max(last_timestamp or timestamp, timestamp)
+                        rate.add(timestamp)
+                        yield project(message) if project else message
+                        yielded += 1
+                        if max_messages is not None and yielded >= max_messages:
+                            return
+                return
+            except ClientError:
+                raise
+            except Exception as exc:
+                failures += 1
+                if failures > self.max_reconnect_attempts:
+                    raise ClientError(
+                        f"Monitor stream failed after {self.max_reconnect_attempts} "
+                        f"reconnection attempts: {exc}"
+                    ) from exc
+                if getattr(exc, "status_code", None) in (401, 403):
+                    log.info("Monitor connection unauthorized: Trying to get a new access token.")
+                    self._refresh_token()
+                delay = backoff.full_jitter(min(self.max_reconnect_delay, 2.0 ** (failures - 1)))
+                log.warning(f"Monitor connection lost ({exc}), reconnecting in {delay:.1f}s")
+                time.sleep(delay)
+
+                backlog = rate.backlog(time.time())
+                if backlog is not None:
+                    command = {**command, "backlog": {"limit": backlog}}
+                    replay = Counter(recent)
+            finally:
+                if ws is not None:
+                    ws.close()
+
+
+#: Evaluators requested per host when resolving the evaluators of tasks, to include stale
+#: registrations of a host.
+_EVALUATORS_PER_HOST = 5
+
+#: Messages requested on top of the estimated number of missed messages on resubscription.
+_RESUME_BACKLOG_MARGIN = 10
+
+#: Upper bound of the backlog requested on resubscription.
+_MAX_RESUME_BACKLOG = 10000
+
+
+class _RateTracker:
+    """Track the message rate to size the backlog requested after a reconnection."""
+
+    def __init__(self) -> None:
+        self.first: float | None = None
+        self.last: float | None = None
+        self.count = 0
+
+    def add(self, timestamp: float | None) -> None:
+        """Record a message with its timestamp, or the current time if it has none."""
+        timestamp = timestamp if timestamp is not None else time.time()
+        if self.first is None:
+            self.first = timestamp
+        self.last = max(self.last or timestamp, timestamp)
+        self.count += 1
+
+    def backlog(self, now: float) -> int | None:
+        """Estimate the number of messages sent since the last seen one."""
+        if self.last is None:
+            return None
+        elapsed = self.last - self.first
+        rate = (self.count - 1) / elapsed if elapsed > 0 else 0.0
+        missed = math.ceil(rate * max(now - self.last, 0.0))
+        return min(_MAX_RESUME_BACKLOG, missed + _RESUME_BACKLOG_MARGIN)
+
+
+def _raw_messages(payload: Any) -> list[dict[str, Any]]:
+    """Get the message dictionaries of a decoded payload, as :class:`MessageEnvelope`."""
+    if isinstance(payload, dict):
+        messages = payload.get("messages")
+        if not isinstance(messages, list):
+            return [payload]
+    elif isinstance(payload, list):
+        messages = payload
+    else:
+        return []
+    return [message for message in messages if isinstance(message, dict)]
+
+
+def _field_getter(path: str) -> Callable[[Mapping[str, Any]], Any]:
+    """Build a function getting the field of a message at a dotted *path*."""
+    keys = path.split(".")
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda message: message.get(key)
+
+    def get(message: Mapping[str, Any]) -> Any:
+        value = message
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return get
+
+
+def _message_key(message: Mapping[str, Any]) -> int:
+    """Identify a message by its content, to drop duplicates."""
+    payload = getattr(message, "payload", message)
+    return hash(json.dumps(payload, sort_keys=True, default=str))
+
+
+def _message_timestamp(message: Mapping[str, Any]) -> float | None:
+    """Get the timestamp of a message in seconds since the epoch, if it has one."""
+    tags = message.get("tags")
+    candidates = [tags.get("timestamp"), tags.get("time")] if isinstance(tags, Mapping) else []
+    candidates += [message.get("timestamp"), message.get("time")]
+    for value in candidates:
+        if isinstance(value, int | float):
+            return float(value)
+        if isinstance(value, str) and value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+            try:
+                return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                pass
+    return None
+
+
+def _line_matcher(
+    pattern: str | re.Pattern, regex: bool, ignore_case: bool
+) -> Callable[[str], tuple[int, int] | None]:
+    """Build a function locating *pattern* in a line."""
+    if isinstance(pattern, re.Pattern) or regex or ignore_case:
+        if not isinstance(pattern, re.Pattern):
+            if not regex:
+                pattern = re.escape(pattern)
+            pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        search = pattern.search
+
+        def match(line: str) -> tuple[int, int] | None:
+            found = search(line)
+            return found.span() if found else None
+
+        return match
+
+    size = len(pattern)
+
+    def match(line: str) -> tuple[int, int] | None:
+        start = line.find(pattern)
+        return (start, start + size) if start >= 0 else None
+
+    return match
+
+
+class _LogSearch:
+    """Match the log lines of tasks as they are routed by a session.
+
+    The search is passed as the queue of the subscriptions, so the reader thread of
+    the session matches each message through :meth:`put` and no line is kept.
+    """
+
+    def __init__(
+        self,
+        task_ids: list[str],
+        match: Callable[[str], tuple[int, int] | None],
+        since: float | None,
+        max_matches: int | None,
+    ) -> None:
+        self.match = match
+        self.since = since
+        self.max_matches = max_matches
+        self.matches: dict[str, list[LogMatch]] = {task_id: [] for task_id in task_ids}
+        self.pending = set(self.matches) if max_matches is None or max_matches > 0 else set()
+        self.subscriptions: dict[str, Any] = {}
+        self._lines: Counter[tuple[str, str | None]] = Counter()
+        self._last = time.monotonic()
+        self._cond = threading.Condition()
+
+    def put(self, message: Mapping[str, Any] | None, block: bool = True, timeout=None) -> None:
+        with self._cond:
+            self._last = time.monotonic()
+            if message is not None:
+                self._search(message)
+            self._cond.notify_all()
+
+    def _search(self, message: Mapping[str, Any]) -> None:
+        tags = message.get("tags")
+        tags = tags if isinstance(tags, Mapping) else {}
+        task_id = tags.get("task_id", message.get("task_id"))
+        if task_id not in self.pending:
+            return
+        text = message.get("message", "")
+        if not isinstance(text, str):
+            text = json.dumps(text)
+        file_path = tags.get("file_path")
+        key = (task_id, file_path)
+        first = self._lines[key]
+        lines = text.splitlines() or [""]
+        self._lines[key] += len(lines)
+
+        timestamp = _message_timestamp(message)
+        if self.since is not None and timestamp is not None and timestamp < self.since:
+            return
+        found = self.matches[task_id]
+        for index, line in enumerate(lines):
+            span = self.match(line)
+            if span is None:
+                continue
+            found.append(LogMatch(task_id, file_path, first + index, *span, timestamp))
+            if self.max_matches is not None and len(found) >= self.max_matches:
+                # Early termination of this task, the others go on
+                self.pending.discard(task_id)
+                subscription = self.subscriptions.get(task_id)
+                if subscription is not None:
+                    subscription.close()
+                break
+
+    def wait(self, session: MonitorSession, timeout: float) -> None:
+        """Wait until every task is done, the session ends or no message arrives in time."""
+        with self._cond:
+            while self.pending and not session.closed:
+                remaining = self._last + timeout - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        session._raise_error()
+
+
+def _is_timeout(exc: Exception) -> bool:
+    """Check whether *exc* is a WebSocket receive timeout."""
+    return exc.__class__.__name__ in {
+        "TimeoutError",
+        "WebSocketTimeoutError",
+        "WebSocketTimeoutException",
+    }
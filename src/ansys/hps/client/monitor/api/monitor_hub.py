@@ -0,0 +1,356 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-process fan-out of monitor subscriptions to many consumers."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections import deque
+from collections.abc import Generator, Hashable
+from typing import TYPE_CHECKING, Any
+
+from ..models import MonitorMessage
+from .message_buffer import MessageBuffer, OverflowPolicy
+
+if TYPE_CHECKING:
+    from .monitor_api import MonitorApi
+    from .monitor_session import MonitorSession
+
+log = logging.getLogger(__name__)
+
+
+def _topics_key(topics: list[dict[str, str]]) -> Hashable:
+    """Identify a set of filter topics, whatever the order of topics and items."""
+    return tuple(sorted({tuple(sorted((k, str(v)) for k, v in t.items())) for t in topics}))
+
+
+class HubConsumer:
+    """Consumer of a subscription shared through a :class:`MonitorHub`.
+
+    Iterate over a consumer to receive the messages of its topics as they arrive.
+    The iteration ends when the consumer leaves or the upstream connection ends.
+
+    Use :meth:`MonitorHub.join` to create instances.
+
+    Attributes
+    ----------
+    topics : list[dict[str, str]]
+        Filter topics of the shared subscription.
+    buffer : MessageBuffer
+        Buffer of the messages not consumed yet, starting with the replayed ones.
+        It holds whole messages, the ``fields`` of the monitor API being selected
+        as they are yielded.
+
+    """
+
+    def __init__(self, upstream: _Upstream, buffer: MessageBuffer) -> None:
+        """Initialize the consumer."""
+        self.topics = upstream.topics
+        self.buffer = buffer
+        self._upstream = upstream
+        self.closed = False
+
+    def __enter__(self) -> HubConsumer:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Leave the hub when leaving the context manager."""
+        self.close()
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of messages dropped because the consumer was too slow."""
+        return self.buffer.dropped
+
+    def messages(
+        self, max_messages: int | None = None, timeout: float | None = None
+    ) -> Generator[MonitorMessage, None, None]:
+        """Yield messages of the shared subscription as they arrive.
+
+        Parameters
+        ----------
+        max_messages : int or None, optional
+            Maximum number of messages to yield. The default is ``None``, which
+            yields messages until the consumer leaves or the upstream ends.
+        timeout : float or None, optional
+            Maximum number of seconds to wait for each message. The iteration ends
+            when no message arrives in time. The default is ``None``, which waits
+            indefinitely.
+
+        Yields
+        ------
+        MonitorMessage
+            Messages matching the topics, starting with the replayed ones.
+
+        """
+        yielded = 0
+        while max_messages is None or yielded < max_messages:
+            try:
+                message = self.buffer.get(timeout=timeout)
+            except queue.Empty:
+                return
+            if message is None:
+                if not self.closed:
+                    self._upstream.raise_error()
+                return
+            yield self._upstream.hub.monitor_api._project(message)
+            yielded += 1
+
+    def __iter__(self):
+        """Iterate over the messages of the consumer."""
+        return self.messages()
+
+    def close(self) -> None:
+        """Leave the hub, closing the upstream subscription if no consumer is left."""
+        if not self.closed:
+            self.closed = True
+            self.buffer.clear()
+            self.buffer.put(None)
+            self._upstream.leave(self)
+
+
+class _Upstream:
+    """Subscription of a dedicated session, fanned out to the buffers of its consumers.
+
+    The upstream is passed as the queue of the subscription, so the reader thread of
+    the session dispatches each message through :meth:`put`.
+    """
+
+    def __init__(self, hub: MonitorHub, topics: list[dict[str, str]], replay: int) -> None:
+        self.hub = hub
+        self.topics = topics
+        self.key = _topics_key(topics)
+        self.consumers: list[HubConsumer] = []
+        self.recent: deque[MonitorMessage] = deque(maxlen=replay)
+        self.session: MonitorSession | None = None
+        self.ended = False
+        self._lock = threading.Lock()
+
+    def put(self, message: MonitorMessage | None, block: bool = True, timeout=None) -> None:
+        with self._lock:
+            if message is None:
+                self.ended = True
+            else:
+                self.recent.append(message)
+            consumers = list(self.consumers)
+        if message is None:
+            # Let new consumers open a new upstream
+            self.hub._discard(self)
+        for consumer in consumers:
+            consumer.buffer.put(message)
+
+    def add(self, consumer: HubConsumer, replay: int | None) -> None:
+        with self._lock:
+            # Replay under the lock so the consumer neither misses nor repeats messages
+            count = min(len(self.recent), consumer.buffer.maxsize)
+            if replay is not None:
+                count = min(count, max(replay, 0))
+            for message in list(self.recent)[len(self.recent) - count :]:
+                consumer.buffer.put(message)
+            if self.ended:
+                consumer.buffer.put(None)
+            self.consumers.append(consumer)
+
+    def leave(self, consumer: HubConsumer) -> None:
+        self.hub._leave(self, consumer)
+
+    def raise_error(self) -> None:
+        if self.session is not None:
+            self.session._raise_error()
+
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+
+
+class MonitorHub:
+    """Share monitor subscriptions between many in-process consumers.
+
+    Consumers joining with the same set of filter topics share a single upstream
+    subscription, over its own WebSocket connection, instead of each opening one.
+    The hub counts the consumers of each upstream and closes its connection when
+    the last one leaves. Every message is copied to the buffer of each consumer, so
+    a slow consumer only affects its own buffer, according to its overflow policy.
+    The latest messages of each upstream are kept to be replayed to late joiners.
+
+    Parameters
+    ----------
+    monitor_api : MonitorApi
+        Monitor API providing the connections.
+    replay : int, optional
+        Number of latest messages of each upstream replayed to consumers joining
+        it later. The default is ``100``.
+    maxsize : int, optional
+        Maximum number of pending messages of each consumer. The default is
+        ``1000``.
+    overflow : str, optional
+        :class:`OverflowPolicy` applied to a consumer whose buffer is full. The
+        default is ``OverflowPolicy.DROP_OLDEST``, to not slow down the other
+        consumers of the upstream.
+
+    Examples
+    --------
+    >>> hub = MonitorHub(api)
+    >>> alerts = hub.join_service_logs(ClientType.SCALING)
+    >>> ui = hub.join_service_logs(ClientType.SCALING)  # Same connection
+    >>> for msg in alerts:
+    ...     check(msg)
+
+    """
+
+    def __init__(
+        self,
+        monitor_api: MonitorApi,
+        replay: int = 100,
+        maxsize: int = 1000,
+        overflow: str = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """Initialize the hub."""
+        self.monitor_api = monitor_api
+        self.replay = replay
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._upstreams: dict[Hashable, _Upstream] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> MonitorHub:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the hub when leaving the context manager."""
+        self.close()
+
+    @property
+    def upstreams(self) -> int:
+        """Get the number of open upstream subscriptions."""
+        with self._lock:
+            return len(self._upstreams)
+
+    def consumer_count(self, topics: list[dict[str, str]]) -> int:
+        """Get the number of consumers sharing the subscription of a set of filter topics."""
+        with self._lock:
+            upstream = self._upstreams.get(_topics_key(topics))
+            return len(upstream.consumers) if upstream is not None else 0
+
+    def join(
+        self,
+        topics: list[dict[str, str]],
+        *,
+        backlog: int = 100,
+        replay: int | None = None,
+        maxsize: int | None = None,
+        overflow: str | None = None,
+        **kwargs: Any,
+    ) -> HubConsumer:
+        """Start consuming the messages matching a set of filter topics.
+
+        Parameters
+        ----------
+        topics : list[dict[str, str]]
+            Filter topics, such as ``[{"client_type": ClientType.JMS}]``. Consumers
+            of the same topics, in any order, share one upstream subscription.
+        backlog : int, optional
+            Number of historical messages requested when the upstream subscription
+            is opened. The default is ``100``.
+        replay : int, optional
+            Maximum number of latest messages replayed when joining an existing
+            upstream. The default is ``None``, which replays all kept messages.
+        maxsize : int, optional
+            Maximum number of pending messages of the consumer. The default is the
+            ``maxsize`` of the hub.
+        overflow : str, optional
+            :class:`OverflowPolicy` of the consumer. The default is the ``overflow``
+            of the hub.
+        kwargs : dict, optional
+            Additional arguments of the :class:`MessageBuffer` of the consumer.
+
+        Returns
+        -------
+        HubConsumer
+            Consumer to iterate over. Close it to leave the hub.
+
+        """
+        buffer = MessageBuffer(
+            maxsize=maxsize or self.maxsize, overflow=overflow or self.overflow, **kwargs
+        )
+        with self._lock:
+            upstream = self._upstreams.get(_topics_key(topics))
+            if upstream is None:
+                upstream = _Upstream(self, topics, self.replay)
+                upstream.session = self.monitor_api.open_session()
+                try:
+                    upstream.session.subscribe(topics, backlog=backlog, message_queue=upstream)
+                except Exception:
+                    upstream.close()
+                    raise
+                self._upstreams[upstream.key] = upstream
+                log.debug(f"Opened upstream subscription to {topics}")
+            consumer = HubConsumer(upstream, buffer)
+            upstream.add(consumer, replay)
+        return consumer
+
+    def join_service_logs(self, client_type: str, **kwargs: Any) -> HubConsumer:
+        """Start consuming the log messages of a named HPS service.
+
+        See :meth:`MonitorApi.stream_service_logs` and :meth:`join`.
+        """
+        return self.join([{"client_type": client_type}], **kwargs)
+
+    def join_task_logs(
+        self, task_id: str, *, file_path: str | None = None, **kwargs: Any
+    ) -> HubConsumer:
+        """Start consuming the log file messages of a task.
+
+        See :meth:`MonitorApi.stream_task_logs` and :meth:`join`.
+        """
+        return self.join([self.monitor_api._task_logs_topic(task_id, file_path)], **kwargs)
+
+    def _leave(self, upstream: _Upstream, consumer: HubConsumer) -> None:
+        with self._lock:
+            with upstream._lock:
+                if consumer in upstream.consumers:
+                    upstream.consumers.remove(consumer)
+                last = not upstream.consumers
+            if last and self._upstreams.get(upstream.key) is upstream:
+                del self._upstreams[upstream.key]
+            else:
+                last = False
+        if last:
+            log.debug(f"Closing upstream subscription to {upstream.topics}")
+            upstream.close()
+
+    def _discard(self, upstream: _Upstream) -> None:
+        with self._lock:
+            if self._upstreams.get(upstream.key) is upstream:
+                del self._upstreams[upstream.key]
+
+    def close(self) -> None:
+        """Close all upstream subscriptions, ending their consumers."""
+        with self._lock:
+            upstreams, self._upstreams = list(self._upstreams.values()), {}
+        for upstream in upstreams:
+            upstream.close()
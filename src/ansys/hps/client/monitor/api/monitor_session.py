@@ -0,0 +1,347 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Multiplexed monitor WebSocket session with many subscriptions over one connection."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from collections.abc import Generator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from ansys.hps.client.exceptions import ClientError
+
+from ..models import MonitorMessage
+from .monitor_api import _is_timeout
+
+if TYPE_CHECKING:
+    from .monitor_api import MonitorApi
+
+log = logging.getLogger(__name__)
+
+
+def _matches(topic: Mapping[str, str], message: Mapping[str, Any]) -> bool:
+    """Check whether the tags of *message* match every item of a filter *topic*.
+
+    Tags are read from ``message["tags"]``, falling back to top-level fields.
+    """
+    tags = message.get("tags")
+    if not isinstance(tags, Mapping):
+        tags = {}
+    for key, value in topic.items():
+        actual = tags.get(key, message.get(key))
+        if actual is None or str(actual) != str(value):
+            return False
+    return True
+
+
+class Subscription:
+    """Messages routed to one subscription of a :class:`MonitorSession`.
+
+    Iterate over a subscription to receive its messages as they arrive. The
+    iteration ends when the subscription or its session is closed.
+
+    Use :meth:`MonitorSession.subscribe` to create instances.
+
+    Attributes
+    ----------
+    topics : list[dict[str, str]]
+        Filter topics of the subscription. A message is routed to the
+        subscription if its tags match every item of any topic.
+    queue : queue.Queue
+        Queue receiving the whole messages of the subscription, before the
+        selection of the ``fields`` of the monitor API. ``None`` is put in the
+        queue when the subscription ends.
+
+    """
+
+    def __init__(
+        self,
+        session: MonitorSession,
+        topics: list[dict[str, str]],
+        message_queue: queue.Queue | None = None,
+    ) -> None:
+        """Initialize the subscription."""
+        self.topics = topics
+        self.queue = message_queue if message_queue is not None else queue.Queue()
+        self._session = session
+        self.closed = False
+
+    def matches(self, message: Mapping[str, Any]) -> bool:
+        """Check whether *message* belongs to this subscription."""
+        return any(_matches(topic, message) for topic in self.topics)
+
+    def messages(
+        self, max_messages: int | None = None, timeout: float | None = None
+    ) -> Generator[MonitorMessage, None, None]:
+        """Yield messages of the subscription as they arrive.
+
+        Parameters
+        ----------
+        max_messages : int or None, optional
+            Maximum number of messages to yield. The default is ``None``, which
+            yields messages until the subscription ends.
+        timeout : float or None, optional
+            Maximum number of seconds to wait for each message. The iteration ends
+            when no message arrives in time. The default is ``None``, which waits
+            indefinitely.
+
+        Yields
+        ------
+        MonitorMessage
+            Messages matching the topics of the subscription.
+
+        """
+        yielded = 0
+        while max_messages is None or yielded < max_messages:
+            try:
+                message = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                return
+            if message is None:
+                # Let other consumers of a shared queue see the end too
+                self.queue.put(None)
+                self._session._raise_error()
+                return
+            yield self._session.monitor_api._project(message)
+            yielded += 1
+
+    def __iter__(self):
+        """Iterate over the messages of the subscription."""
+        return self.messages()
+
+    def _end(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.queue.put(None)
+
+    def close(self) -> None:
+        """Stop routing messages to this subscription.
+
+        The server keeps sending matching messages over the connection until the
+        session is closed, but they are no longer delivered to the subscription.
+        """
+        self._session._remove(self)
+
+
+class MonitorSession:
+    """Long-lived monitor WebSocket connection shared by many subscriptions.
+
+    Each call of a ``stream_*`` method of :class:`MonitorApi` opens its own
+    connection. A session instead opens a single connection, sends one
+    ``subscribe`` command per subscription over it, and routes incoming messages
+    to the subscriptions whose topics match their tags. A background thread reads
+    the connection.
+
+    Parameters
+    ----------
+    monitor_api : MonitorApi
+        Monitor API providing the WebSocket URL, connection options and token.
+
+    Examples
+    --------
+    >>> with MonitorSession(monitor_api) as session:
+    ...     logs = {task_id: session.subscribe_task_logs(task_id) for task_id in task_ids}
+    ...     for msg in logs[task_ids[0]].messages(max_messages=10):
+    ...         print(msg)
+
+    """
+
+    def __init__(self, monitor_api: MonitorApi) -> None:
+        """Initialize the session."""
+        self.monitor_api = monitor_api
+        self._ws = None
+        self._reader: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+        self._stopped = threading.Event()
+        self._error: Exception | None = None
+
+    def __enter__(self) -> MonitorSession:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the session when leaving the context manager."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session is closed."""
+        return self._stopped.is_set()
+
+    @property
+    def subscriptions(self) -> list[Subscription]:
+        """Active subscriptions of the session."""
+        with self._lock:
+            return list(self._subscriptions)
+
+    def _connect(self) -> None:
+        """Open the connection and start the reader thread, if not done yet."""
+        if self.closed:
+            raise ClientError("The monitor session is closed.")
+        if self._ws is None:
+            self._ws = self.monitor_api._connect_ws()
+            self._reader = threading.Thread(
+                target=self._read, name="monitor-session-reader", daemon=True
+            )
+            self._reader.start()
+
+    def send(self, command: dict[str, Any]) -> None:
+        """Send a command over the shared connection."""
+        with self._lock:
+            self._connect()
+            self._ws.send(json.dumps(self.monitor_api._with_token(command)))
+
+    def subscribe(
+        self,
+        topics: list[dict[str, str]],
+        backlog: int = 100,
+        message_queue: queue.Queue | None = None,
+    ) -> Subscription:
+        """Subscribe to messages matching filter topics.
+
+        Parameters
+        ----------
+        topics : list[dict[str, str]]
+            Filter topics, such as ``[{"client_type": ClientType.JMS}]``.
+        backlog : int, optional
+            Number of historical messages to request. The default is ``100``.
+        message_queue : queue.Queue, optional
+            Queue receiving the messages, which can be shared by several
+            subscriptions. The default is ``None``, in which case each subscription
+            has its own queue.
+
+        Returns
+        -------
+        Subscription
+            Subscription receiving the matching messages.
+
+        """
+        subscription = Subscription(self, topics, message_queue)
+        # Register before subscribing to not miss the backlog
+        with self._lock:
+            self._subscriptions.append(subscription)
+        try:
+            self.send(self.monitor_api._subscribe_command(topics=topics, backlog=backlog))
+        except Exception:
+            self._remove(subscription)
+            raise
+        log.debug(f"Subscribed to {topics}")
+        return subscription
+
+    def subscribe_task_logs(
+        self, task_id: str, *, file_path: str | None = None, backlog: int = 100, **kwargs
+    ) -> Subscription:
+        """Subscribe to log file messages of a task.
+
+        See :meth:`MonitorApi.stream_task_logs` and :meth:`subscribe`.
+        """
+        topic = self.monitor_api._task_logs_topic(task_id, file_path)
+        return self.subscribe([topic], backlog=backlog, **kwargs)
+
+    def subscribe_task_process_tree(
+        self, task_id: str, *, backlog: int = 100, **kwargs
+    ) -> Subscription:
+        """Subscribe to process tree metric updates of a task.
+
+        See :meth:`MonitorApi.stream_task_process_tree` and :meth:`subscribe`.
+        """
+        topic = self.monitor_api._process_tree_topic(task_id)
+        return self.subscribe([topic], backlog=backlog, **kwargs)
+
+    def subscribe_task_host_resources(
+        self, task_id: str, project_id: str, *, backlog: int = 100, **kwargs
+    ) -> Subscription:
+        """Subscribe to CPU and memory metric updates of the host running a task.
+
+        See :meth:`MonitorApi.stream_task_host_resources` and :meth:`subscribe`.
+        """
+        evaluator_name = self.monitor_api._resolve_evaluator_name_for_task(task_id, project_id)
+        topic = self.monitor_api._host_resources_topic(evaluator_name)
+        return self.subscribe([topic], backlog=backlog, **kwargs)
+
+    def _route(self, message: MonitorMessage) -> None:
+        """Deliver *message* to every matching subscription."""
+        delivered = False
+        for subscription in self.subscriptions:
+            if subscription.matches(message):
+                subscription.queue.put(message)
+                delivered = True
+        if not delivered:
+            log.debug("Dropping monitor message matching no subscription")
+
+    def _read(self) -> None:
+        """Read the connection and route messages until the session is closed."""
+        try:
+            while not self._stopped.is_set():
+                try:
+                    raw = self.monitor_api._recv(self._ws)
+                except Exception as exc:
+                    if _is_timeout(exc):
+                        # Idle connection, keep waiting for messages
+                        continue
+                    raise
+                if not raw:
+                    break
+                for message in self.monitor_api._decode(raw):
+                    self._route(message)
+        except Exception as exc:
+            if not self._stopped.is_set():
+                log.error(f"Monitor session connection failed: {exc}")
+                self._error = exc
+        finally:
+            self._shutdown()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise ClientError(f"Monitor session connection failed: {self._error}") from self._error
+
+    def _remove(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription._end()
+
+    def _shutdown(self) -> None:
+        """End all subscriptions and close the connection."""
+        self._stopped.set()
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+            ws, self._ws = self._ws, None
+        for subscription in subscriptions:
+            subscription._end()
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception as exc:  # pragma: no cover
+                log.debug(f"Failed to close monitor connection: {exc}")
+
+    def close(self) -> None:
+        """Close the connection and end all subscriptions."""
+        reader = self._reader
+        self._shutdown()
+        if reader is not None and reader is not threading.current_thread():
+            reader.join(timeout=self.monitor_api.timeout_seconds)
@@ -0,0 +1,185 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Diffing of the process-tree snapshots of monitor metric streams."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable, Mapping
+from typing import Any
+
+from ..models import ProcessTreeDiff
+from .metric_aggregator import _float, _metric_payload
+from .monitor_api import _message_timestamp
+
+
+def _flatten(root: Mapping[str, Any]) -> dict[Any, dict[str, Any]]:
+    """Get the attributes of each process of a tree by PID."""
+    processes: dict[Any, dict[str, Any]] = {}
+    stack: list[tuple[Mapping[str, Any], Any]] = [(root, None)]
+    while stack:
+        node, ppid = stack.pop()
+        pid = node.get("pid")
+        attributes = {k: v for k, v in node.items() if k != "children"}
+        attributes.setdefault("ppid", ppid)
+        processes[pid] = attributes
+        stack.extend(
+            (child, pid) for child in node.get("children") or [] if isinstance(child, Mapping)
+        )
+    return processes
+
+
+class ProcessTreeDiffer:
+    """Turn process-tree snapshots into diffs against the previous snapshot of their task.
+
+    The differ keeps the last reported state of the processes of each task, keyed
+    by PID, and reports the processes spawned and exited since then and the
+    attributes that changed. Long-running jobs with many processes then produce
+    small diffs instead of full snapshots.
+
+    Parameters
+    ----------
+    resync_every : int, optional
+        Number of snapshots of a task after which a full snapshot is reported again,
+        for consumers to recover from missed diffs. The first snapshot of a task is
+        always reported in full. The default is ``None``, which never resyncs.
+    tolerance : float, optional
+        Largest change of a numeric attribute, such as ``cpu_percentage``, that is
+        not reported. Changes are measured against the last reported value, so
+        slow drifts are eventually reported. The default is ``0.0``, which reports
+        every change.
+
+    Examples
+    --------
+    >>> differ = ProcessTreeDiffer(resync_every=100, tolerance=1.0)
+    >>> for diff in differ.diffs(api.stream_task_process_tree(task_id)):
+    ...     print(f"+{list(diff.spawned)} -{diff.exited} ~{len(diff.changed)}")
+
+    """
+
+    def __init__(self, resync_every: int | None = None, tolerance: float = 0.0) -> None:
+        """Initialize the differ."""
+        self.resync_every = resync_every
+        self.tolerance = tolerance
+        self._state: dict[str | None, dict[Any, dict[str, Any]]] = {}
+        self._counts: dict[str | None, int] = {}
+
+    def processes(self, task_id: str | None) -> dict[Any, dict[str, Any]]:
+        """Get the last reported attributes of the processes of a task by PID."""
+        return {pid: dict(attributes) for pid, attributes in self._state.get(task_id, {}).items()}
+
+    def reset(self, task_id: str | None = None) -> None:
+        """Forget the state of a task, or of all tasks, to report its next snapshot in full."""
+        if task_id is None:
+            self._state.clear()
+            self._counts.clear()
+        else:
+            self._state.pop(task_id, None)
+            self._counts.pop(task_id, None)
+
+    def _changed(self, old: Any, new: Any) -> bool:
+        if old == new:
+            return False
+        if self.tolerance > 0:
+            old_value, new_value = _float(old), _float(new)
+            if old_value is not None and new_value is not None:
+                return abs(new_value - old_value) > self.tolerance
+        return True
+
+    def diff(self, message: Mapping[str, Any]) -> ProcessTreeDiff | None:
+        """Diff a process-tree snapshot against the previous one of its task.
+
+        Parameters
+        ----------
+        message : Mapping
+            Process-tree metric message, as yielded by
+            :meth:`MonitorApi.stream_task_process_tree`.
+
+        Returns
+        -------
+        ProcessTreeDiff or None
+            Changes since the previous snapshot of the task, possibly empty, or
+            ``None`` if the message has no process tree.
+
+        """
+        root = _metric_payload(message)
+        if "pid" not in root:
+            return None
+        tags = message.get("tags")
+        task_id = (tags if isinstance(tags, Mapping) else message).get("task_id")
+        timestamp = _message_timestamp(message)
+        current = _flatten(root)
+
+        count = self._counts.get(task_id, 0)
+        self._counts[task_id] = count + 1
+        previous = self._state.get(task_id)
+        if previous is None or (self.resync_every and count % self.resync_every == 0):
+            self._state[task_id] = current
+            return ProcessTreeDiff(task_id, timestamp, self.processes(task_id), [], {}, full=True)
+
+        spawned = {pid: attributes for pid, attributes in current.items() if pid not in previous}
+        exited = [pid for pid in previous if pid not in current]
+        changed: dict[Any, dict[str, Any]] = {}
+        for pid, attributes in current.items():
+            reported = previous.get(pid)
+            if reported is None:
+                continue
+            updates = {
+                key: value
+                for key, value in attributes.items()
+                if self._changed(reported.get(key), value)
+            }
+            removed = [key for key in reported if key not in attributes]
+            updates.update((key, None) for key in removed)
+            if updates:
+                changed[pid] = updates
+                reported.update(updates)
+                for key in removed:
+                    del reported[key]
+        for pid in exited:
+            del previous[pid]
+        previous.update((pid, dict(attributes)) for pid, attributes in spawned.items())
+        return ProcessTreeDiff(task_id, timestamp, spawned, exited, changed)
+
+    def diffs(
+        self, messages: Iterable[Mapping[str, Any]], include_empty: bool = False
+    ) -> Generator[ProcessTreeDiff, None, None]:
+        """Yield the diffs of a stream of process-tree snapshots.
+
+        Parameters
+        ----------
+        messages : Iterable[Mapping]
+            Process-tree metric messages.
+        include_empty : bool, optional
+            Whether to yield the diffs of snapshots without any change. The default
+            is ``False``.
+
+        Yields
+        ------
+        ProcessTreeDiff
+            Changes of each snapshot.
+
+        """
+        for message in messages:
+            diff = self.diff(message)
+            if diff is not None and (diff or include_empty):
+                yield diff
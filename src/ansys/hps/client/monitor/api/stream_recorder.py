@@ -0,0 +1,443 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Recording of monitor WebSocket traffic and offline replay through the monitor API."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Generator
+from typing import Any
+
+from ansys.hps.client.exceptions import ClientError
+
+from .monitor_api import MonitorApi, _fast_loads, _raw_messages
+from .monitor_session import _matches
+
+log = logging.getLogger(__name__)
+
+#: Name of the file indexing the time range of the closed segments of a recording.
+INDEX_FILE = "index.ndjson"
+
+_SEGMENT_PATTERN = re.compile(r"^monitor-(\d{6})\.ndjson(\.gz)?$")
+
+
+def _segment_number(name: str) -> int | None:
+    match = _SEGMENT_PATTERN.match(name)
+    return int(match.group(1)) if match else None
+
+
+class StreamRecorder:
+    """Record the raw payloads received from the monitor WebSocket endpoint.
+
+    Each received frame is appended, with its arrival time, as one line of an NDJSON
+    segment file: ``{"t": <seconds since the epoch>, "frame": <raw payload>}``.
+    Segments are rotated by size and age, compressed with gzip by default, and
+    indexed by time range in the ``index.ndjson`` file of the recording directory.
+
+    Pass the recorder as ``recorder`` to :class:`MonitorApi` to record the frames of
+    all its streams and sessions. Use :class:`StreamReplayer` to replay a recording.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the recording. It is created if it does not exist. Segments of
+        a previous recording in the directory are kept and new segments follow them.
+    segment_bytes : int, optional
+        Number of uncompressed bytes after which a segment is closed and a new one is
+        started. The default is 64 MiB.
+    segment_seconds : float, optional
+        Number of seconds after which a segment is closed and a new one is started.
+        The default is ``None``, in which case segments are only rotated by size.
+    max_segments : int, optional
+        Maximum number of segments kept in the directory. The oldest segments are
+        removed on rotation. The default is ``None``, which keeps all segments.
+    compress : bool, optional
+        Whether to compress the segments with gzip. The default is ``True``.
+
+    Examples
+    --------
+    >>> with StreamRecorder("recordings/scaling") as recorder:
+    ...     api = MonitorApi(client, recorder=recorder)
+    ...     for msg in api.stream_service_logs(ClientType.SCALING, max_messages=1000):
+    ...         pass
+
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        segment_seconds: float | None = None,
+        max_segments: int | None = None,
+        compress: bool = True,
+    ) -> None:
+        """Initialize the recorder."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.max_segments = max_segments
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment: str | None = None
+        self._number = max(
+            (n for n in map(_segment_number, os.listdir(directory)) if n is not None), default=0
+        )
+        self._size = 0
+        self._frames = 0
+        self._start: float | None = None
+        self._end: float | None = None
+        self._opened = 0.0
+        self.frames = 0
+
+    def __enter__(self) -> StreamRecorder:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the recorder when leaving the context manager."""
+        self.close()
+
+    @property
+    def segments(self) -> list[str]:
+        """Get the paths of the segments in the recording directory, oldest first."""
+        return _segments(self.directory)
+
+    def record(self, frame: str | bytes, timestamp: float | None = None) -> None:
+        """Append a raw WebSocket frame to the current segment.
+
+        Parameters
+        ----------
+        frame : str or bytes
+            Payload as received from the WebSocket connection.
+        timestamp : float, optional
+            Arrival time in seconds since the epoch. The default is the current time.
+
+        """
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8")
+        timestamp = time.time() if timestamp is None else timestamp
+        line = json.dumps({"t": timestamp, "frame": frame}) + "\n"
+        with self._lock:
+            if self._file is not None and (
+                self._size >= self.segment_bytes
+                or (
+                    self.segment_seconds is not None
+                    and time.monotonic() - self._opened >= self.segment_seconds
+                )
+            ):
+                self._close_segment()
+            if self._file is None:
+                self._open_segment()
+            self._file.write(line)
+            self._size += len(line)
+            self._frames += 1
+            self.frames += 1
+            self._start = timestamp if self._start is None else self._start
+            self._end = timestamp
+
+    def flush(self) -> None:
+        """Flush the current segment to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the current segment and index it."""
+        with self._lock:
+            if self._file is not None:
+                self._close_segment()
+
+    def _open_segment(self) -> None:
+        self._number += 1
+        name = f"monitor-{self._number:06d}.ndjson" + (".gz" if self.compress else "")
+        path = os.path.join(self.directory, name)
+        opener = gzip.open if self.compress else open
+        self._file = opener(path, "at", encoding="utf-8")
+        self._segment = name
+        self._size = 0
+        self._frames = 0
+        self._start = self._end = None
+        self._opened = time.monotonic()
+        log.debug(f"Recording monitor frames to {path}")
+
+    def _close_segment(self) -> None:
+        self._file.close()
+        entry = {
+            "segment": self._segment,
+            "start": self._start,
+            "end": self._end,
+            "frames": self._frames,
+        }
+        with open(os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8") as index:
+            index.write(json.dumps(entry) + "\n")
+        self._file = None
+        self._segment = None
+        if self.max_segments is not None:
+            segments = self.segments
+            removed = segments[: max(0, len(segments) - self.max_segments)]
+            for path in removed:
+                log.debug(f"Removing monitor recording segment {path}")
+                os.remove(path)
+            if removed:
+                self._prune_index({os.path.basename(path) for path in removed})
+
+    def _prune_index(self, names: set[str]) -> None:
+        """Rewrite the index without the entries of the given segments."""
+        path = os.path.join(self.directory, INDEX_FILE)
+        entries = [e for e in _read_index(self.directory).values() if e["segment"] not in names]
+        with open(path + ".tmp", "w", encoding="utf-8") as index:
+            index.writelines(json.dumps(entry) + "\n" for entry in entries)
+        os.replace(path + ".tmp", path)
+
+
+def _segments(directory: str) -> list[str]:
+    """List the segment files of a recording directory, oldest first."""
+    names = sorted(
+        (n for n in os.listdir(directory) if _segment_number(n) is not None),
+        key=_segment_number,
+    )
+    return [os.path.join(directory, n) for n in names]
+
+
+def _read_index(directory: str) -> dict[str, dict[str, Any]]:
+    """Read the time range of the indexed segments of a recording directory."""
+    path = os.path.join(directory, INDEX_FILE)
+    index: dict[str, dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return index
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Entry truncated by a crash
+                continue
+            index[entry["segment"]] = entry
+    return index
+
+
+class StreamReplayer:
+    """Replay a recording of :class:`StreamRecorder` through the monitor API.
+
+    :meth:`monitor_api` returns a :class:`MonitorApi` whose streams and sessions read
+    the recorded frames instead of a live connection, so consumer code can be run and
+    load-tested without a cluster. Each connection replays the recording from its
+    first subscription, keeping only the messages matching the topics it subscribed
+    to. As with a live connection, subscriptions added to a :class:`MonitorSession`
+    afterwards only receive the frames not replayed yet. The backlog of subscriptions
+    is ignored.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the recording.
+    speed : float, optional
+        Replay speed relative to the recorded pace, such as ``2.0`` to replay twice
+        as fast. The default is ``1.0``, which replays in real time. ``None``
+        replays as fast as possible.
+    start : float, optional
+        Replay only frames received at or after this time, in seconds since the
+        epoch. The default is ``None``.
+    end : float, optional
+        Replay only frames received at or before this time, in seconds since the
+        epoch. The default is ``None``.
+
+    Examples
+    --------
+    >>> api = StreamReplayer("recordings/scaling", speed=None).monitor_api()
+    >>> for msg in api.stream_service_logs(ClientType.SCALING):
+    ...     handle(msg)
+
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        speed: float | None = 1.0,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> None:
+        """Initialize the replayer."""
+        if not os.path.isdir(directory):
+            raise ClientError(f"Monitor recording '{directory}' does not exist.")
+        if speed is not None and speed <= 0:
+            raise ClientError("The replay speed must be positive.")
+        self.directory = directory
+        self.speed = speed
+        self.start = start
+        self.end = end
+
+    @property
+    def segments(self) -> list[str]:
+        """Get the paths of the segments overlapping the replayed time range."""
+        index = _read_index(self.directory)
+        segments = []
+        for path in _segments(self.directory):
+            entry = index.get(os.path.basename(path))
+            if entry is not None and entry["start"] is not None:
+                if self.start is not None and entry["end"] < self.start:
+                    continue
+                if self.end is not None and entry["start"] > self.end:
+                    continue
+            # Segments missing from the index, still being written, are always read
+            segments.append(path)
+        return segments
+
+    def frames(self) -> Generator[tuple[float, str], None, None]:
+        """Yield the recorded frames of the time range with their arrival time.
+
+        Frames are yielded as fast as they are read, whatever the replay speed.
+        """
+        for path in self.segments:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rt", encoding="utf-8") as f:
+                try:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # Last line truncated by a crash
+                            break
+                        timestamp = record["t"]
+                        if self.start is not None and timestamp < self.start:
+                            continue
+                        if self.end is not None and timestamp > self.end:
+                            return
+                        yield timestamp, record["frame"]
+                except EOFError:
+                    log.warning(f"Monitor recording segment {path} is truncated")
+
+    def monitor_api(self, client=None, **kwargs) -> MonitorApi:
+        """Create a monitor API reading this recording instead of a live connection.
+
+        Parameters
+        ----------
+        client : Client, optional
+            Authenticated HPS client, only needed to resolve the evaluator of a task
+            with :meth:`MonitorApi.stream_task_host_resources`. The default is
+            ``None``.
+        kwargs : dict, optional
+            Additional arguments of :class:`MonitorApi`. Reconnection is disabled,
+            the end of the recording ending the streams.
+
+        Returns
+        -------
+        MonitorApi
+            Monitor API whose streams and sessions replay the recording.
+
+        """
+        return _ReplayMonitorApi(self, client, **kwargs)
+
+
+class _ReplayMonitorApi(MonitorApi):
+    """Monitor API whose connections replay a recording."""
+
+    def __init__(self, replayer: StreamReplayer, client=None, **kwargs) -> None:
+        kwargs.setdefault("ws_url", f"replay://{os.path.abspath(replayer.directory)}")
+        kwargs["reconnect"] = False
+        super().__init__(client, **kwargs)
+        self.replayer = replayer
+
+    @property
+    def token(self) -> str | None:
+        """Get the access token of the client, if any."""
+        return getattr(self.client, "access_token", None)
+
+    def _integration_client(self):
+        if self.client is None:
+            raise ClientError("Resolving the evaluator of a task requires an HPS client.")
+        return self.client
+
+    def _connect_ws(self):
+        return _ReplayConnection(self.replayer)
+
+
+class _ReplayConnection:
+    """WebSocket connection replaying the recorded frames matching its subscriptions."""
+
+    def __init__(self, replayer: StreamReplayer) -> None:
+        self._replayer = replayer
+        self._topics: list[dict[str, str]] = []
+        self._frames: Generator[tuple[float, str], None, None] | None = None
+        self._origin: tuple[float, float] | None = None
+        self._commands = 0
+        self._subscribed = threading.Event()
+        self._closed = threading.Event()
+
+    def send(self, payload: str) -> None:
+        command = json.loads(payload)
+        if command.get("action") == "subscribe":
+            self._topics.extend(command.get("topics") or [])
+            if self._frames is None:
+                self._frames = self._replayer.frames()
+            self._subscribed.set()
+        else:
+            self._commands += 1
+
+    def _wait(self, timestamp: float) -> None:
+        """Wait until the replay time of a frame received at *timestamp*."""
+        speed = self._replayer.speed
+        if speed is None:
+            return
+        if self._origin is None:
+            self._origin = (timestamp, time.monotonic())
+        recorded, started = self._origin
+        delay = (timestamp - recorded) / speed - (time.monotonic() - started)
+        if delay > 0:
+            self._closed.wait(delay)
+
+    def recv(self) -> str:
+        if not self._subscribed.is_set():
+            if self._commands:
+                # No subscription, such as for a list_tags command
+                return ""
+            # Idle connection of a session waiting for its first subscription
+            if not self._subscribed.wait(0.1) and not self._closed.is_set():
+                raise TimeoutError("No subscription to replay")
+            if self._closed.is_set():
+                return ""
+        for timestamp, frame in self._frames:
+            if self._closed.is_set():
+                break
+            messages = _raw_messages(_fast_loads(frame))
+            matching = [m for m in messages if any(_matches(t, m) for t in self._topics)]
+            if not matching:
+                continue
+            self._wait(timestamp)
+            if self._closed.is_set():
+                break
+            return frame if len(matching) == len(messages) else json.dumps(matching)
+        # Release the segment file from the reading thread
+        self._frames.close()
+        return ""
+
+    def close(self) -> None:
+        self._closed.set()
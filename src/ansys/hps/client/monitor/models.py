@@ -151,6 +151,75 @@ class MessageEnvelope:
         return cls(messages=normalized)
 
 
+@dataclass(frozen=True)
+class LogMatch:
+    """Location of a match in the log files of a task.
+
+    Attributes
+    ----------
+    task_id : str
+        Identifier of the task.
+    file_path : str or None
+        Log file of the matching line, from the ``file_path`` tag.
+    line : int
+        Index of the matching line among the lines of the file received by the
+        search, starting at ``0`` with the oldest line of the backlog.
+    start : int
+        Offset of the start of the match in the line.
+    end : int
+        Offset of the end of the match in the line.
+    timestamp : float or None
+        Time of the message of the line, in seconds since the epoch, if it has one.
+
+    """
+
+    task_id: str
+    file_path: str | None
+    line: int
+    start: int
+    end: int
+    timestamp: float | None = None
+
+
+@dataclass(frozen=True)
+class ProcessTreeDiff:
+    """Changes of the process tree of a task between two snapshots.
+
+    Processes are identified by their PID. Their attributes are the fields of their
+    node in the snapshot, except ``children``, plus the ``ppid`` of their parent.
+
+    Attributes
+    ----------
+    task_id : str or None
+        Identifier of the task, from the ``task_id`` tag of the snapshot.
+    timestamp : float or None
+        Time of the snapshot in seconds since the epoch, if it has one.
+    spawned : dict[Any, dict[str, Any]]
+        Attributes of the processes started since the previous snapshot, or of all
+        processes of a full snapshot, by PID.
+    exited : list[Any]
+        PIDs of the processes gone since the previous snapshot.
+    changed : dict[Any, dict[str, Any]]
+        New values of the attributes changed since the previous snapshot, such as
+        ``cpu_percentage``, by PID.
+    full : bool
+        Whether the diff is a full resynchronization, in which case ``spawned``
+        holds the whole tree and replaces any previous state.
+
+    """
+
+    task_id: str | None
+    timestamp: float | None
+    spawned: dict[Any, dict[str, Any]]
+    exited: list[Any]
+    changed: dict[Any, dict[str, Any]]
+    full: bool = False
+
+    def __bool__(self) -> bool:
+        """Check whether the diff carries any change."""
+        return self.full or bool(self.spawned or self.exited or self.changed)
+
+
 @dataclass(frozen=True, unsafe_hash=True, eq=False)
 class BuildInfoResponse(_PayloadMappingMixin, Mapping[str, Any]):
     """Typed wrapper for monitor build-info responses."""
@@ -0,0 +1,114 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fakes of the JMS session and data transfer API shared by the JMS unit tests."""
+
+import hashlib
+import threading
+from types import SimpleNamespace
+
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+PROJECT_URL = "https://localhost/projects/p1"
+
+
+class SessionMock:
+    """Session serving collections of resources, filtered by the list-valued query parameters."""
+
+    def __init__(self, collections):
+        self.collections = collections
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None):
+        rest_name = url.rsplit("/", 1)[-1]
+        with self._lock:
+            self.requests.append((rest_name, params))
+        data = self.collections.get(rest_name, [])
+        for key, values in (params or {}).items():
+            if isinstance(values, list) and key != "fields":
+                data = [d for d in data if d.get(key) in values]
+        return SimpleNamespace(json=lambda: {rest_name: data})
+
+
+class DataTransferApiMock:
+    """Data transfer API copying contents between local paths and an in-memory storage.
+
+    ``storage`` maps remote paths to contents. Copies of the remote paths in ``fail``
+    fail, as do the next ``failures`` copies.
+    """
+
+    def __init__(self, storage=None, fail=(), failures=0, error="boom"):
+        self.storage = {} if storage is None else storage
+        self.fail = set(fail)
+        self.failures = failures
+        self.error = error
+        self.copies = []
+        self._ops = {}
+        self._lock = threading.RLock()
+
+    def _op(self, **kwargs):
+        with self._lock:
+            op_id = f"op{len(self._ops)}"
+            self._ops[op_id] = Operation(id=op_id, **kwargs)
+        return SimpleNamespace(id=op_id)
+
+    def get_metadata(self, paths):
+        path = paths[0].path
+        if path not in self.storage:
+            return self._op(state=OperationState.Failed)
+        content = self.storage[path]
+        metadata = {"size": len(content), "checksum": hashlib.sha256(content).hexdigest()}
+        return self._op(state=OperationState.Succeeded, result={path: metadata})
+
+    def copy(self, operations):
+        with self._lock:
+            self.copies.append(operations)
+            if self.failures:
+                self.failures -= 1
+                return self._op(state=OperationState.Failed, progress=0.5, error=self.error)
+        failed = False
+        for o in operations:
+            if o.src.remote == "local":
+                with open(o.src.path, "rb") as f:
+                    self.storage[o.dst.path] = f.read()
+            elif o.src.path in self.fail:
+                failed = True
+            else:
+                with open(o.dst.path, "wb") as f:
+                    f.write(self.storage[o.src.path])
+        state = OperationState.Failed if failed else OperationState.Succeeded
+        return self._op(state=state, progress=1.0, error=self.error if failed else None)
+
+    def wait_for(self, op_ids, handler=None):
+        ops = [self._ops[op_id] for op_id in op_ids]
+        if handler is not None:
+            handler(ops)
+        return ops
+
+
+def project_api_mock(dt_api=None, session=None):
+    """Create a stand-in for the project API of project ``p1``."""
+    client = SimpleNamespace(
+        session=session, initialize_data_transfer_client=lambda: None, data_transfer_api=dt_api
+    )
+    return SimpleNamespace(client=client, project_id="p1", url=PROJECT_URL)
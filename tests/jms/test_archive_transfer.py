@@ -0,0 +1,121 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import HPSError
+from ansys.hps.client.jms.api import archive_transfer, jms_api
+from ansys.hps.client.jms.api.archive_transfer import transfer_archive
+
+from .conftest import DataTransferApiMock, project_api_mock
+
+
+def _client(dt_api):
+    return project_api_mock(dt_api).client
+
+
+def test_transfer_archive_retries_and_reports_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_transfer.time, "sleep", lambda s: None)
+    dt_api = DataTransferApiMock(
+        {"bucket/p.ljson": b"archive"}, failures=1, error="connection lost"
+    )
+    local_path = str(tmp_path / "p.ljson")
+    progress = []
+
+    transfer_archive(
+        _client(dt_api),
+        local_path,
+        "bucket/p.ljson",
+        upload=False,
+        progress_handler=progress.append,
+    )
+
+    assert len(dt_api.copies) == 2
+    assert progress == [0, 3, 7, 7]
+    with open(local_path, "rb") as f:
+        assert f.read() == b"archive"
+
+    # A complete archive is not transferred again
+    transfer_archive(_client(dt_api), local_path, "bucket/p.ljson", upload=False)
+    assert len(dt_api.copies) == 2
+
+
+def test_transfer_archive_gives_up_after_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_transfer.time, "sleep", lambda s: None)
+    local_path = tmp_path / "p.ljson"
+    local_path.write_bytes(b"archive")
+    dt_api = DataTransferApiMock({}, failures=3, error="connection lost")
+
+    with pytest.raises(HPSError, match="connection lost"):
+        transfer_archive(_client(dt_api), str(local_path), "b/p.ljson", upload=True, max_retries=2)
+    assert len(dt_api.copies) == 3
+
+
+def test_restore_projects_runs_concurrently_and_reports_failures(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def restore(api, path, progress_handler, verify, max_retries):
+        barrier.wait()
+        if progress_handler is not None:
+            progress_handler(10)
+        if path == "bad.ljson":
+            raise HPSError("corrupted archive")
+        return SimpleNamespace(id=os.path.splitext(path)[0])
+
+    monkeypatch.setattr(jms_api, "_restore_project", restore)
+    api = SimpleNamespace(client=_client(None))
+    progress = []
+
+    def handler(path, size):
+        progress.append((path, size))
+
+    results = jms_api._restore_projects(api, ["a.ljson", "b.ljson"], progress_handler=handler)
+    assert [r.project.id for r in results] == ["a", "b"]
+    assert sorted(progress) == [("a.ljson", 10), ("b.ljson", 10)]
+
+    # Restored projects are returned along with the failures
+    results = jms_api._restore_projects(api, ["a.ljson", "bad.ljson"])
+    assert [r.success for r in results] == [True, False]
+    assert results[0].project.id == "a"
+    assert results[1].project is None
+    assert results[1].error == "corrupted archive"
+
+
+def test_transfer_archive_retries_upload_to_same_destination(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_transfer.time, "sleep", lambda s: None)
+    local_path = tmp_path / "p.ljson"
+    local_path.write_bytes(b"archive")
+    dt_api = DataTransferApiMock(
+        {"bucket/p.ljson": b"archive"}, failures=1, error="connection lost"
+    )
+
+    # Without skipping, an existing destination is overwritten
+    transfer_archive(
+        _client(dt_api), str(local_path), "bucket/p.ljson", upload=True, skip_existing=False
+    )
+    assert len(dt_api.copies) == 2
+    assert [ops[0].dst.path for ops in dt_api.copies] == ["bucket/p.ljson", "bucket/p.ljson"]
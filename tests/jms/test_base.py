@@ -0,0 +1,260 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.jms.api import base
+from ansys.hps.client.jms.api.base import UpdateBuffer, get_objects, update_objects
+from ansys.hps.client.jms.resource import Job, Task
+from ansys.hps.client.jms.schema.job import JobSchema
+
+URL = "https://localhost:8443/hps/jms/api/v1/projects/p1"
+
+
+class _SessionMock:
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None):
+        with self._lock:
+            self.requests.append((url, params))
+        ids = params.get("id") or params.get("job_id")
+        if params.get("count"):
+            return SimpleNamespace(json=lambda: {"num_files": len(ids)})
+        # Return duplicates across chunks to exercise deduplication
+        data = [{"id": id, "name": f"file {id}"} for id in ids] + [{"id": "f0", "name": "file f0"}]
+        return SimpleNamespace(json=lambda: {"files": data})
+
+    def put(self, url, data=None, params=None):
+        self.requests.append((url, json.loads(data)))
+        return SimpleNamespace(json=lambda: json.loads(data))
+
+
+def _load_jobs(n):
+    data = [
+        {"id": f"j{i}", "name": f"job {i}", "priority": 1, "values": {"x": i}, "host_ids": ["h1"]}
+        for i in range(n)
+    ]
+    return JobSchema(many=True).load(data)
+
+
+def test_update_objects_only_modified():
+    session = _SessionMock()
+    jobs = _load_jobs(2)
+    jobs[0].priority = 3
+    jobs[1].note = "hello"
+
+    update_objects(session, URL, jobs, Job, as_objects=False, only_modified=True)
+
+    url, body = session.requests[0]
+    assert url == f"{URL}/jobs"
+    assert body["jobs"] == [{"id": "j0", "priority": 3}, {"id": "j1", "note": "hello"}]
+    # Objects are clean again after a successful update
+    assert jobs[0].modified_fields == set()
+
+
+def test_update_objects_only_modified_sends_untracked_objects_in_full():
+    session = _SessionMock()
+    job = Job(id="j0", name="job", priority=2)
+
+    update_objects(session, URL, [job], Job, as_objects=False, only_modified=True)
+
+    assert session.requests[0][1]["jobs"] == [{"id": "j0", "name": "job", "priority": 2}]
+
+
+def test_update_objects_sends_full_objects_by_default():
+    session = _SessionMock()
+    jobs = _load_jobs(1)
+    jobs[0].priority = 3
+
+    update_objects(session, URL, jobs, Job, as_objects=False)
+
+    sent = session.requests[0][1]["jobs"][0]
+    assert sent["priority"] == 3
+    assert sent["values"] == {"x": 0}
+
+
+def test_update_buffer_coalesces_updates():
+    session = _SessionMock()
+    jobs = _load_jobs(3)
+
+    with UpdateBuffer(session, URL, flush_interval=60.0) as buffer:
+        jobs[0].priority = 2
+        buffer.add(jobs[:2])
+        jobs[0].note = "first"
+        buffer.add([jobs[0]])
+        other = _load_jobs(1)[0]
+        other.priority = 5
+        buffer.add([other])
+        # Unmodified objects are skipped
+        assert buffer.num_pending == 1
+        assert session.requests == []
+
+    assert len(session.requests) == 1
+    sent = session.requests[0][1]["jobs"]
+    assert sent == [{"id": "j0", "priority": 5, "note": "first"}]
+    assert buffer.num_pending == 0
+
+
+def test_update_buffer_tracks_each_added_object_once():
+    session = _SessionMock()
+    jobs = _load_jobs(2)
+    buffer = UpdateBuffer(session, URL, flush_interval=60.0)
+
+    for priority in range(100):
+        jobs[0].priority = priority
+        buffer.add([jobs[0]])
+    jobs[0].note = "last"
+    buffer.add([jobs[0]])
+    other = _load_jobs(1)[0]
+    other.note = "other"
+    buffer.add([other])
+
+    sources = buffer._sources[Job]
+    assert list(sources) == ["j0"]
+    assert [obj for obj, _ in sources["j0"].values()] == [jobs[0], other]
+
+    buffer.flush()
+    assert session.requests[0][1]["jobs"] == [{"id": "j0", "priority": 99, "note": "other"}]
+    assert jobs[0].modified_fields == other.modified_fields == set()
+    assert buffer._sources == {}
+
+
+def test_update_buffer_flushes_per_type_and_on_size_limit():
+    session = _SessionMock()
+    buffer = UpdateBuffer(session, URL, flush_interval=60.0, max_pending=2)
+
+    buffer.add([Job(id="j0", priority=1)])
+    assert session.requests == []
+    buffer.add([Task(id="t0", eval_status="pending")])
+
+    urls = sorted(url for url, _ in session.requests)
+    assert urls == [f"{URL}/jobs", f"{URL}/tasks"]
+
+
+def test_update_buffer_keeps_updates_that_fail_to_be_sent():
+    session = _SessionMock()
+    jobs = _load_jobs(2)
+    jobs[0].priority = 2
+    put = session.put
+
+    def failing_put(url, data=None, params=None):
+        raise ConnectionError("unreachable")
+
+    session.put = failing_put
+    buffer = UpdateBuffer(session, URL, flush_interval=60.0)
+    buffer.add([jobs[0]])
+    with pytest.raises(ConnectionError):
+        buffer.flush()
+
+    # Nothing is lost: the update is still pending and the job still modified
+    assert buffer.num_pending == 1
+    assert jobs[0].modified_fields == {"priority"}
+
+    session.put = put
+    jobs[0].priority = 3
+    buffer.add([jobs[0]])
+    buffer.flush()
+    assert session.requests[0][1]["jobs"] == [{"id": "j0", "priority": 3}]
+    assert buffer.num_pending == 0
+    assert jobs[0].modified_fields == set()
+
+
+def test_update_buffer_logs_unsent_updates_on_error(caplog):
+    session = _SessionMock()
+    jobs = _load_jobs(1)
+    jobs[0].priority = 2
+
+    buffer = UpdateBuffer(session, URL, flush_interval=60.0)
+    buffer.add(jobs)
+    buffer.__exit__(RuntimeError, RuntimeError("interrupted"), None)
+
+    assert session.requests == []
+    assert buffer.num_pending == 1
+    assert "1 objects whose updates were not sent" in caplog.text
+
+
+def test_update_buffer_requires_ids():
+    buffer = UpdateBuffer(_SessionMock(), URL)
+    with pytest.raises(ClientError, match="without an ID"):
+        buffer.add([Job(priority=1)])
+
+
+def test_get_objects_splits_long_id_filters(monkeypatch):
+    from ansys.hps.client.jms.resource import File
+
+    monkeypatch.setattr(base, "MAX_ID_FILTER_LENGTH", 100)
+    session = _SessionMock()
+    ids = [f"f{i}" for i in range(50)]
+
+    files = get_objects(session, URL, File, id=ids, fields=["id", "name"])
+
+    assert len(session.requests) > 1
+    assert all(len(params["id"]) < len(ids) for _, params in session.requests)
+    assert all(params["fields"] == ["id", "name"] for _, params in session.requests)
+    assert sorted(f.id for f in files) == sorted(ids)
+
+    session.requests.clear()
+    assert get_objects(session, URL, File, count=True, job_id=ids + ids) == len(ids)
+    assert len(session.requests) > 1
+
+
+def test_get_objects_split_counts_distinct_objects_of_multi_valued_filters(monkeypatch):
+    monkeypatch.setattr(base, "MAX_ID_FILTER_LENGTH", 100)
+    host_ids = [f"h{i}" for i in range(30)]
+    # Every job ran on two hosts, so it matches the chunks of both
+    jobs = [{"id": f"j{i}", "host_ids": [f"h{i}", f"h{29 - i}"]} for i in range(30)]
+    requests = []
+
+    class _HostSession:
+        def get(self, url, params=None):
+            requests.append(params)
+            data = [{"id": j["id"]} for j in jobs if set(j["host_ids"]) & set(params["host_ids"])]
+            return SimpleNamespace(json=lambda: {"jobs": data})
+
+    assert get_objects(_HostSession(), URL, Job, count=True, host_ids=host_ids) == 30
+    assert len(requests) > 1
+    assert all("count" not in p and p["fields"] == ["id"] for p in requests)
+
+
+def test_get_objects_does_not_split_short_id_filters():
+    from ansys.hps.client.jms.resource import File
+
+    session = _SessionMock()
+    files = get_objects(session, URL, File, as_objects=False, id=["f0", "f1"])
+
+    assert len(session.requests) == 1
+    assert len(files) == 3
+
+
+def test_get_objects_split_rejects_pagination(monkeypatch):
+    from ansys.hps.client.jms.resource import File
+
+    monkeypatch.setattr(base, "MAX_ID_FILTER_LENGTH", 10)
+    with pytest.raises(ClientError, match="limit"):
+        get_objects(_SessionMock(), URL, File, id=["f0", "f1", "f2"], limit=2)
@@ -0,0 +1,62 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+
+import pytest
+
+from ansys.hps.client.jms.api import checksum
+from ansys.hps.client.jms.api.checksum import compute_checksum, compute_checksums, is_comparable
+
+
+@pytest.mark.parametrize("size", [0, 1, 1000, 4096 + 7])
+def test_compute_checksum_matches_hashlib(tmp_path, monkeypatch, size):
+    # Small chunks to hash files in several pieces
+    monkeypatch.setattr(checksum, "_CHUNK_SIZE", 1024)
+    content = bytes(i % 251 for i in range(size))
+    path = tmp_path / "data.bin"
+    path.write_bytes(content)
+
+    assert compute_checksum(str(path)) == hashlib.sha256(content).hexdigest()
+    assert compute_checksum(str(path), "md5") == hashlib.md5(content).hexdigest()
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_compute_checksums_keeps_order(tmp_path, use_processes):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(b"x" * i)
+        paths.append(str(path))
+
+    digests = compute_checksums(paths, max_workers=3, use_processes=use_processes)
+
+    assert digests == [hashlib.sha256(b"x" * i).hexdigest() for i in range(5)]
+    assert compute_checksums([]) == []
+
+
+def test_is_comparable():
+    assert is_comparable(hashlib.sha256(b"").hexdigest())
+    assert not is_comparable(hashlib.md5(b"").hexdigest())
+    assert is_comparable(hashlib.md5(b"").hexdigest(), "md5")
+    assert not is_comparable(None)
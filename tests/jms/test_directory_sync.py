@@ -0,0 +1,197 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import os
+from types import SimpleNamespace
+
+import pytest
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.jms.api.directory_sync import sync_directory
+from ansys.hps.client.jms.resource import File
+
+
+def _file(path, content, **kwargs):
+    return File(
+        id=f"id_{path}",
+        name=os.path.basename(path),
+        evaluation_path=path,
+        storage_id=f"s_{path.replace('/', '_')}",
+        size=len(content),
+        hash=hashlib.sha256(content).hexdigest(),
+        **kwargs,
+    )
+
+
+class _ProjectApiMock:
+    def __init__(self, files, storage=None):
+        self.files = files
+        self.storage = storage or {}
+        self.created = []
+        self.updated = []
+        self.deleted = []
+        self.project_id = "p1"
+        self.operations = 0
+        self.client = SimpleNamespace(
+            initialize_data_transfer_client=lambda: None,
+            data_transfer_api=SimpleNamespace(copy=self._copy, wait_for=self._wait_for),
+        )
+
+    def get_files(self, **query_params):
+        return list(self.files)
+
+    def create_files(self, files, **kwargs):
+        self.created.extend(files)
+
+    def update_files(self, files):
+        self.updated.extend(files)
+
+    def delete_files(self, files):
+        self.deleted.extend(files)
+
+    def _copy(self, operations):
+        for o in operations:
+            with open(o.dst.path, "wb") as f:
+                f.write(self.storage[o.src.path.split("/", 1)[1]])
+        self.operations += 1
+        return SimpleNamespace(id=f"op{self.operations}")
+
+    def _wait_for(self, op_ids, handler=None):
+        return [Operation(id=op_id, state=OperationState.Succeeded) for op_id in op_ids]
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def test_sync_directory_up_transfers_new_and_changed_files(tmp_path):
+    _write(tmp_path / "same.txt", b"same")
+    _write(tmp_path / "lib" / "changed.txt", b"new content")
+    _write(tmp_path / "lib" / "resized.txt", b"longer content")
+    _write(tmp_path / "lib" / "added.txt", b"added")
+    _write(tmp_path / "ignored.log", b"log")
+    project_api = _ProjectApiMock(
+        [
+            _file("same.txt", b"same"),
+            _file("lib/changed.txt", b"old content"),
+            _file("lib/resized.txt", b"short"),
+            _file("lib/removed.txt", b"gone"),
+            _file("lib/direct.txt", b"x", access_mode="direct_access"),
+        ]
+    )
+
+    result = sync_directory(project_api, str(tmp_path), pattern="*.txt", prune=True)
+
+    assert result.unchanged == ["same.txt"]
+    assert result.transferred == ["lib/added.txt", "lib/changed.txt", "lib/resized.txt"]
+    assert result.deleted == ["lib/removed.txt"]
+    assert [f.evaluation_path for f in project_api.created] == ["lib/added.txt"]
+    assert project_api.created[0].src == os.path.join(str(tmp_path), "lib", "added.txt")
+    assert sorted(f.id for f in project_api.updated) == ["id_lib/changed.txt", "id_lib/resized.txt"]
+    assert [f.id for f in project_api.deleted] == ["id_lib/removed.txt"]
+
+
+def test_sync_directory_down_downloads_missing_and_changed_files(tmp_path):
+    _write(tmp_path / "same.txt", b"same")
+    _write(tmp_path / "out" / "changed.txt", b"stale")
+    _write(tmp_path / "extra.txt", b"extra")
+    files = [
+        _file("same.txt", b"same"),
+        _file("out/changed.txt", b"fresh"),
+        _file("out/new.txt", b"new"),
+    ]
+    storage = {"s_out_changed.txt": b"fresh", "s_out_new.txt": b"new"}
+    project_api = _ProjectApiMock(files, storage)
+
+    result = sync_directory(project_api, str(tmp_path), direction="down", prune=True)
+
+    assert result.unchanged == ["same.txt"]
+    assert sorted(result.transferred) == ["out/changed.txt", "out/new.txt"]
+    assert result.deleted == ["extra.txt"]
+    assert (tmp_path / "out" / "changed.txt").read_bytes() == b"fresh"
+    assert not (tmp_path / "extra.txt").exists()
+
+    # A repeated run transfers nothing
+    result = sync_directory(project_api, str(tmp_path), direction="down")
+    assert result.transferred == []
+    assert len(result.unchanged) == 3
+
+
+def test_sync_directory_up_reports_failed_batches(tmp_path):
+    for i in range(4):
+        _write(tmp_path / f"f{i}.txt", b"new %d" % i)
+    project_api = _ProjectApiMock([_file(f"f{i}.txt", b"old") for i in range(2)])
+    update_files = project_api.update_files
+
+    def failing_update_files(files):
+        if any(f.evaluation_path == "f1.txt" for f in files):
+            raise ClientError("upload failed")
+        update_files(files)
+
+    project_api.update_files = failing_update_files
+
+    result = sync_directory(project_api, str(tmp_path), batch_size=1)
+
+    assert result.transferred == ["f0.txt", "f2.txt", "f3.txt"]
+    assert result.failed == ["f1.txt"]
+    assert [f.evaluation_path for f in project_api.updated] == ["f0.txt"]
+
+
+def test_sync_directory_rejects_unknown_direction(tmp_path):
+    with pytest.raises(ClientError, match="Unknown direction"):
+        sync_directory(_ProjectApiMock([]), str(tmp_path), direction="sideways")
+
+
+def test_sync_directory_transfers_files_with_incomparable_hashes(tmp_path):
+    _write(tmp_path / "same.txt", b"same")
+    server_file = _file("same.txt", b"same")
+    server_file.hash = hashlib.md5(b"same").hexdigest()
+    project_api = _ProjectApiMock([server_file])
+
+    result = sync_directory(project_api, str(tmp_path))
+
+    assert result.unchanged == []
+    assert result.transferred == ["same.txt"]
+
+
+def test_sync_directory_down_reports_files_failing_to_be_pruned(tmp_path, monkeypatch):
+    _write(tmp_path / "locked.txt", b"locked")
+    _write(tmp_path / "extra.txt", b"extra")
+    remove = os.remove
+
+    def failing_remove(path):
+        if path.endswith("locked.txt"):
+            raise PermissionError("in use")
+        remove(path)
+
+    monkeypatch.setattr(os, "remove", failing_remove)
+
+    result = sync_directory(_ProjectApiMock([]), str(tmp_path), direction="down", prune=True)
+
+    assert result.deleted == ["extra.txt"]
+    assert result.failed == ["locked.txt"]
+    assert (tmp_path / "locked.txt").exists()
@@ -0,0 +1,101 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import os
+
+from ansys.hps.client.jms import DownloadCache
+from ansys.hps.client.jms.resource import File
+
+
+def _write(path, content):
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def test_download_cache_serves_stored_contents(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    file = File(id="f1", hash="abc", evaluation_path="out.txt")
+    assert not cache.fetch(file, str(tmp_path / "a" / "out.txt"))
+
+    cache.store(file, _write(tmp_path / "src.txt", b"hello"))
+    assert file in cache
+    assert cache.size == 5
+
+    # Same content in another project or session
+    other = File(id="f2", hash="abc", evaluation_path="copy.txt")
+    target = str(tmp_path / "b" / "copy.txt")
+    assert cache.fetch(other, target)
+    with open(target, "rb") as f:
+        assert f.read() == b"hello"
+
+    # Files without a hash are never cached
+    no_hash = File(id="f3", evaluation_path="x.txt")
+    cache.store(no_hash, str(tmp_path / "src.txt"))
+    assert no_hash not in cache
+
+
+def test_download_cache_discards_modified_contents(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    file = File(id="f1", hash="abc", evaluation_path="out.txt")
+    cache.store(file, _write(tmp_path / "src.txt", b"hello"))
+
+    # A hard-linked target shares its content with the cache
+    target = str(tmp_path / "out.txt")
+    assert cache.fetch(file, target)
+    _write(target, b"HELLO")
+
+    assert not cache.fetch(file, str(tmp_path / "again.txt"))
+    assert file not in cache
+
+
+def test_download_cache_evicts_least_recently_used(tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"), max_size=10, link=False)
+    files = [File(id=f"f{i}", hash=f"h{i}", evaluation_path="x") for i in range(3)]
+    src = _write(tmp_path / "src.txt", b"12345")
+
+    cache.store(files[0], src)
+    cache.store(files[1], src)
+    assert cache.fetch(files[0], str(tmp_path / "x"))
+    cache.store(files[2], src)
+
+    assert files[0] in cache
+    assert files[1] not in cache
+    assert files[2] in cache
+    assert cache.size == 10
+    assert len(os.listdir(tmp_path / "cache" / "objects")) <= 3
+
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_download_cache_checks_contents_against_hash(tmp_path):
+    with DownloadCache(str(tmp_path / "cache")) as cache:
+        file = File(id="f1", hash=hashlib.sha256(b"hello").hexdigest(), evaluation_path="x")
+        cache.store(file, _write(tmp_path / "stale.txt", b"stale"))
+        assert file not in cache
+        assert not [f for _, _, names in os.walk(tmp_path / "cache" / "objects") for f in names]
+
+        cache.store(file, _write(tmp_path / "src.txt", b"hello"))
+        assert file in cache
@@ -0,0 +1,370 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
+import pytest
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+from ansys.hps.client import ClientError, HPSError
+from ansys.hps.client.jms import DownloadCache
+from ansys.hps.client.jms.api.base import MAX_ID_FILTER_LENGTH
+from ansys.hps.client.jms.api.file_transfer import (
+    FileContents,
+    _find_existing_contents,
+    _local_source_path,
+    _skip_unchanged_uploads,
+    _upload_deduplicated,
+    download_files,
+)
+from ansys.hps.client.jms.api.project_api import create_files
+from ansys.hps.client.jms.resource import File
+
+from .conftest import DataTransferApiMock, project_api_mock
+
+
+def _files(n):
+    return [
+        File(id=f"f{i}", storage_id=f"s{i}", evaluation_path=f"out_{i}.txt", size=i + 1)
+        for i in range(n)
+    ]
+
+
+def test_download_files_groups_operations_and_reports_progress(tmp_path):
+    files = _files(6)
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(6)})
+    progress = []
+
+    results = download_files(
+        project_api_mock(dt_api),
+        files,
+        str(tmp_path),
+        layout="by_id",
+        max_in_flight=2,
+        progress_handler=progress.append,
+    )
+
+    assert len(dt_api.copies) == 2
+    assert all(r.success for r in results)
+    assert [r.file for r in results] == files
+    assert results[3].path == os.path.join(str(tmp_path), "f3", "out_3.txt")
+    assert os.path.getsize(results[3].path) == 4
+    assert progress[0] == 0
+    assert progress[-1] == sum(range(1, 7))
+
+
+def test_download_files_reports_per_file_failures(tmp_path):
+    files = _files(4) + [File(id="f9", evaluation_path="no_content.txt")]
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(4)}, fail=["p1/s1"])
+
+    results = download_files(project_api_mock(dt_api), files, str(tmp_path), max_in_flight=4)
+
+    assert [r.success for r in results] == [True, False, True, True, False]
+    assert results[1].error == "boom"
+    assert "no stored content" in results[4].error
+
+
+def test_download_files_ignores_stale_local_files(tmp_path):
+    files = _files(3)
+    (tmp_path / "out_2.txt").write_bytes(b"old")
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(3)}, fail=["p1/s2"])
+
+    results = download_files(project_api_mock(dt_api), files, str(tmp_path), max_in_flight=1)
+
+    # Files of the failed operation are retried one by one, the stale file stays a failure
+    assert [r.success for r in results] == [True, True, False]
+    assert [len(c) for c in dt_api.copies] == [3, 1, 1, 1]
+    assert (tmp_path / "out_2.txt").read_bytes() == b"old"
+
+
+def test_download_files_retries_failed_operations_file_by_file(tmp_path):
+    files = _files(4)
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(4)}, failures=1)
+
+    results = download_files(project_api_mock(dt_api), files, str(tmp_path), max_in_flight=2)
+
+    assert all(r.success for r in results)
+    assert sorted(len(c) for c in dt_api.copies) == [1, 1, 2, 2]
+    assert os.path.getsize(results[3].path) == 4
+
+
+def test_download_files_rejects_files_sharing_a_local_path(tmp_path):
+    files = _files(3)
+    files[2].evaluation_path = "out_0.txt"
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(3)})
+
+    with pytest.raises(ClientError, match="f0 and f2"):
+        download_files(project_api_mock(dt_api), files, str(tmp_path))
+    assert dt_api.copies == []
+
+    results = download_files(project_api_mock(dt_api), files, str(tmp_path), layout="by_id")
+    assert all(r.success for r in results)
+    assert len({r.path for r in results}) == 3
+
+
+def test_download_files_uses_download_cache(tmp_path):
+    files = _files(3)
+    for f in files:
+        f.hash = f"h{f.id}"
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(3)})
+    project_api = project_api_mock(dt_api)
+    project_api.download_cache = DownloadCache(str(tmp_path / "cache"))
+
+    download_files(project_api, files[:2], str(tmp_path / "first"))
+    results = download_files(project_api, files, str(tmp_path / "second"), max_in_flight=1)
+
+    assert all(r.success for r in results)
+    assert len(dt_api.copies) == 3
+    assert [o.src.path for o in dt_api.copies[-1]] == ["p1/s2"]
+    assert os.path.getsize(results[1].path) == 2
+
+
+def test_download_files_verifies_checksums(tmp_path):
+    files = _files(3)
+    files[0].hash = hashlib.sha256(b"x").hexdigest()
+    files[1].hash = hashlib.sha256(b"corrupted").hexdigest()
+    files[2].hash = "not-a-sha256"
+    dt_api = DataTransferApiMock({f"p1/s{i}": b"x" * (i + 1) for i in range(3)})
+
+    results = download_files(project_api_mock(dt_api), files, str(tmp_path), verify=True)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == "Checksum mismatch"
+
+
+def test_skip_unchanged_uploads(tmp_path):
+    same = tmp_path / "same.txt"
+    same.write_bytes(b"same")
+    changed = tmp_path / "changed.txt"
+    changed.write_bytes(b"next")
+    files = [
+        File(id="f0", src=str(same), size=4, hash=hashlib.sha256(b"same").hexdigest()),
+        File(id="f1", src=str(changed), size=4, hash=hashlib.sha256(b"prev").hexdigest()),
+        File(id="f2", src=io.BytesIO(b"same"), size=4, hash=hashlib.sha256(b"same").hexdigest()),
+    ]
+
+    assert _skip_unchanged_uploads(files) == 1
+    assert files[0].src is None
+    assert files[1].src == str(changed)
+    assert files[2].src is not None
+
+
+def test_download_files_rejects_unknown_layout(tmp_path):
+    with pytest.raises(ClientError, match="layout"):
+        download_files(project_api_mock(None), _files(1), str(tmp_path), layout="nested")
+
+
+def test_file_contents_are_read_from_disk_and_cleaned_up():
+    files = _files(3) + [File(id="f9", storage_id="s9", evaluation_path="empty.txt", size=0)]
+    storage = {"p1/s0": b"a", "p1/s1": b"bb", "p1/s2": b"ccc", "p1/s9": b""}
+    dt_api = DataTransferApiMock(storage)
+
+    with FileContents(project_api_mock(dt_api), files) as contents:
+        temp_dir = contents._temp_dir.name
+        with contents.open(files[1]) as fh:
+            assert fh.read() == b"bb"
+        handle = contents.open(files[2])
+        data = contents.mmap(files[2])
+        assert data[:] == b"ccc"
+        assert bytes(contents.mmap(files[3])) == b""
+        assert contents.read(files[0]) == b"a"
+        with pytest.raises(ClientError, match="reading"):
+            contents.open(files[0], "wb")
+
+    assert handle.closed
+    assert data.closed
+    assert not os.path.exists(temp_dir)
+
+
+def test_file_contents_raise_for_failed_downloads():
+    files = _files(2)
+    dt_api = DataTransferApiMock({"p1/s0": b"a", "p1/s1": b"bb"}, fail=["p1/s1"])
+
+    with FileContents(project_api_mock(dt_api), files) as contents:
+        with pytest.raises(HPSError, match="not available"):
+            contents.open(files[1])
+        with pytest.raises(ClientError, match="not part"):
+            contents.path(File(id="other"))
+
+
+def test_local_source_path_writes_buffers_and_keeps_paths(tmp_path):
+    src_path = tmp_path / "input.dat"
+    src_path.write_bytes(b"on disk")
+    temp_dir = tmp_path / "upload"
+    temp_dir.mkdir()
+
+    assert _local_source_path(File(src=str(src_path)), str(temp_dir)) == str(src_path)
+    with open(src_path, "rb") as fh:
+        assert _local_source_path(File(src=fh, storage_id="s0"), str(temp_dir)) == str(src_path)
+
+    buffer = io.BytesIO(b"bytes content")
+    path = _local_source_path(File(src=buffer, storage_id="s1"), str(temp_dir))
+    assert open(path, "rb").read() == b"bytes content"
+    # The buffer can still be resized, so no view on it is left behind
+    buffer.write(b" and more")
+
+    text = io.StringIO("text content")
+    text.seek(5)
+    path = _local_source_path(File(src=text, storage_id="s2"), str(temp_dir))
+    assert open(path).read() == "text content"
+    assert text.tell() == 5
+
+
+def test_upload_deduplicated_copies_stored_and_repeated_contents():
+    mesh_hash = hashlib.sha256(b"mesh").hexdigest()
+    macro_hash = hashlib.sha256(b"macro").hexdigest()
+    queries = []
+
+    def get(url, params=None):
+        queries.append(params)
+        existing = [{"id": "old", "storage_id": "s_old", "hash": mesh_hash, "size": 4}]
+        return SimpleNamespace(json=lambda: {"files": existing})
+
+    copies = []
+    dt_api = SimpleNamespace(
+        copy=lambda operations: copies.append(operations) or SimpleNamespace(id="op"),
+        wait_for=lambda ids: [Operation(id="op", state=OperationState.Succeeded)],
+    )
+    files = [
+        File(id="f0", storage_id="s0", src=io.BytesIO(b"mesh")),
+        File(id="f1", storage_id="s1", src=io.BytesIO(b"macro")),
+        File(id="f2", storage_id="s2", src=io.StringIO("macro")),
+        File(id="f3", storage_id="s3", src=io.BytesIO(b"other")),
+    ]
+    uploaded = []
+
+    def upload(to_upload):
+        uploaded.extend(to_upload)
+        for f in to_upload:
+            f.hash = f"server-{f.id}"
+            f.size = 5
+
+    index = {}
+    _upload_deduplicated(
+        project_api_mock(dt_api, SimpleNamespace(get=get)), files, upload, hash_index=index
+    )
+
+    assert set(queries[0]["hash"]) == {mesh_hash, macro_hash, hashlib.sha256(b"other").hexdigest()}
+    assert [f.id for f in uploaded] == ["f1", "f3"]
+    pairs = sorted((o.src.path, o.dst.path) for o in copies[0])
+    assert pairs == [("p1/s1", "p1/s2"), ("p1/s_old", "p1/s0")]
+    assert (files[0].hash, files[0].size) == (mesh_hash, 4)
+    assert files[2].hash == "server-f1"
+    assert index[macro_hash] == {"path": "p1/s1", "hash": "server-f1", "size": 5}
+
+    # Contents in the index are copied without querying the project
+    queries.clear()
+    copies.clear()
+    uploaded.clear()
+    again = [File(id="f4", storage_id="s4", src=io.BytesIO(b"macro"))]
+    _upload_deduplicated(
+        project_api_mock(dt_api, SimpleNamespace(get=get)), again, upload, hash_index=index
+    )
+    assert queries == []
+    assert uploaded == []
+    assert copies[0][0].src.path == "p1/s1"
+
+
+def test_find_existing_contents_splits_the_hash_filter():
+    digests = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(300)]
+    queries = []
+
+    def get(url, params=None):
+        queries.append(params["hash"])
+        return SimpleNamespace(json=lambda: {"files": []})
+
+    project_api = project_api_mock(None, SimpleNamespace(get=get))
+    assert _find_existing_contents(project_api, digests) == {}
+
+    assert len(queries) > 1
+    assert [h for q in queries for h in q] == digests
+    assert all(len(urlencode({"hash": q}, doseq=True)) <= MAX_ID_FILTER_LENGTH for q in queries)
+
+
+def test_create_files_pipelines_chunks(tmp_path):
+    events = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            events.append(event)
+
+    def post(url, data=None, params=None):
+        files = json.loads(data)["files"]
+        for f in files:
+            f.update(id=f"id_{f['name']}", storage_id=f"s_{f['name']}")
+        record(("create", len(files)))
+        return SimpleNamespace(json=lambda: {"files": files})
+
+    def put(url, data=None, params=None):
+        files = json.loads(data)["files"]
+        record(("update", [f["hash"] for f in files]))
+        return SimpleNamespace(json=lambda: {"files": files})
+
+    class DataTransferApi:
+        def __init__(self):
+            self._ops = {}
+
+        def copy(self, operations):
+            record(("upload", len(operations)))
+            time.sleep(0.05)
+            op_id = f"op{len(self._ops)}"
+            self._ops[op_id] = Operation(id=op_id, state=OperationState.Succeeded)
+            return SimpleNamespace(id=op_id)
+
+        def get_metadata(self, paths):
+            op_id = f"op{len(self._ops)}"
+            result = {p.path: {"checksum": f"hash_{p.path}", "size": 1} for p in paths}
+            self._ops[op_id] = Operation(id=op_id, state=OperationState.Succeeded, result=result)
+            return SimpleNamespace(id=op_id)
+
+        def wait_for(self, op_id, handler=None):
+            return [self._ops[op_id]]
+
+    project_api = project_api_mock(DataTransferApi(), SimpleNamespace(post=post, put=put))
+    project_api.version = "1.1.60"
+    sources = []
+    for i in range(7):
+        path = tmp_path / f"in_{i}.txt"
+        path.write_text("x")
+        sources.append(File(name=f"f{i}", evaluation_path=f"in_{i}.txt", src=str(path)))
+
+    created = create_files(project_api, sources, chunk_size=3, max_uploads=2)
+
+    assert [f.id for f in created] == [f"id_f{i}" for i in range(7)]
+    assert created[6].hash == "hash_p1/s_f6"
+    assert [e[1] for e in events if e[0] == "create"] == [3, 3, 1]
+    assert sorted(e[1] for e in events if e[0] == "upload") == [1, 3, 3]
+    updates = [e[1] for e in events if e[0] == "update"]
+    assert updates[0] == ["hash_p1/s_f0", "hash_p1/s_f1", "hash_p1/s_f2"]
+    # The last chunk is created before the first chunk is updated
+    assert events.index(("create", 1)) < events.index(("update", updates[0]))
+
+    with pytest.raises(ClientError):
+        create_files(project_api, sources, chunk_size=3, max_uploads=0)
@@ -0,0 +1,84 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+
+from ansys.hps.client.jms.api.harvest import harvest_outputs
+
+from .conftest import DataTransferApiMock, SessionMock, project_api_mock
+
+_COLLECTIONS = {
+    "jobs": [{"id": "j1"}, {"id": "j2"}],
+    "tasks": [
+        {"id": "t1", "job_id": "j1", "output_file_ids": ["o1", "o2", "o3"]},
+        {"id": "t2", "job_id": "j2", "output_file_ids": ["o4"]},
+    ],
+    "files": [
+        {"id": "o1", "storage_id": "s1", "evaluation_path": "img/a.jpg", "size": 1},
+        {"id": "o2", "storage_id": "s2", "evaluation_path": "file.out", "size": 2},
+        {"id": "o3", "storage_id": "s3", "evaluation_path": "file.log", "size": 3},
+        {"id": "o4", "storage_id": "s4", "evaluation_path": "file.out", "size": 4},
+    ],
+}
+
+_STORAGE = {f"p1/s{i}": b"x" * i for i in range(1, 5)}
+
+
+def test_harvest_outputs_downloads_matching_files_per_job(tmp_path):
+    session = SessionMock(_COLLECTIONS)
+    dt_api = DataTransferApiMock(_STORAGE)
+    progress = []
+
+    results = harvest_outputs(
+        project_api_mock(dt_api, session),
+        {"eval_status": "evaluated"},
+        ["*.jpg", "file.out"],
+        str(tmp_path),
+        max_in_flight=2,
+        progress_handler=progress.append,
+    )
+
+    assert [q[0] for q in session.requests] == ["jobs", "tasks", "files"]
+    assert session.requests[0][1]["eval_status"] == "evaluated"
+    assert session.requests[1][1]["job_id"] == ["j1", "j2"]
+    assert "evaluation_path" not in session.requests[2][1]
+    assert sorted(os.path.relpath(r.path, tmp_path) for r in results) == [
+        os.path.join("j1", "file.out"),
+        os.path.join("j1", "img", "a.jpg"),
+        os.path.join("j2", "file.out"),
+    ]
+    assert all(r.success for r in results)
+    assert len(dt_api.copies) == 2
+    assert progress[-1] == 7
+
+
+def test_harvest_outputs_filters_exact_paths_on_server(tmp_path):
+    session = SessionMock(_COLLECTIONS)
+
+    results = harvest_outputs(
+        project_api_mock(DataTransferApiMock(_STORAGE), session), ["j1"], "file.out", str(tmp_path)
+    )
+
+    assert [q[0] for q in session.requests] == ["tasks", "files"]
+    assert session.requests[1][1]["evaluation_path"] == ["file.out"]
+    assert [r.file.id for r in results] == ["o2"]
@@ -21,6 +21,8 @@
 # SOFTWARE.
 
 import logging
+import threading
+from types import SimpleNamespace
 
 import pytest
 from marshmallow.utils import missing
@@ -221,3 +223,33 @@ def test_objects_type_check(client, has_hps_version_ge_1_3_45):
     )
 
     JmsApi(client).delete_project(proj)
+
+
+def test_get_projects_status_summary_uses_concurrent_cached_counts():
+    counts = {("p1", "running"): 3, ("p1", "failed"): 1, ("p2", "running"): 0, ("p2", "failed"): 7}
+    requests = []
+    lock = threading.Lock()
+
+    def get(url, params=None):
+        project_id = url.split("/projects/")[1].split("/")[0]
+        with lock:
+            requests.append((project_id, params["eval_status"]))
+        count = counts[(project_id, params["eval_status"])]
+        return SimpleNamespace(json=lambda: {"num_jobs": count})
+
+    client = SimpleNamespace(url="https://localhost:8443/hps", session=SimpleNamespace(get=get))
+    jms_api = JmsApi(client)
+
+    summary = jms_api.get_projects_status_summary(
+        [Project(id="p1"), "p2"], statuses=["running", "failed"]
+    )
+    assert summary == {"p1": {"running": 3, "failed": 1}, "p2": {"running": 0, "failed": 7}}
+    assert sorted(requests) == sorted(counts)
+
+    # Counts are served from the cache within the time to live
+    requests.clear()
+    assert jms_api.get_projects_status_summary(["p2"], statuses=["failed"]) == {"p2": {"failed": 7}}
+    assert requests == []
+
+    jms_api.get_projects_status_summary(["p2"], statuses=["failed"], cache_ttl=0)
+    assert requests == [("p2", "failed")]
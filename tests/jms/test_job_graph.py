@@ -0,0 +1,80 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.jms import ProjectApi
+from ansys.hps.client.jms.resource import Job
+
+from .conftest import SessionMock
+
+URL = "https://localhost:8443/hps"
+
+COLLECTIONS = {
+    "jobs": [{"id": "j1", "name": "job 1"}, {"id": "j2", "name": "job 2"}],
+    "tasks": [
+        {"id": "t1", "job_id": "j1", "input_file_ids": ["f1"], "output_file_ids": ["f2"]},
+        {"id": "t2", "job_id": "j2", "input_file_ids": ["f1"], "output_file_ids": ["f3"]},
+    ],
+    "files": [
+        {"id": "f1", "evaluation_path": "input.mac"},
+        {"id": "f2", "evaluation_path": "out_1.txt"},
+        {"id": "f3", "evaluation_path": "out_2.txt"},
+    ],
+}
+
+
+def test_get_job_graph_bulk_loads_and_links_resources():
+    session = SessionMock(COLLECTIONS)
+    project_api = ProjectApi(SimpleNamespace(url=URL, session=session), "p1")
+
+    graph = project_api.get_job_graph(["j2", "j1"])
+
+    assert sorted(r for r, _ in session.requests) == ["files", "jobs", "tasks"]
+    assert [node.job.id for node in graph] == ["j2", "j1"]
+    task_node = graph[0].tasks[0]
+    assert task_node.task.id == "t2"
+    assert [f.evaluation_path for f in task_node.input_files] == ["input.mac"]
+    assert [f.evaluation_path for f in task_node.output_files] == ["out_2.txt"]
+    # Shared input files are loaded once
+    files_query = next(p for r, p in session.requests if r == "files")
+    assert sorted(files_query["id"]) == ["f1", "f2", "f3"]
+
+
+def test_get_job_graph_tasks_only_with_job_objects():
+    session = SessionMock(COLLECTIONS)
+    project_api = ProjectApi(SimpleNamespace(url=URL, session=session), "p1")
+
+    graph = project_api.get_job_graph([Job(id="j1")], include=["tasks"])
+
+    assert [r for r, _ in session.requests] == ["tasks"]
+    assert graph[0].tasks[0].task.id == "t1"
+    assert graph[0].tasks[0].output_files == []
+
+
+def test_get_job_graph_rejects_unknown_collections():
+    project_api = ProjectApi(SimpleNamespace(url=URL, session=SessionMock(COLLECTIONS)), "p1")
+    with pytest.raises(ClientError, match="Unknown"):
+        project_api.get_job_graph(["j1"], include=["hosts"])
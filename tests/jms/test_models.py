@@ -43,3 +43,21 @@ def test_object_functionality():
 
     assert obj.get("memory") == 1024
     assert obj.get("service") is None
+
+
+def test_modified_fields_tracking():
+    from ansys.hps.client.jms.resource import Job
+    from ansys.hps.client.jms.schema.job import JobSchema
+
+    # Objects created on the client side are not tracked
+    job = Job(name="job", priority=1)
+    assert job.modified_fields is None
+
+    # Objects loaded from the server start clean
+    job = JobSchema().load({"id": "j1", "name": "job", "priority": 1, "values": {"a": 1}})
+    assert job.modified_fields == set()
+
+    job.priority = 2
+    job["note"] = "changed"
+    job.content = "not a declared field"
+    assert job.modified_fields == {"priority", "note"}
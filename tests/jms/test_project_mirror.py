@@ -0,0 +1,142 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+from ansys.hps.client.jms import ProjectMirror
+from ansys.hps.client.jms.resource import Job
+
+URL = "https://localhost:8443/hps/jms/api/v1/projects/p1"
+
+
+class _SessionMock:
+    """Serves collections with support for the query parameters used by the mirror."""
+
+    def __init__(self, collections, on_get=None):
+        self.collections = collections
+        self.requests = []
+        self.on_get = on_get
+
+    def get(self, url, params=None):
+        self.requests.append((url, dict(params)))
+        rest_name = url.rsplit("/", 1)[-1]
+        data = sorted(self.collections.get(rest_name, []), key=lambda d: d["modification_time"])
+        if "modification_time.ge" in params:
+            data = [d for d in data if d["modification_time"] >= params["modification_time.ge"]]
+        if isinstance(params.get("fields"), list):
+            data = [{k: d[k] for k in params["fields"]} for d in data]
+        offset = params.get("offset", 0)
+        data = data[offset : offset + params["limit"]]
+        if self.on_get is not None:
+            self.on_get(rest_name)
+        return SimpleNamespace(json=lambda: {rest_name: data})
+
+
+def _job(i, time, **kwargs):
+    return {
+        "id": f"j{i}",
+        "name": f"job {i}",
+        "eval_status": "pending",
+        "job_definition_id": "jd1",
+        "values": {"x": i, "mode": "a" if i % 2 else "b"},
+        "host_ids": [f"h{i % 2}"],
+        "modification_time": time,
+    } | kwargs
+
+
+def _mirror(collections, page_size=2):
+    session = _SessionMock(collections)
+    project_api = SimpleNamespace(client=SimpleNamespace(session=session), url=URL, project_id="p1")
+    return ProjectMirror(project_api, ":memory:", page_size=page_size), session
+
+
+def test_project_mirror_initial_sync_and_queries():
+    jobs = [_job(i, f"2024-01-01T00:00:0{i}") for i in range(5)]
+    jobs[3]["eval_status"] = "failed"
+    tasks = [
+        {"id": "t1", "job_id": "j1", "host_id": "h1", "modification_time": "2024-01-01T00:00:00"}
+    ]
+    mirror, _ = _mirror({"jobs": jobs, "tasks": tasks})
+
+    counts = mirror.sync()
+    assert counts["jobs"] == 5
+    assert counts["tasks"] == 1
+
+    failed = mirror.get_jobs(eval_status="failed")
+    assert len(failed) == 1
+    assert isinstance(failed[0], Job)
+    assert failed[0].id == "j3"
+
+    assert [j["id"] for j in mirror.get_jobs(host_id="h1", as_objects=False)] == ["j1", "j3"]
+    assert [j.id for j in mirror.get_jobs(values={"x": (1, 3), "mode": "a"})] == ["j1", "j3"]
+    assert len(mirror.get_jobs(eval_status=["pending", "failed"], job_definition_id="jd1")) == 5
+    assert mirror.get_tasks(host_id="h1")[0].job_id == "j1"
+
+
+def test_project_mirror_incremental_sync_and_prune():
+    jobs = [_job(i, f"2024-01-01T00:00:0{i}") for i in range(3)]
+    collections = {"jobs": jobs}
+    mirror, session = _mirror(collections)
+    mirror.sync()
+
+    # Modify a job, add a job and delete a job
+    jobs[0] = _job(0, "2024-01-01T00:00:05", eval_status="evaluated")
+    jobs.append(_job(3, "2024-01-01T00:00:06"))
+    del jobs[1]
+    session.requests.clear()
+
+    counts = mirror.sync()
+
+    job_queries = [p for url, p in session.requests if url.endswith("/jobs") and "sort" in p]
+    assert job_queries[0]["modification_time.ge"] == "2024-01-01T00:00:02"
+    # job 2 is fetched again at the watermark, job 0 and 3 are new
+    assert counts["jobs"] == 3
+    assert sorted(j.id for j in mirror.get_jobs()) == ["j0", "j2", "j3"]
+    assert mirror.get_jobs(eval_status="evaluated")[0].id == "j0"
+    assert mirror.get_jobs(values={"x": 1}) == []
+
+
+def test_project_mirror_does_not_skip_resources_modified_during_sync():
+    jobs = [_job(i, f"2024-01-01T00:00:0{i}") for i in range(6)]
+    modified = []
+
+    def modify_first_job(rest_name):
+        # Job 0 is modified after the first page was served, moving it to the end
+        if rest_name == "jobs" and not modified:
+            jobs[0] = _job(0, "2024-01-01T00:00:09", eval_status="running")
+            modified.append(True)
+
+    mirror, session = _mirror({"jobs": jobs})
+    session.on_get = modify_first_job
+    mirror.sync()
+
+    assert sorted(j.id for j in mirror.get_jobs()) == [f"j{i}" for i in range(6)]
+    assert mirror.get_jobs(eval_status="running")[0].id == "j0"
+    assert all("offset" not in p for _, p in session.requests)
+
+
+def test_project_mirror_pages_through_resources_with_same_modification_time():
+    jobs = [_job(i, "2024-01-01T00:00:00") for i in range(5)] + [_job(5, "2024-01-01T00:00:01")]
+    mirror, _ = _mirror({"jobs": jobs})
+
+    assert mirror.sync()["jobs"] == 6
+    assert len(mirror.get_jobs()) == 6
@@ -0,0 +1,188 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import queue
+import threading
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.monitor import BufferedStream, MessageBuffer, OverflowPolicy
+
+
+def _msg(value, **tags):
+    return {"tags": {"client_type": "evaluator", **tags}, "value": value}
+
+
+def test_message_buffer_drop_oldest():
+    buffer = MessageBuffer(maxsize=3, overflow=OverflowPolicy.DROP_OLDEST)
+    for i in range(5):
+        buffer.put(_msg(i))
+
+    assert [buffer.get()["value"] for _ in range(3)] == [2, 3, 4]
+    assert buffer.received == 5
+    assert buffer.delivered == 3
+    assert buffer.dropped == 2
+    assert buffer.max_pending == 3
+    with pytest.raises(queue.Empty):
+        buffer.get(block=False)
+
+
+def test_message_buffer_sample():
+    buffer = MessageBuffer(maxsize=2, overflow=OverflowPolicy.SAMPLE, sample_every=3)
+    for i in range(8):
+        buffer.put(_msg(i))
+
+    # Of the 6 messages arriving while full, only the 3rd and 6th are kept
+    assert [buffer.get()["value"] for _ in range(2)] == [4, 7]
+    assert buffer.dropped == 6
+
+
+def test_message_buffer_coalesce_latest_per_topic():
+    buffer = MessageBuffer(maxsize=2, overflow=OverflowPolicy.COALESCE)
+    buffer.put(_msg(1, statistic="cpu", timestamp=1))
+    buffer.put(_msg(2, statistic="mem", timestamp=1))
+    buffer.put(_msg(3, statistic="cpu", timestamp=2))
+    buffer.put(_msg(4, statistic="cpu", timestamp=3))
+
+    assert buffer.qsize() == 2
+    assert buffer.get()["value"] == 4
+    assert buffer.get()["value"] == 2
+    assert buffer.dropped == 2
+
+    # A new topic evicts the oldest one when the buffer is full
+    buffer.put(_msg(5, statistic="cpu"))
+    buffer.put(_msg(6, statistic="mem"))
+    buffer.put(_msg(7, statistic="disk"))
+    assert [buffer.get()["value"] for _ in range(2)] == [6, 7]
+
+
+def test_message_buffer_coalesces_only_when_full():
+    buffer = MessageBuffer(maxsize=3, overflow=OverflowPolicy.COALESCE)
+    buffer.put(_msg(1, statistic="cpu"))
+    buffer.put(_msg(2, statistic="mem"))
+    buffer.put(_msg(3, statistic="cpu"))
+
+    assert buffer.qsize() == 3
+    assert buffer.dropped == 0
+
+    # Once full, the latest pending message of the topic is replaced
+    buffer.put(_msg(4, statistic="cpu"))
+    assert [buffer.get()["value"] for _ in range(3)] == [1, 2, 4]
+    assert buffer.dropped == 1
+
+
+def test_message_buffer_block():
+    buffer = MessageBuffer(maxsize=1)
+    buffer.put(_msg(1))
+    with pytest.raises(queue.Full):
+        buffer.put(_msg(2), timeout=0.01)
+    with pytest.raises(queue.Full):
+        buffer.put(_msg(2), block=False)
+
+    producer = threading.Thread(target=buffer.put, args=(_msg(3),))
+    producer.start()
+    assert buffer.get()["value"] == 1
+    producer.join(timeout=1)
+    assert buffer.get()["value"] == 3
+    assert buffer.dropped == 0
+
+
+def test_message_buffer_keeps_end_of_stream():
+    buffer = MessageBuffer(maxsize=1, overflow=OverflowPolicy.DROP_OLDEST)
+    buffer.put(_msg(1))
+    buffer.put(_msg(2))
+    buffer.put(None)
+
+    assert buffer.get()["value"] == 2
+    assert buffer.get() is None
+    assert buffer.get(block=False) is None
+    assert buffer.lag == 0.0
+
+
+def test_message_buffer_invalid_policy():
+    with pytest.raises(ClientError, match="Unknown overflow policy"):
+        MessageBuffer(overflow="ignore")
+
+
+def test_buffered_stream_slow_consumer():
+    release = threading.Event()
+
+    def producer():
+        for i in range(100):
+            yield _msg(i)
+        release.set()
+
+    stream = BufferedStream(producer(), maxsize=10, overflow=OverflowPolicy.DROP_OLDEST)
+    assert release.wait(timeout=5)
+    values = [msg["value"] for msg in stream]
+
+    assert values == list(range(90, 100))
+    assert stream.dropped == 90
+    assert stream.pending == 0
+
+
+def test_buffered_stream_propagates_errors():
+    def producer():
+        yield _msg(1)
+        raise ConnectionError("lost")
+
+    with BufferedStream(producer()) as stream:
+        messages = stream.messages(timeout=5)
+        assert next(messages)["value"] == 1
+        with pytest.raises(ClientError, match="lost"):
+            next(messages)
+
+
+def test_buffered_stream_close_unblocks_reader():
+    closed = threading.Event()
+
+    def producer():
+        try:
+            i = 0
+            while True:
+                yield _msg(i)
+                i += 1
+        finally:
+            closed.set()
+
+    stream = BufferedStream(producer(), maxsize=2)
+    stream.close()
+    assert closed.wait(timeout=5)
+    assert list(stream.messages(timeout=1)) == []
+
+
+def test_buffered_stream_context_manager_after_end():
+    with BufferedStream(iter([_msg(1), _msg(2)])) as stream:
+        values = [msg["value"] for msg in stream]
+    assert values == [1, 2]
+    assert stream.pending == 0
+
+
+def test_message_buffer_clear():
+    buffer = MessageBuffer(maxsize=2)
+    buffer.put(_msg(1))
+    buffer.put(None)
+    buffer.clear()
+    assert buffer.qsize() == 0
+    assert buffer.get(block=False) is None
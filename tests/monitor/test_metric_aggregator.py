@@ -0,0 +1,104 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.monitor import MetricAggregator
+
+np = pytest.importorskip("numpy")
+
+
+def _host_resources(evaluator, timestamp, cpu, memory):
+    return {
+        "tags": {
+            "statistic": "host_resources",
+            "evaluator_name": evaluator,
+            "timestamp": timestamp,
+        },
+        "message": json.dumps({"cpu": {"usage": cpu}, "virtual_memory": {"percent": memory}}),
+    }
+
+
+def _process_tree(task_id, timestamp, cpus):
+    root = {"pid": 1, "cpu_percentage": str(cpus[0]), "memory_percentage": "1.0"}
+    root["children"] = [
+        {"pid": i + 2, "cpu_percentage": str(c), "memory_percentage": "2.0"}
+        for i, c in enumerate(cpus[1:])
+    ]
+    return {
+        "tags": {"statistic": "process_tree", "task_id": task_id, "timestamp": timestamp},
+        "message": root,
+    }
+
+
+def test_metric_aggregator_rolling_window_statistics():
+    aggregator = MetricAggregator(window=4)
+    for i in range(6):
+        assert aggregator.add(_host_resources("ev1", 100 + i, cpu=10.0 * i, memory=50.0)) == 2
+    aggregator.add(_host_resources("ev2", 100, cpu=1.0, memory=2.0))
+
+    # Only the last 4 samples are kept
+    stats = aggregator.stats("ev1", "cpu", percentiles=[50, 100])
+    assert stats["count"] == 4
+    assert stats["last"] == 50.0
+    assert stats["mean"] == pytest.approx(35.0)
+    assert aggregator.mean("ev1", "cpu") == pytest.approx(35.0)
+    assert (stats["min"], stats["max"]) == (20.0, 50.0)
+    assert stats["p50"] == pytest.approx(35.0)
+    assert stats["p100"] == 50.0
+
+    assert aggregator.sources == ["ev1", "ev2"]
+    assert aggregator.metrics("ev1") == ["cpu", "memory"]
+    assert aggregator.summary()["ev2"]["memory"]["last"] == 2.0
+
+    aggregator.clear("ev2")
+    assert aggregator.sources == ["ev1"]
+    with pytest.raises(ClientError, match="No samples"):
+        aggregator.stats("ev2", "cpu")
+
+
+def test_metric_aggregator_process_trees_and_other_messages():
+    aggregator = MetricAggregator()
+    assert aggregator.add(_process_tree("t1", 100, [10.0, 20.0, 30.0])) == 3
+    assert aggregator.add({"tags": {"statistic": "other", "task_id": "t1"}}) == 0
+    assert aggregator.add({"line": "log", "tags": {"task_id": "t1"}}) == 0
+
+    assert aggregator.stats("t1", "cpu")["last"] == 60.0
+    assert aggregator.stats("t1", "memory")["last"] == 5.0
+    assert aggregator.stats("t1", "processes")["last"] == 3.0
+
+
+def test_metric_aggregator_downsampled_snapshot():
+    aggregator = MetricAggregator(window=10)
+    aggregator.extend(_host_resources("ev1", float(i), cpu=float(i), memory=0.0) for i in range(13))
+
+    times, values = aggregator.snapshot("ev1", "cpu", points=5)
+    # Samples 3 to 12, oldest first, averaged by pairs
+    np.testing.assert_allclose(values, [3.5, 5.5, 7.5, 9.5, 11.5])
+    np.testing.assert_allclose(times, values)
+
+    times, values = aggregator.snapshot("ev1", "cpu", points=20)
+    np.testing.assert_allclose(values, np.arange(3, 13))
@@ -23,6 +23,9 @@
 import importlib
 import json
 import sys
+import threading
+import time
+import uuid
 from types import SimpleNamespace
 from typing import Any
 
@@ -30,6 +33,7 @@ import pytest
 
 import ansys.hps.client.monitor.api.monitor_api as monitor_api_module
 from ansys.hps.client import ClientError
+from ansys.hps.client.jms.api.base import _split_id_filter
 from ansys.hps.client.monitor import MonitorApi
 
 BASE_URL = "http://localhost:1089"
@@ -325,7 +329,9 @@ def test_resolve_evaluator_name_for_task_success(monkeypatch):
     client = MonitorApi(_make_hps_client())
     monkeypatch.setattr(
         "ansys.hps.client.jms.ProjectApi",
-        lambda c, pid: SimpleNamespace(get_tasks=lambda **kw: [SimpleNamespace(host_id="host-1")]),
+        lambda c, pid: SimpleNamespace(
+            get_tasks=lambda **kw: [SimpleNamespace(id="task-1", host_id="host-1")]
+        ),
     )
     monkeypatch.setattr(
         "ansys.hps.client.rms.RmsApi",
@@ -350,7 +356,9 @@ def test_resolve_evaluator_name_for_task_raises_when_no_evaluator(monkeypatch):
     client = MonitorApi(_make_hps_client())
     monkeypatch.setattr(
         "ansys.hps.client.jms.ProjectApi",
-        lambda c, pid: SimpleNamespace(get_tasks=lambda **kw: [SimpleNamespace(host_id="host-1")]),
+        lambda c, pid: SimpleNamespace(
+            get_tasks=lambda **kw: [SimpleNamespace(id="task-1", host_id="host-1")]
+        ),
     )
     monkeypatch.setattr(
         "ansys.hps.client.rms.RmsApi",
@@ -364,7 +372,9 @@ def test_resolve_evaluator_name_for_task_raises_when_evaluator_name_missing(monk
     client = MonitorApi(_make_hps_client())
     monkeypatch.setattr(
         "ansys.hps.client.jms.ProjectApi",
-        lambda c, pid: SimpleNamespace(get_tasks=lambda **kw: [SimpleNamespace(host_id="host-1")]),
+        lambda c, pid: SimpleNamespace(
+            get_tasks=lambda **kw: [SimpleNamespace(id="task-1", host_id="host-1")]
+        ),
     )
     monkeypatch.setattr(
         "ansys.hps.client.rms.RmsApi",
@@ -439,3 +449,322 @@ def test_get_task_process_tree_collects_snapshots(monkeypatch):
     result = client.get_task_process_tree("task-1", max_messages=3)
     assert isinstance(result, list)
     assert len(result) == 3
+
+
+# ---------------------------------------------------------------------------
+# Resilient streams
+# ---------------------------------------------------------------------------
+
+
+class _HandshakeError(Exception):
+    status_code = 401
+
+
+def test_resilient_stream_reconnects_resubscribes_and_drops_duplicates(monkeypatch):
+    monkeypatch.setattr(monitor_api_module.time, "sleep", lambda s: None)
+    monkeypatch.setattr(monitor_api_module.time, "time", lambda: 109.0)
+
+    def log(i):
+        return {"tags": {"task_id": "t1", "timestamp": 100 + i}, "line": f"line {i}"}
+
+    class _WsMock:
+        def __init__(self, frames):
+            self.sent = []
+            self.frames = frames
+            self.closed = False
+
+        def send(self, payload):
+            self.sent.append(json.loads(payload))
+
+        def recv(self):
+            frame = self.frames.pop(0)
+            if isinstance(frame, Exception):
+                raise frame
+            return json.dumps({"messages": frame})
+
+        def close(self):
+            self.closed = True
+
+    connections = [
+        _WsMock([[log(0), log(1), log(2)], TimeoutError(), ConnectionResetError("reset")]),
+        _HandshakeError("401 Unauthorized"),
+        _WsMock([[log(1), log(2), log(3)], [log(4)]]),
+    ]
+
+    def create_connection(url, **kwargs):
+        connection = connections.pop(0)
+        if isinstance(connection, Exception):
+            raise connection
+        connection.header = kwargs.get("header")
+        return connection
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=create_connection)
+    )
+    hps_client = _make_hps_client(access_token="old")
+
+    def refresh_access_token():
+        hps_client.access_token = "new"
+
+    hps_client.refresh_access_token = refresh_access_token
+    first, _, last = list(connections)
+    client = MonitorApi(hps_client, reconnect=True)
+
+    lines = [m["line"] for m in client.stream_task_logs("t1", backlog=3, max_messages=5)]
+
+    assert lines == [f"line {i}" for i in range(5)]
+    assert first.sent[0]["backlog"] == {"limit": 3}
+    # 1 message per second, 7 seconds since the last one, plus a margin
+    assert last.sent[0]["backlog"] == {"limit": 7 + 10}
+    assert last.sent[0]["token"] == "new"
+    assert last.header == {"Authorization": "Bearer new"}
+    assert first.closed
+    assert last.closed
+
+
+def test_resilient_stream_gives_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(monitor_api_module.time, "sleep", lambda s: None)
+
+    def create_connection(url, **kwargs):
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=create_connection)
+    )
+    client = MonitorApi(_make_hps_client(), reconnect=True, max_reconnect_attempts=2)
+
+    with pytest.raises(ClientError, match="after 2 reconnection attempts"):
+        list(client.stream_service_logs("ansys.rep.jms"))
+
+
+def test_resilient_stream_only_drops_duplicates_of_the_overlap(monkeypatch):
+    monkeypatch.setattr(monitor_api_module.time, "sleep", lambda s: None)
+    monkeypatch.setattr(monitor_api_module.time, "time", lambda: 102.0)
+
+    def log(line, timestamp):
+        return {"tags": {"task_id": "t1", "timestamp": timestamp}, "line": line}
+
+    frames = [
+        # Identical lines logged at the same time are all delivered
+        [[log("a", 100), log("a", 100), log("b", 101)], ConnectionResetError("reset")],
+        # The backlog repeats both "a" lines and "b", then a third "a" and newer lines
+        [[log("a", 100), log("a", 100), log("a", 100), log("b", 101), log("b", 102)]],
+    ]
+
+    class _WsMock:
+        def __init__(self, frames):
+            self.frames = frames
+
+        def send(self, payload):
+            pass
+
+        def recv(self):
+            frame = self.frames.pop(0)
+            if isinstance(frame, Exception):
+                raise frame
+            return json.dumps({"messages": frame})
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(
+        sys.modules,
+        "websocket",
+        SimpleNamespace(create_connection=lambda url, **kwargs: _WsMock(frames.pop(0))),
+    )
+    client = MonitorApi(_make_hps_client(), reconnect=True)
+
+    messages = list(client.stream_task_logs("t1", max_messages=5))
+
+    assert [(m["line"], m["tags"]["timestamp"]) for m in messages] == [
+        ("a", 100),
+        ("a", 100),
+        ("b", 101),
+        ("a", 100),
+        ("b", 102),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Raw decoding mode
+# ---------------------------------------------------------------------------
+
+
+def test_raw_mode_yields_plain_dicts_or_selected_fields(monkeypatch):
+    logs = [
+        {"tags": {"task_id": "t1", "level": "info"}, "line": "a"},
+        {"tags": {"task_id": "t1"}, "line": "b"},
+    ]
+    _make_multi_ws_mock(monkeypatch, [{"messages": logs}])
+    client = MonitorApi(_make_hps_client(), raw=True)
+    messages = list(client.stream_task_logs("t1"))
+    assert messages == logs
+    assert all(type(m) is dict for m in messages)
+
+    _make_multi_ws_mock(monkeypatch, [{"messages": logs}])
+    client = MonitorApi(_make_hps_client(), fields=["line", "tags.level", "tags.level.x"])
+    assert client.raw
+    assert list(client.stream_task_logs("t1")) == [("a", "info", None), ("b", None, None)]
+    assert client.decode_frame(json.dumps(logs[0])) == [("a", "info", None)]
+    assert client.decode_frame(json.dumps([logs[1], "noise"])) == [("b", None, None)]
+
+    # Commands and project resolution keep their typed messages
+    _make_ws_mock(monkeypatch, {"tags": {"client_type": ["ansys.rep.jms"]}})
+    assert client.list_topics() == {"client_type": ["ansys.rep.jms"]}
+    _make_ws_mock(monkeypatch, {"tags": {"project_id": "p1"}})
+    assert client.resolve_project_id_for_task("t1") == "p1"
+
+
+def test_raw_mode_in_sessions(monkeypatch):
+    frames = [json.dumps([{"tags": {"task_id": t}, "line": t} for t in ("t1", "t2")]), ""]
+
+    subscribed = threading.Event()
+
+    class _WsMock:
+        def send(self, payload):
+            subscribed.set()
+
+        def recv(self):
+            subscribed.wait(5)
+            return frames.pop(0) if frames else ""
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=lambda url, **kw: _WsMock())
+    )
+    client = MonitorApi(_make_hps_client(), fields=["line"])
+    with client.open_session() as session:
+        subscription = session.subscribe([{"task_id": "t2"}])
+        assert list(subscription) == [("t2",)]
+
+
+# ---------------------------------------------------------------------------
+# Bulk and cached evaluator resolution
+# ---------------------------------------------------------------------------
+
+
+def _mock_jms_rms(monkeypatch, hosts, evaluators):
+    calls = []
+
+    def check_limit(key, kw):
+        # Like the API, refuse a limit on a query it would have to split
+        if "limit" in kw and len(_split_id_filter(key, kw[key])) > 1:
+            raise ClientError("splitting the query cannot be combined with 'limit'")
+
+    def get_tasks(**kw):
+        check_limit("id", kw)
+        calls.append(("jms", kw))
+        return [SimpleNamespace(id=t, host_id=hosts.get(t)) for t in kw["id"] if t in hosts]
+
+    def get_evaluators(**kw):
+        check_limit("host_id", kw)
+        calls.append(("rms", kw))
+        return [SimpleNamespace(host_id=h, name=n) for h, n in evaluators if h in kw["host_id"]]
+
+    monkeypatch.setattr(
+        "ansys.hps.client.jms.ProjectApi", lambda c, pid: SimpleNamespace(get_tasks=get_tasks)
+    )
+    monkeypatch.setattr(
+        "ansys.hps.client.rms.RmsApi", lambda c: SimpleNamespace(get_evaluators=get_evaluators)
+    )
+    return calls
+
+
+def test_resolve_evaluators_for_tasks_in_bulk_with_cache(monkeypatch):
+    calls = _mock_jms_rms(
+        monkeypatch,
+        hosts={"t1": "h1", "t2": "h1", "t3": "h2", "t4": None},
+        evaluators=[("h1", "ev-1"), ("h2", None), ("h2", "ev-2")],
+    )
+    now = [1000.0]
+    monkeypatch.setattr(monitor_api_module.time, "monotonic", lambda: now[0])
+    client = MonitorApi(_make_hps_client(), evaluator_cache_ttl=30.0)
+
+    resolved = client.resolve_evaluators_for_tasks(["t1", "t2", "t3", "t4", "t5"], "p1")
+
+    assert resolved == {"t1": "ev-1", "t2": "ev-1", "t3": "ev-2"}
+    assert [c[0] for c in calls] == ["jms", "rms"]
+    assert calls[0][1]["id"] == ["t1", "t2", "t3", "t4", "t5"]
+    assert calls[1][1]["host_id"] == ["h1", "h2"]
+
+    # Resolved tasks are cached, only the others are queried again
+    calls.clear()
+    assert client._resolve_evaluator_name_for_task("t2", "p1") == "ev-1"
+    assert calls == []
+    assert client.resolve_evaluators_for_tasks(["t1", "t5"], "p1") == {"t1": "ev-1"}
+    assert calls[0][1]["id"] == ["t5"]
+
+    # Until the cache expires
+    calls.clear()
+    now[0] += 31.0
+    assert client._resolve_evaluator_name_for_task("t1", "p1") == "ev-1"
+    assert [c[0] for c in calls] == ["jms", "rms"]
+
+
+def test_resolve_evaluators_for_many_tasks(monkeypatch):
+    task_ids = [uuid.uuid4().hex for _ in range(300)]
+    hosts = {t: f"host-{i % 150:03d}-{'x' * 32}" for i, t in enumerate(task_ids)}
+    calls = _mock_jms_rms(monkeypatch, hosts, [(h, f"ev-{h}") for h in set(hosts.values())])
+    client = MonitorApi(_make_hps_client())
+
+    resolved = client.resolve_evaluators_for_tasks(task_ids, "p1")
+
+    assert resolved == {t: f"ev-{hosts[t]}" for t in task_ids}
+    jms = [kw for name, kw in calls if name == "jms"]
+    rms = [kw for name, kw in calls if name == "rms"]
+    assert 1 < len(jms) < 10
+    assert sum(len(kw["id"]) for kw in jms) == 300
+    assert all(kw["limit"] == len(kw["id"]) for kw in jms)
+    assert 1 < len(rms) < 10
+    assert sum(len(kw["host_id"]) for kw in rms) == 150
+
+
+def test_shared_host_resource_streams_use_one_subscription(monkeypatch):
+    _mock_jms_rms(monkeypatch, hosts={"t1": "h1", "t2": "h1"}, evaluators=[("h1", "ev-1")])
+    subscribed = threading.Event()
+    connections = []
+
+    class _WsMock:
+        def __init__(self):
+            self.sent = []
+            tags = MonitorApi._host_resources_topic("ev-1")
+            self.frames = [json.dumps([{"tags": tags, "cpu": i}]) for i in range(3)]
+            self.closed = False
+
+        def send(self, payload):
+            self.sent.append(json.loads(payload))
+            subscribed.set()
+
+        def recv(self):
+            subscribed.wait(5)
+            if self.frames and not self.closed:
+                return self.frames.pop(0)
+            time.sleep(0.01)
+            if self.closed:
+                return ""
+            raise TimeoutError()
+
+        def close(self):
+            self.closed = True
+
+    def create_connection(url, **kwargs):
+        connections.append(_WsMock())
+        return connections[-1]
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=create_connection)
+    )
+    client = MonitorApi(_make_hps_client())
+
+    first = client.stream_task_host_resources("t1", "p1", max_messages=3, share=True)
+    assert next(first)["cpu"] == 0
+    second = client.stream_task_host_resources("t2", "p1", max_messages=3, share=True)
+    assert [m["cpu"] for m in second] == [0, 1, 2]
+    assert [m["cpu"] for m in first] == [1, 2]
+
+    assert len(connections) == 1
+    assert connections[0].sent[0]["topics"][0]["evaluator_name"] == "ev-1"
+    assert connections[0].closed
+    assert client.hub.upstreams == 0
@@ -0,0 +1,181 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import queue
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.monitor import MonitorApi, MonitorHub, OverflowPolicy
+
+BASE_URL = "http://localhost:1089"
+SCALING = "ansys.rep.scaling"
+
+
+class _WsMock:
+    """WebSocket whose incoming frames are pushed by the test."""
+
+    def __init__(self):
+        self.sent = []
+        self.frames = queue.Queue()
+        self.closed = False
+
+    def push(self, *messages):
+        self.frames.put(json.dumps({"messages": list(messages)}))
+
+    def send(self, payload):
+        self.sent.append(json.loads(payload))
+
+    def recv(self):
+        try:
+            frame = self.frames.get(timeout=0.05)
+        except queue.Empty:
+            raise TimeoutError() from None
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    def close(self):
+        self.closed = True
+        self.frames.put("")
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    connections = []
+
+    def create_connection(url, **kwargs):
+        connections.append(_WsMock())
+        return connections[-1]
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=create_connection)
+    )
+    return connections
+
+
+def _hub(**kwargs):
+    api = MonitorApi(SimpleNamespace(url=BASE_URL, access_token="jwt", session=None))
+    return MonitorHub(api, **kwargs)
+
+
+def _log(line, client_type=SCALING):
+    return {"tags": {"client_type": client_type}, "line": line}
+
+
+def _lines(consumer, count):
+    return [m["line"] for m in consumer.messages(max_messages=count, timeout=2)]
+
+
+def test_hub_shares_one_upstream_per_topic_set(connections):
+    with _hub() as hub:
+        ui = hub.join_service_logs(SCALING)
+        alerts = hub.join([{"client_type": SCALING}], backlog=5)
+        jms = hub.join_service_logs("ansys.rep.jms")
+
+        assert len(connections) == 2
+        assert hub.upstreams == 2
+        assert hub.consumer_count([{"client_type": SCALING}]) == 2
+        assert [c["topics"] for c in connections[0].sent] == [[{"client_type": SCALING}]]
+
+        connections[0].push(_log("a"), _log("b"))
+        connections[1].push(_log("c", "ansys.rep.jms"))
+        assert _lines(ui, 2) == ["a", "b"]
+        assert _lines(alerts, 2) == ["a", "b"]
+        assert _lines(jms, 1) == ["c"]
+
+
+def test_hub_replays_latest_messages_to_late_joiners(connections):
+    with _hub(replay=3) as hub:
+        first = hub.join_service_logs(SCALING)
+        connections[0].push(*[_log(i) for i in range(5)])
+        assert _lines(first, 5) == [0, 1, 2, 3, 4]
+
+        late = hub.join_service_logs(SCALING)
+        limited = hub.join_service_logs(SCALING, replay=1)
+        fresh = hub.join_service_logs(SCALING, replay=0)
+        connections[0].push(_log(5))
+
+        assert _lines(late, 4) == [2, 3, 4, 5]
+        assert _lines(limited, 2) == [4, 5]
+        assert _lines(fresh, 1) == [5]
+        assert len(connections) == 1
+
+
+def test_hub_closes_upstream_when_last_consumer_leaves(connections):
+    hub = _hub(maxsize=2, overflow=OverflowPolicy.DROP_OLDEST)
+    slow = hub.join_service_logs(SCALING)
+    with hub.join_service_logs(SCALING, maxsize=10) as fast:
+        connections[0].push(*[_log(i) for i in range(4)])
+        assert _lines(fast, 4) == [0, 1, 2, 3]
+    assert list(fast) == []
+    assert not connections[0].closed
+    assert hub.consumer_count([{"client_type": SCALING}]) == 1
+
+    # The slow consumer only lost messages of its own buffer
+    assert _lines(slow, 2) == [2, 3]
+    assert slow.dropped == 2
+    slow.close()
+    assert connections[0].closed
+    assert hub.upstreams == 0
+
+    # Joining again opens a new upstream
+    again = hub.join_service_logs(SCALING)
+    assert len(connections) == 2
+    again.close()
+    assert connections[1].closed
+
+
+def test_hub_ends_consumers_when_upstream_fails(connections):
+    hub = _hub()
+    consumer = hub.join_service_logs(SCALING)
+    connections[0].frames.put(ConnectionResetError("reset"))
+
+    with pytest.raises(ClientError, match="reset"):
+        list(consumer.messages(timeout=2))
+    assert hub.upstreams == 0
+
+    # A late joiner of the failed upstream opens a new one
+    again = hub.join_service_logs(SCALING)
+    assert len(connections) == 2
+    hub.close()
+    assert list(again) == []
+
+
+def test_hub_buffers_whole_messages_with_the_fields_of_the_api(connections):
+    api = MonitorApi(
+        SimpleNamespace(url=BASE_URL, access_token="jwt", session=None), fields=["line"]
+    )
+    with MonitorHub(api, maxsize=1, overflow=OverflowPolicy.COALESCE) as hub:
+        consumer = hub.join_service_logs(SCALING)
+        connections[0].push(_log("a"), _log("b"))
+        deadline = time.monotonic() + 2
+        while consumer.buffer.received < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # The full buffer coalesces messages by their tags, then they are projected
+        assert list(consumer.messages(max_messages=1, timeout=2)) == [("b",)]
+        assert consumer.buffer.dropped == 1
@@ -0,0 +1,226 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import queue
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.monitor import LogMatch, MonitorApi, MonitorSession
+
+BASE_URL = "http://localhost:1089"
+
+
+class _WsMock:
+    """WebSocket whose incoming frames are pushed by the test."""
+
+    def __init__(self):
+        self.sent = []
+        self.frames = queue.Queue()
+        self.closed = False
+
+    def push(self, *messages):
+        self.frames.put(json.dumps({"messages": list(messages)}))
+
+    def send(self, payload):
+        self.sent.append(json.loads(payload))
+
+    def recv(self):
+        try:
+            frame = self.frames.get(timeout=0.05)
+        except queue.Empty:
+            raise TimeoutError() from None
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    def close(self):
+        self.closed = True
+        self.frames.put("")
+
+
+@pytest.fixture
+def ws(monkeypatch):
+    ws = _WsMock()
+    connections = []
+
+    def create_connection(url, **kwargs):
+        connections.append(url)
+        return ws
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=create_connection)
+    )
+    ws.connections = connections
+    return ws
+
+
+def _api():
+    return MonitorApi(SimpleNamespace(url=BASE_URL, access_token="jwt", session=None))
+
+
+def _log(task_id, line):
+    return {
+        "tags": {"task_id": task_id, "client_type": "ansys.rep.evaluator.file_tail"},
+        "line": line,
+    }
+
+
+def test_session_routes_messages_of_many_subscriptions_over_one_connection(ws):
+    with _api().open_session() as session:
+        t1 = session.subscribe_task_logs("t1", backlog=5)
+        t2 = session.subscribe_task_logs("t2")
+        tree = session.subscribe_task_process_tree("t1")
+
+        ws.push(_log("t1", "a"), _log("t2", "b"), _log("t3", "ignored"), _log("t1", "c"))
+        ws.push(
+            {
+                "task_id": "t1",
+                "client_type": "ansys.rep.evaluator",
+                "type": "metric",
+                "statistic": "process_tree",
+            }
+        )
+
+        assert [m["line"] for m in t1.messages(max_messages=2, timeout=2)] == ["a", "c"]
+        assert [m["line"] for m in t2.messages(max_messages=1, timeout=2)] == ["b"]
+        assert next(iter(tree))["statistic"] == "process_tree"
+
+    assert ws.connections == ["ws://localhost:1089/monitor/ws/topics"]
+    assert [c["topics"][0]["task_id"] for c in ws.sent] == ["t1", "t2", "t1"]
+    assert ws.sent[0]["backlog"] == {"limit": 5}
+    assert all(c["token"] == "jwt" for c in ws.sent)
+    assert ws.closed
+    # Iteration ends once the session is closed
+    assert list(t1) == []
+
+
+def test_session_subscriptions_can_share_a_queue_and_be_closed(ws):
+    shared = queue.Queue()
+    with MonitorSession(_api()) as session:
+        t1 = session.subscribe_task_logs("t1", message_queue=shared)
+        session.subscribe_task_logs("t2", message_queue=shared)
+        t1.close()
+        assert len(session.subscriptions) == 1
+        assert shared.get(timeout=2) is None
+
+        ws.push(_log("t1", "a"), _log("t2", "b"))
+        assert shared.get(timeout=2)["line"] == "b"
+
+
+def test_session_reports_connection_failures(ws):
+    session = _api().open_session()
+    subscription = session.subscribe_task_logs("t1")
+    ws.frames.put(ConnectionResetError("reset by peer"))
+
+    with pytest.raises(ClientError, match="reset by peer"):
+        list(subscription.messages(timeout=2))
+    assert session.closed
+    with pytest.raises(ClientError, match="closed"):
+        session.subscribe_task_logs("t2")
+
+
+def _push_when_subscribed(ws, count, *frames):
+    """Push *frames* once *count* subscribe commands were sent."""
+    send = ws.send
+
+    def send_and_push(payload):
+        send(payload)
+        if len(ws.sent) == count:
+            for messages in frames:
+                ws.push(*messages)
+
+    ws.send = send_and_push
+
+
+def _file_log(task_id, text, file_path="out.txt", timestamp=None):
+    message = _log(task_id, None)
+    message["tags"].update(file_path=file_path, timestamp=timestamp)
+    message["message"] = text
+    return message
+
+
+def test_search_task_logs_stops_each_task_at_first_match(ws):
+    _push_when_subscribed(
+        ws,
+        3,
+        [_file_log("t1", "starting\nsolver boom"), _file_log("t2", "fine")],
+        [_file_log("t1", "boom again"), _file_log("t3", "boom", file_path="err.txt")],
+    )
+
+    start = time.monotonic()
+    matches = _api().search_task_logs(["t1", "t2", "t3"], "boom", timeout=0.3)
+
+    assert matches == {
+        "t1": [LogMatch("t1", "out.txt", 1, 7, 11)],
+        "t2": [],
+        "t3": [LogMatch("t3", "err.txt", 0, 0, 4)],
+    }
+    assert time.monotonic() - start < 2
+    assert [c["backlog"] for c in ws.sent] == [{"limit": 1000}] * 3
+    assert ws.closed
+
+
+def test_search_task_logs_with_regex_since_and_all_matches(ws):
+    _push_when_subscribed(
+        ws,
+        1,
+        [
+            _file_log("t1", "Error: old", timestamp=100.0),
+            _file_log("t1", "ok\nFATAL: disk", timestamp=200.0),
+            _file_log("t1", "error: late", file_path="other.txt", timestamp=300.0),
+        ],
+    )
+    matches = _api().search_task_logs(
+        ["t1"],
+        r"error|fatal",
+        regex=True,
+        ignore_case=True,
+        since=datetime.fromtimestamp(150.0, tz=timezone.utc),
+        max_matches=None,
+        timeout=0.3,
+    )
+
+    # Lines are counted per file from the oldest received one, including skipped ones
+    assert matches["t1"] == [
+        LogMatch("t1", "out.txt", 2, 0, 5, 200.0),
+        LogMatch("t1", "other.txt", 0, 0, 5, 300.0),
+    ]
+    assert _api().search_task_logs(["t1"], re.compile("x"), max_matches=0) == {"t1": []}
+
+
+def test_search_task_logs_ignores_the_fields_of_the_api(ws):
+    _push_when_subscribed(ws, 1, [_file_log("t1", "boom")])
+    api = MonitorApi(
+        SimpleNamespace(url=BASE_URL, access_token="jwt", session=None), fields=["line"]
+    )
+
+    assert api.search_task_logs(["t1"], "boom", timeout=0.3) == {
+        "t1": [LogMatch("t1", "out.txt", 0, 0, 4)]
+    }
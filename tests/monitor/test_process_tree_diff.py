@@ -0,0 +1,129 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import sys
+from types import SimpleNamespace
+
+from ansys.hps.client.monitor import MonitorApi, ProcessTreeDiff, ProcessTreeDiffer
+
+
+def _node(pid, cpu, children=(), **attributes):
+    return {"pid": pid, "cpu_percentage": str(cpu), "children": list(children), **attributes}
+
+
+def _snapshot(root, task_id="t1", timestamp=100.0):
+    tags = {"task_id": task_id, "statistic": "process_tree", "timestamp": timestamp}
+    return {"tags": tags, "message": json.dumps(root)}
+
+
+def test_differ_reports_spawned_exited_and_changed_processes():
+    differ = ProcessTreeDiffer(tolerance=1.0)
+
+    first = differ.diff(_snapshot(_node(1, 5.0, [_node(2, 50.0), _node(3, 40.0)])))
+    assert first.full
+    assert first.spawned == {
+        1: {"pid": 1, "cpu_percentage": "5.0", "ppid": None},
+        2: {"pid": 2, "cpu_percentage": "50.0", "ppid": 1},
+        3: {"pid": 3, "cpu_percentage": "40.0", "ppid": 1},
+    }
+
+    # Rank 3 exits, rank 4 starts, rank 2 changes beyond the tolerance only
+    diff = differ.diff(
+        _snapshot(_node(1, 5.5, [_node(2, 60.0), _node(4, 10.0, name="mpi")]), timestamp=101.0)
+    )
+    assert diff == ProcessTreeDiff(
+        task_id="t1",
+        timestamp=101.0,
+        spawned={4: {"pid": 4, "cpu_percentage": "10.0", "name": "mpi", "ppid": 1}},
+        exited=[3],
+        changed={2: {"cpu_percentage": "60.0"}},
+    )
+
+    # Small changes accumulate until they exceed the tolerance
+    assert not differ.diff(_snapshot(_node(1, 6.0, [_node(2, 60.0), _node(4, 10.0, name="mpi")])))
+    diff = differ.diff(_snapshot(_node(1, 6.6, [_node(2, 60.0), _node(4, 10.0)])))
+    assert diff.changed == {1: {"cpu_percentage": "6.6"}, 4: {"name": None}}
+    assert differ.processes("t1")[4] == {"pid": 4, "cpu_percentage": "10.0", "ppid": 1}
+    assert differ.diff({"tags": {"task_id": "t1"}, "message": "not a tree"}) is None
+
+
+def test_differ_resyncs_and_tracks_tasks_separately():
+    differ = ProcessTreeDiffer(resync_every=3)
+    tree = _node(1, 1.0, [_node(2, 2.0)])
+    messages = [_snapshot(tree, task_id=t) for t in ("t1", "t2", "t1", "t1", "t1", "t2")]
+
+    diffs = list(differ.diffs(messages, include_empty=True))
+    assert [(d.task_id, d.full) for d in diffs] == [
+        ("t1", True),
+        ("t2", True),
+        ("t1", False),
+        ("t1", False),
+        ("t1", True),
+        ("t2", False),
+    ]
+    assert list(diffs[4].spawned) == [1, 2]
+    assert not diffs[2]
+    # Without resync, only the first snapshot of each task has changes
+    assert [d.task_id for d in ProcessTreeDiffer().diffs(messages)] == ["t1", "t2"]
+
+    differ.reset("t2")
+    assert differ.diff(messages[1]).full
+    assert differ.processes("t3") == {}
+
+
+def test_stream_task_process_tree_diffs(monkeypatch):
+    trees = [
+        _node(1, 1.0),
+        _node(1, 1.0),
+        _node(1, 1.0, [_node(2, 90.0)]),
+        _node(1, 2.0, [_node(2, 90.0)]),
+    ]
+    frames = [json.dumps(_snapshot(t, timestamp=100.0 + i)) for i, t in enumerate(trees)] + [""]
+
+    class _WsMock:
+        def __init__(self):
+            self.sent = []
+
+        def send(self, payload):
+            self.sent.append(json.loads(payload))
+
+        def recv(self):
+            return frames.pop(0)
+
+        def close(self):
+            pass
+
+    ws = _WsMock()
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=lambda url, **kw: ws)
+    )
+    client = MonitorApi(SimpleNamespace(url="http://localhost:1089", access_token=None))
+
+    diffs = list(client.stream_task_process_tree_diffs("t1", resync_every=3))
+
+    assert ws.sent[0]["topics"][0]["statistic"] == "process_tree"
+    assert [(d.timestamp, d.full, list(d.spawned), d.changed) for d in diffs] == [
+        (100.0, True, [1], {}),
+        (102.0, False, [2], {}),
+        (103.0, True, [1, 2], {}),
+    ]
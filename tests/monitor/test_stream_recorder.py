@@ -0,0 +1,140 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.hps.client import ClientError
+from ansys.hps.client.monitor import MonitorApi, StreamRecorder, StreamReplayer
+
+BASE_URL = "http://localhost:1089"
+
+
+def _log(task_id, line):
+    return {
+        "tags": {"task_id": task_id, "client_type": "ansys.rep.evaluator.file_tail"},
+        "line": line,
+    }
+
+
+def _record(directory, frames, **kwargs):
+    with StreamRecorder(str(directory), **kwargs) as recorder:
+        for t, messages in frames:
+            recorder.record(json.dumps({"messages": messages}), timestamp=t)
+    return recorder
+
+
+def test_recorder_captures_raw_frames_of_streams(tmp_path, monkeypatch):
+    frames = [json.dumps({"messages": [_log("t1", i)]}) for i in range(3)] + [""]
+
+    class _WsMock:
+        def send(self, payload):
+            pass
+
+        def recv(self):
+            return frames.pop(0)
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(
+        sys.modules, "websocket", SimpleNamespace(create_connection=lambda url, **kw: _WsMock())
+    )
+    with StreamRecorder(str(tmp_path)) as recorder:
+        api = MonitorApi(SimpleNamespace(url=BASE_URL, access_token=None), recorder=recorder)
+        assert len(list(api.stream_task_logs("t1"))) == 3
+    assert recorder.frames == 3
+
+    replayed = StreamReplayer(str(tmp_path), speed=None).frames()
+    assert [json.loads(frame)["messages"][0]["line"] for _, frame in replayed] == [0, 1, 2]
+
+
+def test_recorder_rotates_indexes_and_prunes_segments(tmp_path):
+    frames = [(1000.0 + i, [_log("t1", "x" * 50)]) for i in range(10)]
+    recorder = _record(tmp_path, frames, segment_bytes=200, max_segments=3)
+
+    segments = recorder.segments
+    assert [os.path.basename(s) for s in segments] == [
+        "monitor-000003.ndjson.gz",
+        "monitor-000004.ndjson.gz",
+        "monitor-000005.ndjson.gz",
+    ]
+    with open(tmp_path / "index.ndjson") as f:
+        index = [json.loads(line) for line in f]
+    # Entries of the pruned segments are removed from the index
+    assert [entry["segment"] for entry in index] == [os.path.basename(s) for s in segments]
+    assert [entry["frames"] for entry in index] == [2] * 3
+    assert index[-1] == {
+        "segment": "monitor-000005.ndjson.gz",
+        "start": 1008.0,
+        "end": 1009.0,
+        "frames": 2,
+    }
+
+    # The time range only reads the overlapping segments
+    replayer = StreamReplayer(str(tmp_path), speed=None, start=1007.5)
+    assert replayer.segments == segments[2:]
+    assert [t for t, _ in replayer.frames()] == [1008.0, 1009.0]
+
+    # New segments of a reopened recording follow the existing ones
+    recorder = _record(tmp_path, [(2000.0, [_log("t1", "y")])], compress=False)
+    assert os.path.basename(recorder.segments[-1]) == "monitor-000006.ndjson"
+
+
+def test_replayer_serves_monitor_api_streams_and_sessions(tmp_path):
+    _record(
+        tmp_path,
+        [
+            (1000.0, [_log("t1", "a"), _log("t2", "b")]),
+            (1000.1, [_log("t2", "c")]),
+            (1000.2, [_log("t1", "d")]),
+        ],
+    )
+    api = StreamReplayer(str(tmp_path), speed=None).monitor_api()
+
+    assert [m["line"] for m in api.stream_task_logs("t1")] == ["a", "d"]
+    assert [m["line"] for m in api.stream_task_logs("t2", max_messages=1)] == ["b"]
+    assert api.list_topics() == {}
+
+    with api.open_session() as session:
+        subscription = session.subscribe_task_logs("t2")
+        assert [m["line"] for m in subscription] == ["b", "c"]
+
+    with pytest.raises(ClientError, match="requires an HPS client"):
+        next(api.stream_task_host_resources("t1", "p1"))
+
+
+def test_replayer_paces_frames(tmp_path):
+    _record(tmp_path, [(1000.0, [_log("t1", "a")]), (1010.0, [_log("t1", "b")])])
+    api = StreamReplayer(str(tmp_path), speed=50.0).monitor_api()
+
+    start = time.monotonic()
+    assert len(list(api.stream_task_logs("t1"))) == 2
+    assert time.monotonic() - start >= 0.2
+
+    with pytest.raises(ClientError, match="must be positive"):
+        StreamReplayer(str(tmp_path), speed=0)